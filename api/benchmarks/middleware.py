@@ -0,0 +1,154 @@
+"""Requests per second benchmark of the middleware stack on the `/event/` routes.
+
+It compares the previous stack (`BaseHTTPMiddleware` error handler and a `HTTPBasic`
+dependency which compares dicts) with the current pure ASGI stack. The event is
+inserted in a transaction which is rolled back at the end, and the sessions of both
+apps are bound to its connection, so their queries take turns on it. The database
+of `.env.test` must be reachable.
+
+Usage:
+    python -m benchmarks.middleware --requests 2000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from base64 import b64encode
+from collections.abc import AsyncGenerator
+from datetime import date
+from datetime import time as time_of_day
+
+from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.api import event_router
+from src.api.deps import get_read_session, get_session
+from src.app import app as current_app
+from src.core import UnauthorizedException, configuration
+from src.core.exceptions import HttpException
+from src.database import database_session_manager
+from src.models import Event
+
+BENCHMARK_USER_ID: str = "benchmark-user"
+
+security: HTTPBasic = HTTPBasic()
+security_dependency = Depends(security)
+
+
+class LegacyErrorHandlerMiddleware(BaseHTTPMiddleware):
+    """Previous error handler middleware."""
+
+    async def dispatch(self, request, call_next):
+        """Dispatch the request."""
+        try:
+            return await call_next(request)
+        except Exception as e:
+            status_code: int = e.status if isinstance(e, HttpException) else 500
+            return ORJSONResponse(status_code=status_code, content={"detail": str(e)})
+
+
+def legacy_verify_credentials(
+    credentials: HTTPBasicCredentials = security_dependency,
+):
+    """Previous credentials check."""
+    correct_credentials: dict[str, str] = {
+        "username": configuration.AUTH.USER,
+        "password": configuration.AUTH.PASS,
+    }
+    if dict(credentials) != correct_credentials:
+        raise UnauthorizedException()
+
+
+def create_legacy_app() -> FastAPI:
+    """Create the app with the previous middleware stack."""
+    app: FastAPI = FastAPI(
+        middleware=[Middleware(LegacyErrorHandlerMiddleware)],
+        dependencies=[Depends(legacy_verify_credentials)],
+    )
+    app.include_router(event_router)
+    return app
+
+
+async def measure(app: FastAPI, url: str, requests: int, concurrency: int) -> float:
+    """Send the requests to the app and return the requests per second."""
+    token: str = f"{configuration.AUTH.USER}:{configuration.AUTH.PASS}"
+    headers: dict[str, str] = {
+        "Authorization": f"Basic {b64encode(token.encode()).decode()}"
+    }
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for index in range(requests):
+        queue.put_nowait(index)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench", headers=headers
+    ) as client:
+
+        async def worker() -> None:
+            while not queue.empty():
+                queue.get_nowait()
+                response = await client.get(url)
+                response.raise_for_status()
+
+        await client.get(url)
+        started: float = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - started)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    """Run the benchmark."""
+    logging.disable(logging.CRITICAL)
+    apps: dict[str, FastAPI] = {"before": create_legacy_app(), "after": current_app}
+
+    async with database_session_manager.engine.connect() as connection:
+        transaction = await connection.begin()
+        await connection.execute(
+            insert(Event).values(
+                userId=BENCHMARK_USER_ID,
+                date=date(2025, 1, 1),
+                time=time_of_day(10, 0),
+                description="benchmark",
+            )
+        )
+        sessionmaker: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        lock: asyncio.Lock = asyncio.Lock()
+
+        async def get_seeded_session() -> AsyncGenerator[AsyncSession, None]:
+            async with lock, sessionmaker() as session:
+                yield session
+
+        for app in apps.values():
+            app.dependency_overrides[get_session] = get_seeded_session
+            app.dependency_overrides[get_read_session] = get_seeded_session
+
+        try:
+            for url in (
+                f"/event/?userIds={BENCHMARK_USER_ID}",
+                f"/event/grouped?by=date&userIds={BENCHMARK_USER_ID}",
+            ):
+                for name, app in apps.items():
+                    rps: float = await measure(app, url, requests, concurrency)
+                    print(f"{name:>6} {url:<52} {rps:>10.1f} req/s")
+        finally:
+            for app in apps.values():
+                app.dependency_overrides.clear()
+            await transaction.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
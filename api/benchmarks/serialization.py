@@ -0,0 +1,91 @@
+"""Micro-benchmark of the event listing serialization paths.
+
+It compares the previous path (ORM instances, `jsonable_encoder` and
+`ORJSONResponse`) with the column projected path of `EventService.get_events_json`.
+The rows are inserted in a transaction which is rolled back at the end. The
+database of `.env.test` must be reachable.
+
+Usage:
+    python -m benchmarks.serialization --sizes 1000 10000 100000
+"""
+
+import argparse
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import date, time
+from time import perf_counter
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database import database_session_manager
+from src.models import Event
+from src.service.event_service import EventService
+
+BENCHMARK_USER_ID: str = "benchmark-serialization-user"
+
+
+async def measure(func: Callable[[], Awaitable[bytes]], repeat: int) -> float:
+    """Run the function and return the best duration in milliseconds."""
+    durations: list[float] = []
+    for _ in range(repeat):
+        started: float = perf_counter()
+        await func()
+        durations.append((perf_counter() - started) * 1000)
+    return min(durations)
+
+
+async def main(sizes: list[int], repeat: int) -> None:
+    """Run the benchmark."""
+    logging.disable(logging.CRITICAL)
+    service: EventService = EventService()
+    sessionmaker: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        bind=database_session_manager.engine, expire_on_commit=False
+    )
+
+    for size in sizes:
+        async with sessionmaker() as session:
+            await session.execute(
+                insert(Event),
+                [
+                    {
+                        "userId": BENCHMARK_USER_ID,
+                        "date": date(2000, 1, 1),
+                        "time": time(index % 24, index % 60),
+                        "description": f"benchmark event {index}",
+                    }
+                    for index in range(size)
+                ],
+            )
+
+            async def orm_path() -> bytes:
+                session.expunge_all()
+                events: list[Event] = await service.get_events(
+                    session=session, userIds=[BENCHMARK_USER_ID]
+                )
+                return ORJSONResponse(content=jsonable_encoder(events)).body
+
+            async def projected_path() -> bytes:
+                return await service.get_events_json(
+                    session=session, userIds=[BENCHMARK_USER_ID]
+                )
+
+            orm: float = await measure(orm_path, repeat)
+            projected: float = await measure(projected_path, repeat)
+            print(
+                f"{size:>7} rows  orm: {orm:>9.1f} ms  projected: {projected:>9.1f} ms"
+                f"  speedup: {orm / projected:>5.1f}x"
+            )
+
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat))
@@ -10,5 +10,6 @@ if [ "$DB__HOST" != "localhost" ] && [ "$DB__HOST" != "127.0.0.1" ]; then
     exit 1
 fi
 
+poetry run python -m src.database.migrations
 poetry run python -m coverage run -m pytest -lv ${ARGS}
 poetry run python -m coverage report -m
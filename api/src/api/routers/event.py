@@ -1,23 +1,66 @@
 """Event router."""
 
+from collections.abc import AsyncGenerator
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, Query
+import orjson
+from fastapi import APIRouter, Body, Depends, Header, Query
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import ORJSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 
-from src.models import Event
-from src.schemas import CreateEventSchema
+from src.database import database_session_manager
+from src.models import Event, EventChange
+from src.schemas import (
+    BulkCreateEventResult,
+    BulkCreateEventSchema,
+    ChangeCursor,
+    CreateEventSchema,
+    EventCountSchema,
+    EventCursor,
+    EventGroupBy,
+    SearchEventsSchema,
+)
 from src.service import EventService, ServiceFactory
 
-from ..deps import SessionDep
+from ..deps import ReadSessionDep, SessionDep
 
 event_router: APIRouter = APIRouter(prefix="/event", tags=["event"])
 
 event_service: EventService = ServiceFactory.create_event_service()
 
+NEXT_CURSOR_HEADER: str = "X-Next-Cursor"
+
+IfNoneMatchHeader = Annotated[str | None, Header(alias="If-None-Match")]
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """Check whether the `If-None-Match` header matches the given entity tag."""
+    if not if_none_match or not etag:
+        return False
+
+    tags: set[str] = {
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    }
+    return "*" in tags or f'"{etag}"' in tags
+
+
+def conditional_json_response(content: bytes | None, etag: str | None) -> Response:
+    """Create a JSON response or a `304` response if the content is not given."""
+    headers: dict[str, str] = (
+        {"ETag": f'"{etag}"', "Cache-Control": "no-cache"} if etag else {}
+    )
+    if content is None:
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=content,
+        status_code=200,
+        media_type="application/json",
+        headers=headers,
+    )
+
 
 @event_router.post("/", summary="Get events.", status_code=201)
 async def create_event(
@@ -25,15 +68,61 @@ async def create_event(
     session: SessionDep,
 ):
     """Create a new event by using the given input."""
-    await event_service.create(
+    event_id: int = await event_service.create(
         userId=create_model.userId,
         time=create_model.time,
         date=create_model.date,
         description=create_model.description,
         session=session,
+        rrule=create_model.rrule,
+    )
+
+    return ORJSONResponse(
+        content=jsonable_encoder({"message": "ok", "id": event_id}), status_code=201
+    )
+
+
+@event_router.post("/bulk", summary="Create events in bulk.", status_code=201)
+async def bulk_create_events(
+    bulk_model: Annotated[BulkCreateEventSchema, Body(...)],
+    session: SessionDep,
+):
+    """Create many events in one transaction and report the result of each item.
+
+    Valid items are inserted with multi-row insert statements. The response status
+    is `201` if every item is created, otherwise `207` with the errors of the
+    invalid items.
+    """
+    results: list[BulkCreateEventResult] = []
+    valid_events: list[CreateEventSchema] = []
+    valid_results: list[BulkCreateEventResult] = []
+
+    for index, raw_event in enumerate(bulk_model.events):
+        try:
+            valid_events.append(CreateEventSchema.model_validate(raw_event))
+        except ValidationError as e:
+            results.append(
+                BulkCreateEventResult(
+                    index=index,
+                    status=422,
+                    detail=e.errors(include_url=False, include_context=False),
+                )
+            )
+            continue
+        result = BulkCreateEventResult(index=index, status=201)
+        valid_results.append(result)
+        results.append(result)
+
+    ids: list[int] = await event_service.bulk_create(
+        events=valid_events, session=session
     )
+    for result, event_id in zip(valid_results, ids, strict=True):
+        result.id = event_id
 
-    return ORJSONResponse(content=jsonable_encoder({"message": "ok"}), status_code=201)
+    return ORJSONResponse(
+        content=jsonable_encoder({"results": results}),
+        status_code=201 if len(valid_results) == len(results) else 207,
+    )
 
 
 class GetEventsDependencies(BaseModel):
@@ -43,23 +132,266 @@ class GetEventsDependencies(BaseModel):
         Query(default=None, description="List of user IDs to filter events by")
     )
 
-    start_date: date|None = Field(Query(default=None, description="Start date to filter."))
+    start_date: date | None = Field(
+        Query(default=None, description="Start date to filter.")
+    )
 
-    end_date: date|None = Field(Query(default=None, description="End date to filter."))
+    end_date: date | None = Field(
+        Query(default=None, description="End date to filter.")
+    )
+
+
+class PaginationDependencies(BaseModel):
+    """Keyset pagination dependencies."""
+
+    limit: int | None = Field(
+        Query(
+            default=None,
+            ge=1,
+            le=1000,
+            description="Page size. Enables the cursor based pagination.",
+        )
+    )
+
+    cursor: str | None = Field(
+        Query(
+            default=None,
+            description=f"Cursor of the next page from the `{NEXT_CURSOR_HEADER}` "
+            "header.",
+        )
+    )
 
 
 @event_router.get(
     "/", summary="Get events.", status_code=200, response_model=list[Event]
 )
 async def get_events(
-    session: SessionDep, params: Annotated[GetEventsDependencies, Depends()]
+    session: ReadSessionDep,
+    params: Annotated[GetEventsDependencies, Depends()],
+    pagination: Annotated[PaginationDependencies, Depends()],
+    if_none_match: IfNoneMatchHeader = None,
 ):
-    """Get events by filtering the given params."""
-    result = await event_service.get_events(
+    """Get events by filtering the given params.
+
+    The listing is returned with an `ETag`, and `304 Not Modified` is returned if
+    the `If-None-Match` header matches it.
+
+    If `limit` is given, the events are ordered by `(date, time, id)` and returned
+    page by page. The cursor of the next page is returned in the `X-Next-Cursor`
+    header when there may be more events.
+    """
+    if pagination.limit is None:
+        etag: str | None = await event_service.get_events_etag(
+            userIds=params.userIds,
+            start_date=params.start_date,
+            end_date=params.end_date,
+            session=session,
+        )
+        if etag_matches(if_none_match, etag):
+            return conditional_json_response(None, etag)
+
+        result: bytes = await event_service.get_events_json(
+            session=session,
+            userIds=params.userIds,
+            start_date=params.start_date,
+            end_date=params.end_date,
+            etag=etag,
+        )
+
+        return conditional_json_response(result, etag)
+
+    page: list[Event] = await event_service.get_events_page(
         session=session,
+        limit=pagination.limit,
         userIds=params.userIds,
         start_date=params.start_date,
         end_date=params.end_date,
+        after=EventCursor.decode(pagination.cursor) if pagination.cursor else None,
     )
 
-    return ORJSONResponse(content=jsonable_encoder(result), status_code=200)
+    headers: dict[str, str] = {}
+    if len(page) == pagination.limit:
+        last: Event = page[-1]
+        headers[NEXT_CURSOR_HEADER] = EventCursor(
+            date=last.date, time=last.time, id=last.id
+        ).encode()
+
+    return ORJSONResponse(
+        content=jsonable_encoder(page), status_code=200, headers=headers
+    )
+
+
+@event_router.post(
+    "/search",
+    summary="Search events of many users.",
+    status_code=200,
+    response_model=list[Event],
+)
+async def search_events(
+    search_model: Annotated[SearchEventsSchema, Body(...)],
+    session: ReadSessionDep,
+):
+    """Get events of the users and the date range in the body.
+
+    It is the alternative of the listing for large sets of users which do not fit
+    into the query string. Events are ordered by `(date, time, id)`.
+    """
+    result: bytes = await event_service.search_events_json(
+        session=session,
+        userIds=search_model.userIds,
+        start_date=search_model.start_date,
+        end_date=search_model.end_date,
+    )
+
+    return Response(content=result, status_code=200, media_type="application/json")
+
+
+@event_router.get(
+    "/grouped",
+    summary="Get events grouped by user or date.",
+    status_code=200,
+    response_model=dict[str, list[Event]],
+)
+async def get_grouped_events(
+    session: ReadSessionDep,
+    params: Annotated[GetEventsDependencies, Depends()],
+    by: Annotated[
+        EventGroupBy, Query(description="The field to group events by.")
+    ] = EventGroupBy.USER,
+    after_id: Annotated[
+        int | None,
+        Query(ge=0, description="Only events whose ids are greater than it."),
+    ] = None,
+    if_none_match: IfNoneMatchHeader = None,
+):
+    """Get events grouped by the given field.
+
+    Grouping and ordering are done by the database. Events of each group are
+    ordered by `(date, time, id)`. An empty object is returned if there is no event.
+    Conditional requests are handled in the same way as the plain listing.
+    """
+    etag: str | None = await event_service.get_events_etag(
+        userIds=params.userIds,
+        start_date=params.start_date,
+        end_date=params.end_date,
+        group_by=by,
+        after_id=after_id,
+        session=session,
+    )
+    if etag_matches(if_none_match, etag):
+        return conditional_json_response(None, etag)
+
+    result: bytes = await event_service.get_grouped_events(
+        session=session,
+        group_by=by,
+        userIds=params.userIds,
+        start_date=params.start_date,
+        end_date=params.end_date,
+        after_id=after_id,
+        etag=etag,
+    )
+
+    return conditional_json_response(result, etag)
+
+
+@event_router.get(
+    "/summary",
+    summary="Get the number of events of each date.",
+    status_code=200,
+    response_model=list[EventCountSchema],
+)
+async def get_event_counts(
+    session: ReadSessionDep,
+    params: Annotated[GetEventsDependencies, Depends()],
+):
+    """Get the number of events of each date by filtering the given params.
+
+    Dates are ordered, and the dates without events are not included. An empty
+    array is returned if there is no event.
+    """
+    result: bytes = await event_service.get_event_counts_json(
+        session=session,
+        userIds=params.userIds,
+        start_date=params.start_date,
+        end_date=params.end_date,
+    )
+
+    return Response(content=result, status_code=200, media_type="application/json")
+
+
+@event_router.get(
+    "/changes",
+    summary="Get the changes of events after a cursor.",
+    status_code=200,
+    response_model=list[EventChange],
+)
+async def get_event_changes(
+    session: ReadSessionDep,
+    userIds: Annotated[
+        list[str] | None,
+        Query(description="List of user IDs to filter changes by"),
+    ] = None,
+    since: Annotated[
+        str | None,
+        Query(
+            description=f"Cursor from the `{NEXT_CURSOR_HEADER}` header of the "
+            "previous response. Changes are returned from the start if it is empty."
+        ),
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=1000, description="Page size.")] = 100,
+):
+    """Get the inserts, updates and deletions of events after the cursor.
+
+    `data` of a change is the event after the change, and it is empty for the
+    deletions. The cursor of the last change is returned in the `X-Next-Cursor`
+    header, or the given cursor if there is no new change, so a client can keep
+    a mirror up to date by polling with it. A full page means that more changes
+    can be fetched immediately.
+    """
+    cursor: ChangeCursor | None = ChangeCursor.decode(since) if since else None
+    changes: list[EventChange] = await event_service.get_changes(
+        session=session, limit=limit, userIds=userIds, since=cursor
+    )
+
+    if changes:
+        cursor = ChangeCursor(txid=changes[-1].txid, id=changes[-1].id)
+    headers: dict[str, str] = {NEXT_CURSOR_HEADER: cursor.encode()} if cursor else {}
+
+    return ORJSONResponse(
+        content=jsonable_encoder(changes), status_code=200, headers=headers
+    )
+
+
+@event_router.get(
+    "/stream",
+    summary="Stream events as NDJSON.",
+    status_code=200,
+    response_class=StreamingResponse,
+)
+async def stream_events(
+    params: Annotated[GetEventsDependencies, Depends()],
+    cursor: Annotated[
+        str | None, Query(description="Cursor to resume the stream after.")
+    ] = None,
+):
+    """Stream events which are ordered by `(date, time, id)` line by line.
+
+    The stream uses its own database session since the response outlives the
+    request scoped dependencies.
+    """
+    after: EventCursor | None = EventCursor.decode(cursor) if cursor else None
+
+    async def generate() -> AsyncGenerator[bytes, None]:
+        async with database_session_manager.get_read_session(
+            transactional=True
+        ) as session:
+            async for event in event_service.stream_events(
+                session=session,
+                userIds=params.userIds,
+                start_date=params.start_date,
+                end_date=params.end_date,
+                after=after,
+            ):
+                yield orjson.dumps(event.model_dump()) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
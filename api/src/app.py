@@ -1,33 +1,66 @@
 """Main application file."""
 
-from fastapi import Depends, FastAPI
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from sqlalchemy import make_url
 from starlette.middleware import Middleware
 
 from src.api import event_router
-from src.core import UnauthorizedException, configuration
-from src.middleware import GenericErrorHandlerMiddleware
+from src.core import configuration
+from src.core.exceptions import HttpException
+from src.database import EVENT_CHANGES_CHANNEL, NotificationListener
+from src.middleware import (
+    BasicAuthMiddleware,
+    ContentNegotiationMiddleware,
+    GenericErrorHandlerMiddleware,
+    http_exception_handler,
+)
+from src.service import ServiceFactory
+
+PUBLIC_PATHS: frozenset[str] = frozenset(
+    {"/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json"}
+)
 
-security: HTTPBasic = HTTPBasic()
-security_dependency = Depends(security)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Listen to the event changes while the application is running."""
+    if not configuration.CACHE.LISTEN_CHANGES:
+        yield
+        return
 
-def verify_credentials(credentials: HTTPBasicCredentials = security_dependency):
-    """Verify the given credentials."""
-    correct_credentials: dict[str, str] = {
-        "username": configuration.AUTH.USER,
-        "password": configuration.AUTH.PASS,
-    }
-    if dict(credentials) != correct_credentials:
-        raise UnauthorizedException()
+    listener = NotificationListener(
+        url=make_url(str(configuration.DB.psql_url))
+        .set(drivername="postgresql")
+        .render_as_string(hide_password=False),
+        channel=EVENT_CHANGES_CHANNEL,
+        handler=ServiceFactory.create_event_service().handle_change,
+    )
+    listener.start()
+    try:
+        yield
+    finally:
+        await listener.stop()
 
 
 app: FastAPI = FastAPI(
     title="Calendar Bot API",
     description="Calendar Bot API.",
     version="0.0.1",
-    middleware=[Middleware(GenericErrorHandlerMiddleware)],
-    dependencies=[Depends(verify_credentials)],
+    lifespan=lifespan,
+    middleware=[
+        Middleware(
+            BasicAuthMiddleware,
+            username=configuration.AUTH.USER,
+            password=configuration.AUTH.PASS,
+            public_paths=PUBLIC_PATHS,
+        ),
+        Middleware(ContentNegotiationMiddleware),
+        Middleware(GenericErrorHandlerMiddleware),
+    ],
+    exception_handlers={HttpException: http_exception_handler},
 )
 
 app.include_router(event_router)
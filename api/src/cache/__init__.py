@@ -0,0 +1,7 @@
+"""Cache module."""
+
+from .base_backend import BaseCacheBackend
+from .memory_backend import MemoryCacheBackend
+from .redis_backend import RedisCacheBackend
+
+__all__ = ["BaseCacheBackend", "MemoryCacheBackend", "RedisCacheBackend"]
@@ -0,0 +1,45 @@
+"""Base class for cache backends."""
+
+from abc import ABC, abstractmethod
+
+
+class BaseCacheBackend(ABC):
+    """Base class for cache backends.
+
+    Entries are invalidated by versions instead of deleting them. The callers add
+    the versions of the entities that an entry depends on to its key, so bumping a
+    version makes every dependent entry unreachable. The stale entries are evicted
+    by the LRU policy or the TTL of the backend.
+
+    A version which is not known yet starts from a random base, so a restarted
+    backend or an evicted version does not repeat the versions, and so the entity
+    tags, which were given before.
+
+    The WAL positions of the latest writes of the entities are also kept, so the
+    entries which are read from a replica that has not replayed them yet are not
+    stored under the new versions.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Get the value of the given key if it exists and is not expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes) -> None:
+        """Set the value of the given key."""
+
+    @abstractmethod
+    async def get_versions(self, names: list[str]) -> list[int]:
+        """Get the current versions of the given names."""
+
+    @abstractmethod
+    async def bump_versions(self, names: list[str]) -> None:
+        """Increase the versions of the given names."""
+
+    @abstractmethod
+    async def get_positions(self, names: list[str]) -> list[int]:
+        """Get the WAL positions of the latest writes of the given names."""
+
+    @abstractmethod
+    async def advance_positions(self, names: list[str], position: int) -> None:
+        """Raise the WAL positions of the given names to the given position."""
@@ -0,0 +1,69 @@
+"""In-memory cache backend."""
+
+from collections import OrderedDict
+from secrets import randbits
+from time import monotonic
+
+from .base_backend import BaseCacheBackend
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """Bounded LRU cache with TTL which lives in the process memory.
+
+    The versions are kept per process, so the backend is only suitable for a single
+    worker deployment.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """Initialize the cache backend.
+
+        Arguments:
+            max_size: Maximum number of entries.
+            ttl: Time to live of the entries in seconds.
+        """
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._base_version: int = randbits(62)
+        self._positions: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        """Get the value of the given key if it exists and is not expired."""
+        entry: tuple[float, bytes] | None = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        """Set the value of the given key."""
+        self._entries[key] = (monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_versions(self, names: list[str]) -> list[int]:
+        """Get the current versions of the given names."""
+        return [self._versions.get(name, self._base_version) for name in names]
+
+    async def bump_versions(self, names: list[str]) -> None:
+        """Increase the versions of the given names."""
+        for name in names:
+            self._versions[name] = self._versions.get(name, self._base_version) + 1
+
+    async def get_positions(self, names: list[str]) -> list[int]:
+        """Get the WAL positions of the latest writes of the given names."""
+        return [self._positions.get(name, 0) for name in names]
+
+    async def advance_positions(self, names: list[str], position: int) -> None:
+        """Raise the WAL positions of the given names to the given position."""
+        for name in names:
+            self._positions[name] = max(self._positions.get(name, 0), position)
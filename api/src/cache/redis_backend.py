@@ -0,0 +1,88 @@
+"""Redis cache backend."""
+
+from secrets import randbits
+
+from redis.asyncio import Redis
+
+from .base_backend import BaseCacheBackend
+
+GET_VERSIONS_SCRIPT: str = """
+local versions = {}
+for index, key in ipairs(KEYS) do
+    redis.call('SET', key, ARGV[1], 'NX')
+    versions[index] = redis.call('GET', key)
+end
+return versions
+"""
+
+ADVANCE_POSITIONS_SCRIPT: str = """
+for _, key in ipairs(KEYS) do
+    if tonumber(ARGV[1]) > tonumber(redis.call('GET', key) or '0') then
+        redis.call('SET', key, ARGV[1], 'EX', ARGV[2])
+    end
+end
+"""
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """Cache backend which is shared by every worker through Redis.
+
+    The entries expire by their TTL. The size of the cache is bounded by the
+    `maxmemory` and `maxmemory-policy` settings of Redis. The policy should be
+    `volatile-lru`, so only the entries and the WAL positions, which have a TTL, are
+    evicted and the versions are kept. The missing versions are set to a random
+    base when they are first read or bumped. The WAL positions are raised
+    atomically by a script and expire with the entries.
+    """
+
+    def __init__(self, url: str, ttl: int, prefix: str = "event-cache"):
+        """Initialize the cache backend.
+
+        Arguments:
+            url: Redis connection URL.
+            ttl: Time to live of the entries in seconds.
+            prefix: Prefix of the keys.
+        """
+        self.redis: Redis = Redis.from_url(url)
+        self.ttl: int = ttl
+        self.prefix: str = prefix
+        self._get_versions = self.redis.register_script(GET_VERSIONS_SCRIPT)
+        self._advance_positions = self.redis.register_script(ADVANCE_POSITIONS_SCRIPT)
+
+    async def get(self, key: str) -> bytes | None:
+        """Get the value of the given key if it exists and is not expired."""
+        return await self.redis.get(f"{self.prefix}:entry:{key}")
+
+    async def set(self, key: str, value: bytes) -> None:
+        """Set the value of the given key."""
+        await self.redis.set(f"{self.prefix}:entry:{key}", value, ex=self.ttl)
+
+    async def get_versions(self, names: list[str]) -> list[int]:
+        """Get the current versions of the given names."""
+        versions: list[bytes] = await self._get_versions(
+            keys=[f"{self.prefix}:version:{name}" for name in names],
+            args=[randbits(62)],
+        )
+        return [int(version) for version in versions]
+
+    async def bump_versions(self, names: list[str]) -> None:
+        """Increase the versions of the given names."""
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            for name in names:
+                pipeline.set(f"{self.prefix}:version:{name}", randbits(62), nx=True)
+                pipeline.incr(f"{self.prefix}:version:{name}")
+            await pipeline.execute()
+
+    async def get_positions(self, names: list[str]) -> list[int]:
+        """Get the WAL positions of the latest writes of the given names."""
+        positions: list[bytes | None] = await self.redis.mget(
+            [f"{self.prefix}:position:{name}" for name in names]
+        )
+        return [int(position or 0) for position in positions]
+
+    async def advance_positions(self, names: list[str], position: int) -> None:
+        """Raise the WAL positions of the given names to the given position."""
+        await self._advance_positions(
+            keys=[f"{self.prefix}:position:{name}" for name in names],
+            args=[position, self.ttl],
+        )
@@ -5,6 +5,7 @@ from .exceptions import (
     BadRequestException,
     ForbiddenException,
     NotFoundException,
+    PayloadTooLargeException,
     UnauthorizedException,
     UnprocessableEntityException,
 )
@@ -16,5 +17,6 @@ __all__ = [
     "UnauthorizedException",
     "ForbiddenException",
     "NotFoundException",
+    "PayloadTooLargeException",
     "UnprocessableEntityException",
 ]
@@ -1,6 +1,8 @@
 """App configurations."""
 
-from pydantic import BaseModel, PostgresDsn, computed_field
+from typing import Literal
+
+from pydantic import BaseModel, PostgresDsn, RedisDsn, computed_field
 from pydantic_core import MultiHostUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -14,6 +16,8 @@ class SqlDBConfigurations(BaseModel):
         USER: Database user.
         PASSWORD: Database password.
         NAME: Database name.
+        REPLICA_HOSTS: Read replica hosts in `host` or `host:port` format.
+        REPLICA_COOLDOWN: Seconds to skip a replica after a failed connection.
     """
 
     HOST: str
@@ -21,6 +25,8 @@ class SqlDBConfigurations(BaseModel):
     USER: str
     PASS: str
     NAME: str
+    REPLICA_HOSTS: list[str] = []
+    REPLICA_COOLDOWN: float = 30.0
 
     @computed_field
     def psql_url(self) -> PostgresDsn:
@@ -38,6 +44,28 @@ class SqlDBConfigurations(BaseModel):
             port=self.PORT,
         )
 
+    @computed_field
+    def replica_urls(self) -> list[PostgresDsn]:
+        """Generate plain postgres URLs of the read replicas.
+
+        Returns:
+                Replica URLs which can be used by asyncpg directly.
+        """
+        urls: list[PostgresDsn] = []
+        for replica_host in self.REPLICA_HOSTS:
+            host, _, port = replica_host.partition(":")
+            urls.append(
+                MultiHostUrl.build(
+                    scheme="postgresql",
+                    username=self.USER,
+                    password=self.PASS,
+                    host=host,
+                    path=self.NAME,
+                    port=int(port) if port else self.PORT,
+                )
+            )
+        return urls
+
 
 class AuthConfigurations(BaseModel):
     """Auth configurations class."""
@@ -46,6 +74,25 @@ class AuthConfigurations(BaseModel):
     PASS: str
 
 
+class CacheConfigurations(BaseModel):
+    """Cache configurations class.
+
+    Attributes:
+        BACKEND: Cache backend. `redis` should be used for multi-worker deployments.
+        MAX_SIZE: Maximum number of entries of the memory backend.
+        TTL: Time to live of the entries in seconds.
+        REDIS_URL: Redis URL of the redis backend.
+        LISTEN_CHANGES: Invalidate the entries by the change notifications of the
+            database, so the writes of the other workers are seen immediately.
+    """
+
+    BACKEND: Literal["memory", "redis"] = "memory"
+    MAX_SIZE: int = 10_000
+    TTL: int = 60
+    REDIS_URL: RedisDsn | None = None
+    LISTEN_CHANGES: bool = True
+
+
 class Configuration(BaseSettings):
     """Project settings class."""
 
@@ -53,6 +100,7 @@ class Configuration(BaseSettings):
 
     DB: SqlDBConfigurations
     AUTH: AuthConfigurations
+    CACHE: CacheConfigurations = CacheConfigurations()
 
 
 configuration: Configuration = Configuration()
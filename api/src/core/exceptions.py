@@ -42,6 +42,14 @@ class NotFoundException(HttpException):
         super().__init__(message, 404)
 
 
+class PayloadTooLargeException(HttpException):
+    """Raised when the request body is larger than the limit."""
+
+    def __init__(self, message: str = "Content Too Large") -> None:
+        """Construct the class."""
+        super().__init__(message, 413)
+
+
 class UnprocessableEntityException(HttpException):
     """Raised when the requested entity is not unprocessable."""
 
@@ -1,5 +1,12 @@
 """Database module."""
 
+from .base_session import add_after_commit_hook
+from .listener import EVENT_CHANGES_CHANNEL, NotificationListener
 from .session import database_session_manager
 
-__all__ = ["database_session_manager"]
+__all__ = [
+    "EVENT_CHANGES_CHANNEL",
+    "NotificationListener",
+    "add_after_commit_hook",
+    "database_session_manager",
+]
@@ -1,9 +1,11 @@
 """Base class for database session."""
 
+import logging
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -11,12 +13,42 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from .replica import ReplicaConnector
+
+AfterCommitHook = Callable[[], Awaitable[None]]
+
+AFTER_COMMIT_HOOKS: str = "after_commit_hooks"
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def add_after_commit_hook(session: AsyncSession, hook: AfterCommitHook) -> None:
+    """Register a hook which runs after the transaction of the session is committed.
+
+    Arguments:
+        session: The database session.
+        hook: The coroutine function to run.
+    """
+    session.info.setdefault(AFTER_COMMIT_HOOKS, []).append(hook)
+
 
 class BaseSessionManager(ABC):
     """Base class for database session manager."""
 
-    def __init__(self, database_url: str):
-        """Initialize the database session manager."""
+    def __init__(
+        self,
+        database_url: str,
+        replica_urls: list[str] | None = None,
+        replica_cooldown: float = 30.0,
+    ):
+        """Initialize the database session manager.
+
+        Arguments:
+            database_url: Database URL of the primary.
+            replica_urls: Plain postgres URLs of the read replicas. Read sessions
+                use the primary if it is not given.
+            replica_cooldown: Seconds to skip a replica after a failed connection.
+        """
         self.engine: AsyncEngine = create_async_engine(
             database_url, echo=True, pool_size=20, max_overflow=10, future=True
         )
@@ -27,7 +59,54 @@ class BaseSessionManager(ABC):
             autoflush=True,
         )
 
+        self.read_engine: AsyncEngine = self.engine
+        if replica_urls:
+            primary_url: str = (
+                make_url(database_url)
+                .set(drivername="postgresql")
+                .render_as_string(hide_password=False)
+            )
+            self.read_engine = create_async_engine(
+                "postgresql+asyncpg://",
+                async_creator=ReplicaConnector(
+                    replica_urls=replica_urls,
+                    primary_url=primary_url,
+                    cooldown=replica_cooldown,
+                ),
+                echo=True,
+                pool_size=20,
+                max_overflow=10,
+                pool_pre_ping=True,
+                pool_recycle=300,
+            )
+        self.async_read_session: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            bind=self.read_engine.execution_options(isolation_level="AUTOCOMMIT"),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+
     @abstractmethod
     @asynccontextmanager
     def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get a new database session."""
+
+    @abstractmethod
+    @asynccontextmanager
+    def get_read_session(
+        self, transactional: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Get a new database session for read only queries."""
+
+    @staticmethod
+    async def run_after_commit_hooks(session: AsyncSession) -> None:
+        """Run the registered after commit hooks of the session.
+
+        The transaction is already committed, so a failing hook is only logged.
+        """
+        hooks: list[AfterCommitHook] = session.info.pop(AFTER_COMMIT_HOOKS, [])
+        for hook in hooks:
+            try:
+                await hook()
+            except Exception:
+                logger.exception("After commit hook is failed.")
@@ -0,0 +1,115 @@
+"""Postgres notification listener module."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+
+import asyncpg
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+EVENT_CHANGES_CHANNEL: str = "event_changes"
+
+NotificationHandler = Callable[[str], Awaitable[None]]
+
+
+class NotificationListener:
+    """Listener of the notifications of a postgres channel.
+
+    It keeps a dedicated connection which is subscribed to the channel, and every
+    payload is passed to the handler in its own task. The connection is checked
+    periodically and reopened after a delay when it is lost. The notifications
+    which are sent while it is disconnected are not received.
+
+    Methods:
+        start: Start listening in the background.
+        stop: Stop listening and close the connection.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        channel: str,
+        handler: NotificationHandler,
+        reconnect_delay: float = 1.0,
+        keepalive: float = 30.0,
+    ):
+        """Initialize the listener.
+
+        Arguments:
+            url: Plain postgres URL of the primary.
+            channel: The channel to listen.
+            handler: The coroutine function which is called with every payload.
+            reconnect_delay: Seconds to wait before reopening a lost connection.
+            keepalive: Seconds between the health checks of the connection.
+        """
+        self.url: str = url
+        self.channel: str = channel
+        self.handler: NotificationHandler = handler
+        self.reconnect_delay: float = reconnect_delay
+        self.keepalive: float = keepalive
+        self.listening: asyncio.Event = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._handler_tasks: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and wait for the running handlers."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._handler_tasks:
+            await asyncio.gather(*self._handler_tasks, return_exceptions=True)
+
+    async def _run(self) -> None:
+        """Keep a subscribed connection open until the listener is stopped."""
+        while True:
+            connection: asyncpg.Connection | None = None
+            try:
+                connection = await asyncpg.connect(self.url)
+                await connection.add_listener(self.channel, self._on_notification)
+                self.listening.set()
+                logger.info(f"Listening to {self.channel} notifications.")
+                while True:
+                    await asyncio.sleep(self.keepalive)
+                    await connection.execute("SELECT 1")
+            except (
+                OSError,
+                TimeoutError,
+                asyncpg.InterfaceError,
+                asyncpg.PostgresError,
+            ) as e:
+                logger.warning(f"Connection of the listener is lost: {e!r}")
+            finally:
+                self.listening.clear()
+                if connection is not None:
+                    connection.terminate()
+
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _on_notification(
+        self,
+        connection: asyncpg.Connection,
+        pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        """Run the handler of the payload in a new task."""
+        task: asyncio.Task = asyncio.create_task(self._handle(payload))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    async def _handle(self, payload: str) -> None:
+        """Run the handler and log its errors."""
+        try:
+            await self.handler(payload)
+        except Exception:
+            logger.exception(f"Notification could not be handled: {payload}")
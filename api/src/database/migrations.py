@@ -2,20 +2,118 @@
 
 import asyncio
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.schema import CreateColumn, CreateIndex
 from sqlmodel import SQLModel
 
 from src.core import configuration
-from src.models import Event
+from src.models import Event, EventChange
 
-_ = Event
+from .listener import EVENT_CHANGES_CHANNEL
+
+OBSOLETE_INDEXES: tuple[str, ...] = (
+    # Replaced by the leading column of `ix_event_userId_date_time`.
+    "ix_event_userId",
+)
+
+# Transition tables, changed rows and logged rows of every operation. The triggers
+# are statement level, so a bulk write sends a single notification for each user.
+EVENT_CHANGES_ROWS: dict[str, tuple[str, str, str]] = {
+    "insert": (
+        "NEW TABLE AS new_rows",
+        'SELECT "userId", date FROM new_rows',
+        'SELECT id, "userId", to_jsonb(new_rows) FROM new_rows',
+    ),
+    "update": (
+        "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+        'SELECT "userId", date FROM new_rows '
+        'UNION ALL SELECT "userId", date FROM old_rows',
+        'SELECT id, "userId", to_jsonb(new_rows) FROM new_rows',
+    ),
+    "delete": (
+        "OLD TABLE AS old_rows",
+        'SELECT "userId", date FROM old_rows',
+        'SELECT id, "userId", NULL::jsonb FROM old_rows',
+    ),
+}
+
+
+async def migrate_columns(conn: AsyncConnection) -> None:
+    """Add the missing nullable columns of the models to the existing tables.
+
+    `create_all` does not alter the existing tables, so the columns which are added
+    to the models later are created here.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        existing: set[str] = {
+            column["name"]
+            for column in await conn.run_sync(
+                lambda sync_conn, table=table: inspect(sync_conn).get_columns(
+                    table.name
+                )
+            )
+        }
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            await conn.execute(
+                text(f'ALTER TABLE "{table.name}" ADD COLUMN IF NOT EXISTS {ddl}')
+            )
+
+
+async def migrate_indexes(conn: AsyncConnection) -> None:
+    """Create the missing indexes of the models and drop the obsolete ones.
+
+    `create_all` only creates the indexes of the new tables, so the indexes of the
+    existing tables are managed here.
+    """
+    for name in OBSOLETE_INDEXES:
+        await conn.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            await conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+async def migrate_triggers(conn: AsyncConnection) -> None:
+    """Create the triggers which log and notify the changes of the events.
+
+    The payload of a notification is a JSON object of the operation, the user and
+    the date range of the changed events, e.g.
+    `{"op": "INSERT", "userId": "1", "first_date": "2025-01-01", ...}`.
+    """
+    for operation, (transition, rows, logged) in EVENT_CHANGES_ROWS.items():
+        await conn.execute(
+            text(
+                f"CREATE OR REPLACE FUNCTION notify_event_{operation}() "
+                "RETURNS trigger AS $$ BEGIN "
+                f'INSERT INTO "{EventChange.__tablename__}" '
+                f'(op, "eventId", "userId", data) SELECT TG_OP, * FROM ({logged}) '
+                "AS logged; "
+                f"PERFORM pg_notify('{EVENT_CHANGES_CHANNEL}', json_build_object("
+                "'op', TG_OP, 'userId', \"userId\", "
+                "'first_date', min(date), 'last_date', max(date))::text) "
+                f'FROM ({rows}) AS changed GROUP BY "userId"; '
+                "RETURN NULL; END; $$ LANGUAGE plpgsql"
+            )
+        )
+        await conn.execute(
+            text(
+                f'CREATE OR REPLACE TRIGGER "event_changes_{operation}" '
+                f'AFTER {operation.upper()} ON "{Event.__tablename__}" '
+                f"REFERENCING {transition} FOR EACH STATEMENT "
+                f"EXECUTE FUNCTION notify_event_{operation}()"
+            )
+        )
 
 
 async def migrate():
     """Run migrations."""
     url: str = str(configuration.DB.psql_url)
 
-    engine: AsyncSession = create_async_engine(
+    engine: AsyncEngine = create_async_engine(
         url,
         echo=True,
         future=True,
@@ -26,6 +124,9 @@ async def migrate():
 
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        await migrate_columns(conn)
+        await migrate_indexes(conn)
+        await migrate_triggers(conn)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,264 @@
+"""Event table partition maintenance module.
+
+The event table can be partitioned by month on `date`. Every partition is named as
+`event_pYYYYMM`, and rows out of the range of the monthly partitions are stored in
+the `event_default` partition.
+
+Usage:
+    python -m src.database.partitions enable
+    python -m src.database.partitions create-ahead --months 3
+    python -m src.database.partitions retain --keep-months 12 --archive-dir /backup
+"""
+
+import argparse
+import asyncio
+import gzip
+import logging
+import re
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from src.core import configuration
+
+from .migrations import migrate_indexes, migrate_triggers
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+TABLE: str = "event"
+DEFAULT_PARTITION: str = f"{TABLE}_default"
+PARTITION_PATTERN: re.Pattern[str] = re.compile(rf"^{TABLE}_p(\d{{4}})(\d{{2}})$")
+
+
+def add_months(month: date, months: int) -> date:
+    """Get the first day of the month which is `months` after the given month."""
+    index: int = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Get the partition name of the given month."""
+    return f"{TABLE}_p{month.year:04d}{month.month:02d}"
+
+
+def partition_month(name: str) -> date | None:
+    """Get the month of the given partition name if it is a monthly partition."""
+    match: re.Match[str] | None = PARTITION_PATTERN.match(name)
+    return date(int(match[1]), int(match[2]), 1) if match else None
+
+
+async def is_partitioned(conn: AsyncConnection) -> bool:
+    """Check whether the event table is partitioned."""
+    relkind: str | None = (
+        await conn.execute(
+            text("SELECT relkind::text FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": TABLE},
+        )
+    ).scalar_one_or_none()
+    return relkind == "p"
+
+
+async def get_partitions(conn: AsyncConnection) -> list[str]:
+    """Get the attached partitions of the event table."""
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table) "
+            "ORDER BY child.relname"
+        ),
+        {"table": TABLE},
+    )
+    return list(result.scalars().all())
+
+
+async def create_partition(conn: AsyncConnection, month: date) -> bool:
+    """Create the partition of the given month if it does not exist.
+
+    The rows of the month are moved from the default partition before the new
+    partition is attached.
+
+    Returns:
+        Whether a new partition is created.
+    """
+    name: str = partition_name(month)
+    if name in await get_partitions(conn):
+        return False
+
+    lower, upper = month, add_months(month, 1)
+    await conn.execute(
+        text(f'CREATE TABLE "{name}" (LIKE "{TABLE}" INCLUDING DEFAULTS)')
+    )
+    await conn.execute(
+        text(
+            f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '
+            "WHERE date >= :lower AND date < :upper RETURNING *) "
+            f'INSERT INTO "{name}" SELECT * FROM moved'
+        ),
+        {"lower": lower, "upper": upper},
+    )
+    await conn.execute(
+        text(
+            f'ALTER TABLE "{TABLE}" ATTACH PARTITION "{name}" '
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        )
+    )
+    logger.info(f"Partition {name} is created.")
+    return True
+
+
+async def create_ahead(conn: AsyncConnection, months: int, today: date) -> None:
+    """Create the partitions from the current month to `months` months ahead."""
+    current: date = today.replace(day=1)
+    for offset in range(months + 1):
+        await create_partition(conn, add_months(current, offset))
+
+
+async def enable(conn: AsyncConnection, months_ahead: int, today: date) -> None:
+    """Convert the event table to a table which is partitioned by month.
+
+    The existing rows are copied into the monthly partitions, and the primary key
+    becomes `(id, date)` since it must contain the partition key.
+    """
+    if await is_partitioned(conn):
+        logger.info("Event table is already partitioned.")
+        return
+
+    legacy: str = f"{TABLE}_legacy"
+    await conn.execute(text(f'ALTER TABLE "{TABLE}" RENAME TO "{legacy}"'))
+    await conn.execute(
+        text(
+            f'ALTER TABLE "{legacy}" '
+            f'RENAME CONSTRAINT "{TABLE}_pkey" TO "{legacy}_pkey"'
+        )
+    )
+    index_names = (
+        await conn.execute(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = :table"),
+            {"table": legacy},
+        )
+    ).scalars()
+    for index_name in index_names.all():
+        if index_name != f"{legacy}_pkey":
+            await conn.execute(text(f'DROP INDEX "{index_name}"'))
+
+    await conn.execute(
+        text(
+            f'CREATE TABLE "{TABLE}" (LIKE "{legacy}" INCLUDING DEFAULTS) '
+            "PARTITION BY RANGE (date)"
+        )
+    )
+    await conn.execute(text(f'ALTER TABLE "{TABLE}" ADD PRIMARY KEY (id, date)'))
+    await conn.execute(text(f'ALTER SEQUENCE "{TABLE}_id_seq" OWNED BY "{TABLE}".id'))
+    await conn.execute(
+        text(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT')
+    )
+
+    first, last = (
+        await conn.execute(text(f'SELECT min(date), max(date) FROM "{legacy}"'))
+    ).one()
+    month: date = (first or today).replace(day=1)
+    last_month: date = add_months(
+        max(last or today, today).replace(day=1), months_ahead
+    )
+    while month <= last_month:
+        await create_partition(conn, month)
+        month = add_months(month, 1)
+
+    await conn.execute(text(f'INSERT INTO "{TABLE}" SELECT * FROM "{legacy}"'))
+    await conn.execute(text(f'DROP TABLE "{legacy}"'))
+    await migrate_indexes(conn)
+    await migrate_triggers(conn)
+    logger.info("Event table is partitioned.")
+
+
+async def retain(
+    conn: AsyncConnection, keep_months: int, today: date, archive_dir: Path | None
+) -> None:
+    """Detach the partitions which are older than `keep_months` months.
+
+    A recurring series is stored as the row of its first occurrence, so the series
+    which still have occurrences after the cutoff are moved out of a detached
+    partition into the default partition, which covers the detached range.
+
+    If the archive directory is given, every detached partition is copied into a
+    gzip compressed CSV file and dropped. Otherwise it is kept as a standalone table.
+    """
+    cutoff: date = add_months(today.replace(day=1), -keep_months)
+    for name in await get_partitions(conn):
+        month: date | None = partition_month(name)
+        if month is None or month >= cutoff:
+            continue
+
+        await conn.execute(text(f'ALTER TABLE "{TABLE}" DETACH PARTITION "{name}"'))
+        live = await conn.execute(
+            text(
+                f'WITH live AS (DELETE FROM "{name}" WHERE frequency IS NOT NULL '
+                "AND (until IS NULL OR until >= :cutoff) RETURNING *) "
+                f'INSERT INTO "{DEFAULT_PARTITION}" SELECT * FROM live'
+            ),
+            {"cutoff": cutoff},
+        )
+        logger.info(
+            f"Partition {name} is detached and its {live.rowcount} live series are "
+            "kept."
+        )
+        if archive_dir is None:
+            continue
+
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        path: Path = archive_dir / f"{name}.csv.gz"
+        raw_connection = await conn.get_raw_connection()
+        with gzip.open(path, "wb") as archive:
+
+            async def write(chunk: bytes, archive: gzip.GzipFile = archive) -> None:
+                archive.write(chunk)
+
+            await raw_connection.driver_connection.copy_from_table(
+                name, output=write, format="csv", header=True
+            )
+        await conn.execute(text(f'DROP TABLE "{name}"'))
+        logger.info(f"Partition {name} is archived to {path}.")
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the maintenance command."""
+    engine: AsyncEngine = create_async_engine(str(configuration.DB.psql_url))
+    today: date = date.today()
+
+    async with engine.begin() as conn:
+        if args.command == "enable":
+            await enable(conn, args.months, today)
+        elif not await is_partitioned(conn):
+            raise SystemExit("Event table is not partitioned, run `enable` first.")
+        elif args.command == "create-ahead":
+            await create_ahead(conn, args.months, today)
+        else:
+            await retain(conn, args.keep_months, today, args.archive_dir)
+
+    await engine.dispose()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser of the maintenance commands."""
+    parser = argparse.ArgumentParser(description="Event table partition maintenance.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enable_parser = commands.add_parser("enable", help="Partition the event table.")
+    enable_parser.add_argument("--months", type=int, default=3)
+
+    ahead_parser = commands.add_parser("create-ahead", help="Create next partitions.")
+    ahead_parser.add_argument("--months", type=int, default=3)
+
+    retain_parser = commands.add_parser("retain", help="Detach old partitions.")
+    retain_parser.add_argument("--keep-months", type=int, required=True)
+    retain_parser.add_argument("--archive-dir", type=Path, default=None)
+
+    return parser
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(build_parser().parse_args()))
@@ -0,0 +1,66 @@
+"""Read replica connection module."""
+
+import logging
+from time import monotonic
+
+import asyncpg
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ReplicaConnector:
+    """Async connection creator of the read replica pool.
+
+    New connections are opened to the replicas in round-robin order. A replica
+    which refuses a connection is skipped until its cooldown passes, and the
+    primary is used when every replica is unhealthy.
+
+    Methods:
+        __call__: Open a new connection.
+    """
+
+    def __init__(
+        self,
+        replica_urls: list[str],
+        primary_url: str,
+        cooldown: float = 30.0,
+        connect_timeout: float = 5.0,
+    ):
+        """Initialize the connector.
+
+        Arguments:
+            replica_urls: Plain postgres URLs of the replicas.
+            primary_url: Plain postgres URL of the primary.
+            cooldown: Seconds to skip a replica after a failed connection.
+            connect_timeout: Timeout of a single connection attempt in seconds.
+        """
+        self.replica_urls: list[str] = replica_urls
+        self.primary_url: str = primary_url
+        self.cooldown: float = cooldown
+        self.connect_timeout: float = connect_timeout
+        self._unhealthy_until: dict[str, float] = {}
+        self._next: int = 0
+
+    async def __call__(self) -> asyncpg.Connection:
+        """Open a connection to the next healthy replica or to the primary."""
+        for url in self._candidates():
+            try:
+                return await asyncpg.connect(url, timeout=self.connect_timeout)
+            except (OSError, TimeoutError, asyncpg.PostgresError) as e:
+                self._unhealthy_until[url] = monotonic() + self.cooldown
+                logger.warning(f"Replica is marked as unhealthy: {e!r}")
+
+        return await asyncpg.connect(self.primary_url, timeout=self.connect_timeout)
+
+    def _candidates(self) -> list[str]:
+        """Get the healthy replicas starting from the next one in the rotation."""
+        count: int = len(self.replica_urls)
+        start: int = self._next
+        self._next = (self._next + 1) % count if count else 0
+
+        now: float = monotonic()
+        return [
+            url
+            for url in (self.replica_urls[(start + i) % count] for i in range(count))
+            if self._unhealthy_until.get(url, 0.0) <= now
+        ]
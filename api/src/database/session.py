@@ -17,6 +17,7 @@ class DatabaseSessionManager(BaseSessionManager):
 
     Methods:
         get_session: Get a new database session.
+        get_read_session: Get a new database session which is bound to replicas.
     """
 
     @asynccontextmanager
@@ -26,13 +27,40 @@ class DatabaseSessionManager(BaseSessionManager):
             try:
                 yield session
                 await session.commit()
+                await self.run_after_commit_hooks(session)
             except Exception as e:
                 await session.rollback()
                 raise e from e
             finally:
                 await session.close()
 
+    @asynccontextmanager
+    async def get_read_session(
+        self, transactional: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Provide a database session for read only queries.
+
+        The session is bound to the read replicas if they are configured. A pool
+        connection is taken on the first query, and the queries run in autocommit
+        mode, so there is no `BEGIN`/`COMMIT` round trip and nothing to commit.
+
+        Arguments:
+            transactional: Run the queries in a `READ ONLY` transaction instead of
+                autocommit mode. It is required by the server side cursors.
+        """
+        async with self.async_read_session() as session:
+            if transactional:
+                await session.connection(
+                    execution_options={
+                        "isolation_level": "REPEATABLE READ",
+                        "postgresql_readonly": True,
+                    }
+                )
+            yield session
+
 
 database_session_manager: DatabaseSessionManager = DatabaseSessionManager(
-    str(configuration.DB.psql_url)
+    str(configuration.DB.psql_url),
+    replica_urls=[str(url) for url in configuration.DB.replica_urls],
+    replica_cooldown=configuration.DB.REPLICA_COOLDOWN,
 )
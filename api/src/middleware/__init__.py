@@ -1,5 +1,12 @@
 """Middleware module."""
 
-from .error_handler import GenericErrorHandlerMiddleware
+from .auth import BasicAuthMiddleware
+from .content import ContentNegotiationMiddleware
+from .error_handler import GenericErrorHandlerMiddleware, http_exception_handler
 
-__all__ = ["GenericErrorHandlerMiddleware"]
+__all__ = [
+    "BasicAuthMiddleware",
+    "ContentNegotiationMiddleware",
+    "GenericErrorHandlerMiddleware",
+    "http_exception_handler",
+]
@@ -0,0 +1,58 @@
+"""Authentication middleware."""
+
+from base64 import b64encode
+from hmac import compare_digest
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.exceptions import UnauthorizedException
+
+
+class BasicAuthMiddleware:
+    """HTTP basic authentication middleware.
+
+    The expected credentials are encoded once, and every request is checked by a
+    constant-time comparison of the raw `Authorization` header. The requests of the
+    public paths, e.g. the documentation, are not checked.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        username: str,
+        password: str,
+        public_paths: frozenset[str] = frozenset(),
+    ) -> None:
+        """Construct the class."""
+        self.app = app
+        self._expected_token: bytes = b64encode(f"{username}:{password}".encode())
+        self.public_paths: frozenset[str] = public_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the request."""
+        if (
+            scope["type"] != "http"
+            or scope["path"] in self.public_paths
+            or self._is_authorized(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        exception: UnauthorizedException = UnauthorizedException()
+        response = ORJSONResponse(
+            status_code=exception.status,
+            content={"detail": str(exception)},
+            headers={"WWW-Authenticate": "Basic"},
+        )
+        await response(scope, receive, send)
+
+    def _is_authorized(self, scope: Scope) -> bool:
+        """Check the `Authorization` header of the request."""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.partition(b" ")
+                return scheme.lower() == b"basic" and compare_digest(
+                    token.strip(), self._expected_token
+                )
+        return False
@@ -0,0 +1,251 @@
+"""Content negotiation middleware."""
+
+import gzip
+from io import BytesIO
+from typing import BinaryIO
+
+import msgpack
+import orjson
+import zstandard
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core import BadRequestException, PayloadTooLargeException
+from src.core.exceptions import HttpException
+
+JSON: str = "application/json"
+MSGPACK: str = "application/msgpack"
+ENCODINGS: tuple[str, ...] = ("zstd", "gzip")
+READ_SIZE: int = 64 * 1024
+
+
+def preferred(header: str | None, options: tuple[str, ...]) -> str | None:
+    """Get the option which has the highest quality value in the header.
+
+    Only the explicitly listed options are considered, and ties are resolved by the
+    order of the options.
+
+    Arguments:
+        header: The value of an `Accept` like header.
+        options: The supported options.
+
+    Returns:
+        The preferred option. `None` if no option is acceptable.
+    """
+    qualities: dict[str, float] = {}
+    for item in (header or "").split(","):
+        name, *parameters = (part.strip() for part in item.split(";"))
+        quality: float = 1.0
+        for parameter in parameters:
+            key, _, value = parameter.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.lower()] = quality
+
+    best, best_quality = None, 0.0
+    for option in options:
+        if qualities.get(option, 0.0) > best_quality:
+            best, best_quality = option, qualities[option]
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress the body with the given content encoding."""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    return gzip.compress(body, compresslevel=6)
+
+
+def decompress(body: bytes, encoding: str, max_size: int) -> bytes:
+    """Decompress the body of the given content encoding in bounded reads.
+
+    Arguments:
+        body: The compressed body.
+        encoding: The content encoding of the body.
+        max_size: Maximum size of the decompressed body.
+
+    Returns:
+        The decompressed body.
+
+    Raises:
+        PayloadTooLargeException: If the decompressed body exceeds the maximum size.
+    """
+    reader: BinaryIO
+    if encoding == "zstd":
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            body, read_across_frames=True
+        )
+    else:
+        reader = gzip.GzipFile(fileobj=BytesIO(body))
+
+    chunks: list[bytes] = []
+    size: int = 0
+    with reader:
+        while chunk := reader.read(READ_SIZE):
+            size += len(chunk)
+            if size > max_size:
+                raise PayloadTooLargeException()
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class ContentNegotiationMiddleware:
+    """Msgpack content negotiation and compression middleware.
+
+    Msgpack and compressed request bodies are turned into plain JSON before the
+    application reads them, and the bodies which exceed the maximum size before or
+    after decompression are rejected with `413`. Complete JSON responses are
+    converted to msgpack if the client prefers it in `Accept`, and compressed with
+    zstd or gzip by `Accept-Encoding` if they are not smaller than the minimum size.
+    The entity tags of the converted responses become weak. Streaming responses are
+    passed as they are.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        max_body_size: int = 10 * 1024 * 1024,
+    ) -> None:
+        """Construct the class."""
+        self.app = app
+        self.minimum_size: int = minimum_size
+        self.max_body_size: int = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        exception: HttpException | None = None
+        try:
+            receive = await self._decode_request(scope, headers, receive)
+        except HttpException as e:
+            exception = e
+        except (
+            ValueError,
+            TypeError,
+            OSError,
+            EOFError,
+            msgpack.UnpackException,
+            zstandard.ZstdError,
+        ) as e:
+            exception = BadRequestException(f"Invalid request body: {e}")
+        if exception is not None:
+            response = ORJSONResponse(
+                status_code=exception.status, content={"detail": str(exception)}
+            )
+            await response(scope, receive, send)
+            return
+
+        to_msgpack: bool = preferred(headers.get("accept"), (MSGPACK, JSON)) == MSGPACK
+        encoding: str | None = preferred(headers.get("accept-encoding"), ENCODINGS)
+        if not to_msgpack and encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            response_start, start = start, None
+            if message.get("more_body", False):
+                await send(response_start)
+                await send(message)
+                return
+
+            body: bytes = self._encode_response(
+                response_start, message.get("body", b""), to_msgpack, encoding
+            )
+            await send(response_start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _decode_request(
+        self, scope: Scope, headers: Headers, receive: Receive
+    ) -> Receive:
+        """Turn a msgpack or compressed request body into plain JSON."""
+        encoding: str = headers.get("content-encoding", "").lower()
+        is_msgpack: bool = headers.get("content-type", "").startswith(MSGPACK)
+        if encoding not in ENCODINGS and not is_msgpack:
+            return receive
+
+        chunks: list[bytes] = []
+        size: int = 0
+        while True:
+            message: Message = await receive()
+            chunk: bytes = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                raise PayloadTooLargeException()
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+
+        body: bytes = b"".join(chunks)
+        if encoding in ENCODINGS:
+            body = decompress(body, encoding, self.max_body_size)
+        if is_msgpack:
+            body = orjson.dumps(msgpack.unpackb(body))
+
+        request_headers = MutableHeaders(scope=scope)
+        if "content-encoding" in request_headers:
+            del request_headers["content-encoding"]
+        if is_msgpack:
+            request_headers["content-type"] = JSON
+        request_headers["content-length"] = str(len(body))
+
+        sent: bool = False
+
+        async def decoded_receive() -> Message:
+            nonlocal sent
+            if sent:
+                return await receive()
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return decoded_receive
+
+    def _encode_response(
+        self, start: Message, body: bytes, to_msgpack: bool, encoding: str | None
+    ) -> bytes:
+        """Convert and compress a complete response body by the negotiation."""
+        start.setdefault("headers", [])
+        headers = MutableHeaders(scope=start)
+        if not body or "content-encoding" in headers:
+            return body
+
+        changed: bool = False
+        if to_msgpack and headers.get("content-type", "").startswith(JSON):
+            body = msgpack.packb(orjson.loads(body))
+            headers["content-type"] = MSGPACK
+            changed = True
+        if encoding is not None and len(body) >= self.minimum_size:
+            body = compress(body, encoding)
+            headers["content-encoding"] = encoding
+            changed = True
+
+        headers.add_vary_header("Accept")
+        headers.add_vary_header("Accept-Encoding")
+        if not changed:
+            return body
+
+        headers["content-length"] = str(len(body))
+        etag: str | None = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
+        return body
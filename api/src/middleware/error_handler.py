@@ -1,22 +1,55 @@
 """Error handler middleware."""
 
+import logging
+
+from fastapi import Request
 from fastapi.responses import ORJSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.core.exceptions import HttpException
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def http_exception_handler(_: Request, e: HttpException) -> ORJSONResponse:
+    """Map the given http exception to its response."""
+    return ORJSONResponse(status_code=e.status, content={"detail": str(e)})
+
+
+class GenericErrorHandlerMiddleware:
+    """Generic error handler middleware.
+
+    It is a pure ASGI middleware, so it does not wrap the response stream. Known
+    exceptions are mapped by the registered exception handlers, this middleware
+    only turns the unexpected ones into `500` responses.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Construct the class."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started: bool = False
 
-class GenericErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Generic error handler middleware."""
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-    async def dispatch(self, request, call_next):
-        """Dispatch the request."""
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
+            if response_started:
+                raise
+            logger.exception("Unhandled exception.")
             status_code: int = e.status if isinstance(e, HttpException) else 500
-            return ORJSONResponse(
-                status_code=status_code,
-                content={"detail": str(e)},
+            response = ORJSONResponse(
+                status_code=status_code, content={"detail": str(e)}
             )
+            await response(scope, receive, send)
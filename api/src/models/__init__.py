@@ -1,5 +1,6 @@
 """Database models module."""
 
 from .event import Event
+from .event_change import EventChange
 
-__all__ = ["Event"]
+__all__ = ["Event", "EventChange"]
@@ -2,14 +2,39 @@
 
 from datetime import date, time
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 
 class Event(SQLModel, table=True):
-    """Event sql model class."""
+    """Event sql model class.
+
+    A recurring event is stored as a single row of its first occurrence with the
+    `frequency` and `interval` of its rule. `until` is the date which the
+    occurrences do not exceed, and it is empty if the series does not end.
+
+    Indexes:
+        ix_event_userId_date_time: Per user listings with optional date ranges.
+        ix_event_date_userId: Listings of a date range for every user (digests).
+        ix_event_recurrence: Recurring events whose series overlap a date range.
+    """
+
+    __table_args__ = (
+        Index("ix_event_userId_date_time", "userId", "date", "time"),
+        Index("ix_event_date_userId", "date", "userId"),
+        Index(
+            "ix_event_recurrence",
+            text("daterange(date, until, '[]')"),
+            postgresql_using="gist",
+            postgresql_where=text("frequency IS NOT NULL"),
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    userId: str = Field(index=True)
+    userId: str
     date: date
     time: time
     description: str
+    frequency: str | None = None
+    interval: int | None = None
+    until: date | None = None
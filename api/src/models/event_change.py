@@ -0,0 +1,45 @@
+"""Event change log model."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class EventChange(SQLModel, table=True):
+    """Event change log sql model class.
+
+    Rows are written by the triggers of the event table. `txid` is the id of the
+    writing transaction, and the changes are read in `(txid, id)` order up to the
+    oldest running transaction, so a change which is committed later can not be
+    skipped by a cursor. `data` is the row after the change, and it is empty for
+    deletions.
+
+    Indexes:
+        ix_event_change_txid_id: Reads of the changes after a cursor.
+    """
+
+    __tablename__ = "event_change"
+    __table_args__ = (Index("ix_event_change_txid_id", "txid", "id"),)
+
+    id: int | None = Field(
+        default=None, sa_column=Column(BigInteger, primary_key=True, autoincrement=True)
+    )
+    txid: int | None = Field(
+        default=None,
+        sa_column=Column(
+            BigInteger,
+            nullable=False,
+            server_default=text("pg_current_xact_id()::text::bigint"),
+        ),
+    )
+    op: str
+    eventId: int
+    userId: str
+    data: dict[str, Any] | None = Field(default=None, sa_column=Column(JSONB))
+    changed_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now()),
+    )
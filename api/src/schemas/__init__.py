@@ -1,5 +1,29 @@
 """Shared schemas."""
 
-from .event import CreateEventSchema
+from .event import (
+    BulkCreateEventResult,
+    BulkCreateEventSchema,
+    ChangeCursor,
+    CreateEventSchema,
+    EventChangeSchema,
+    EventCountSchema,
+    EventCursor,
+    EventGroupBy,
+    RecurrenceFrequency,
+    RecurrenceRule,
+    SearchEventsSchema,
+)
 
-__all__ = ["CreateEventSchema"]
+__all__ = [
+    "BulkCreateEventResult",
+    "BulkCreateEventSchema",
+    "ChangeCursor",
+    "CreateEventSchema",
+    "EventChangeSchema",
+    "EventCountSchema",
+    "EventCursor",
+    "EventGroupBy",
+    "RecurrenceFrequency",
+    "RecurrenceRule",
+    "SearchEventsSchema",
+]
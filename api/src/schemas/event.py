@@ -1,8 +1,100 @@
 """Event schemas."""
 
-from datetime import date, time
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from calendar import monthrange
+from datetime import date, time, timedelta
+from enum import Enum
+from typing import Any, Literal, Self
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, Field, ValidationError, model_validator
+
+from src.core import BadRequestException
+
+
+def add_months(day: date, months: int) -> date:
+    """Add months to the date by clamping the day to the end of the month."""
+    index: int = day.year * 12 + day.month - 1 + months
+    year, month = index // 12, index % 12 + 1
+    return date(year, month, min(day.day, monthrange(year, month)[1]))
+
+
+class RecurrenceFrequency(str, Enum):
+    """Enum of the recurrence frequencies."""
+
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+    YEARLY = "YEARLY"
+
+
+class RecurrenceRule(BaseModel):
+    """Recurrence rule of an event.
+
+    It is the `FREQ`, `INTERVAL`, `COUNT` and `UNTIL` subset of the iCalendar
+    `RRULE`, e.g. `FREQ=WEEKLY;INTERVAL=2;COUNT=10`. Monthly and yearly occurrences
+    are moved to the last day of the month if the day does not exist in it.
+    """
+
+    frequency: RecurrenceFrequency
+    interval: int = Field(default=1, ge=1, le=1000)
+    count: int | None = Field(default=None, ge=1, le=10_000)
+    until: date | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def parse(cls, value: Any) -> Any:
+        """Parse the `RRULE` formatted strings."""
+        if not isinstance(value, str):
+            return value
+
+        keys: dict[str, str] = {
+            "FREQ": "frequency",
+            "INTERVAL": "interval",
+            "COUNT": "count",
+            "UNTIL": "until",
+        }
+        parsed: dict[str, Any] = {}
+        for part in value.strip().removeprefix("RRULE:").split(";"):
+            key, _, part_value = part.partition("=")
+            if key.upper() not in keys:
+                raise ValueError(f"Unsupported rule part: {key}")
+            parsed[keys[key.upper()]] = part_value
+
+        if "until" in parsed:
+            until: str = parsed["until"]
+            parsed["until"] = date(int(until[:4]), int(until[4:6]), int(until[6:8]))
+
+        return parsed
+
+    @model_validator(mode="after")
+    def check_end(self) -> Self:
+        """Check that the rule is not ended by both `COUNT` and `UNTIL`."""
+        if self.count is not None and self.until is not None:
+            raise ValueError("COUNT and UNTIL can not be used together.")
+        return self
+
+    def last_date(self, start: date) -> date | None:
+        """Get the date which the occurrences do not exceed.
+
+        Arguments:
+            start: The date of the first occurrence.
+
+        Returns:
+            The last date of the series. `None` if the series does not end.
+        """
+        if self.until is not None or self.count is None:
+            return self.until
+
+        steps: int = (self.count - 1) * self.interval
+        if self.frequency == RecurrenceFrequency.DAILY:
+            return start + timedelta(days=steps)
+        if self.frequency == RecurrenceFrequency.WEEKLY:
+            return start + timedelta(weeks=steps)
+        if self.frequency == RecurrenceFrequency.MONTHLY:
+            return add_months(start, steps)
+        return add_months(start, steps * 12)
 
 
 class CreateEventSchema(BaseModel):
@@ -12,3 +104,130 @@ class CreateEventSchema(BaseModel):
     date: date
     time: time
     description: str
+    rrule: RecurrenceRule | None = None
+
+    @model_validator(mode="after")
+    def check_rrule(self) -> Self:
+        """Resolve the last date of the series and check that it is valid.
+
+        The `COUNT` of the rule is replaced by the `UNTIL` which it reaches, so a
+        series which ends after the supported dates is rejected here.
+        """
+        if self.rrule is None:
+            return self
+
+        try:
+            until: date | None = self.rrule.last_date(self.date)
+        except (OverflowError, ValueError) as e:
+            raise ValueError("The series ends after the supported dates.") from e
+        if until is not None and until < self.date:
+            raise ValueError("UNTIL can not be before the date of the event.")
+
+        self.rrule = self.rrule.model_copy(update={"count": None, "until": until})
+        return self
+
+
+class BulkCreateEventSchema(BaseModel):
+    """Bulk create event schema.
+
+    The items are validated one by one, so an invalid item does not reject the
+    whole batch.
+    """
+
+    events: list[dict[str, Any]] = Field(min_length=1, max_length=10_000)
+
+
+class BulkCreateEventResult(BaseModel):
+    """Result of a single item of a bulk create request."""
+
+    index: int
+    status: int
+    id: int | None = None
+    detail: Any = None
+
+
+class SearchEventsSchema(BaseModel):
+    """Search events schema.
+
+    It is the body alternative of the listing filters for large sets of users.
+    """
+
+    userIds: list[str] = Field(min_length=1, max_length=50_000)
+    start_date: date | None = None
+    end_date: date | None = None
+
+
+class EventCountSchema(BaseModel):
+    """Number of events of a date."""
+
+    date: date
+    count: int
+
+
+class EventChangeSchema(BaseModel):
+    """Change notification of the events of a user.
+
+    It is sent by the database triggers for every user whose events are changed by
+    a statement.
+    """
+
+    op: Literal["INSERT", "UPDATE", "DELETE"]
+    userId: str
+    first_date: date
+    last_date: date
+
+
+class EventGroupBy(str, Enum):
+    """Enum of the fields which events can be grouped by."""
+
+    USER = "userId"
+    DATE = "date"
+
+
+class Cursor(BaseModel):
+    """Base class of the keyset cursors which are encoded as opaque strings."""
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque url-safe string.
+
+        Returns:
+            The encoded cursor.
+        """
+        raw: bytes = orjson.dumps(
+            [getattr(self, name) for name in type(self).model_fields]
+        )
+        return urlsafe_b64encode(raw).decode("ascii")
+
+    @classmethod
+    def decode(cls, cursor: str) -> Self:
+        """Decode a cursor which is generated by `encode`.
+
+        Arguments:
+            cursor: The encoded cursor.
+
+        Returns:
+            The decoded cursor.
+
+        Raises:
+            BadRequestException: If the cursor is malformed.
+        """
+        try:
+            values = orjson.loads(urlsafe_b64decode(cursor.encode("ascii")))
+            return cls(**dict(zip(cls.model_fields, values, strict=True)))
+        except (BinasciiError, TypeError, ValueError, ValidationError) as e:
+            raise BadRequestException("Invalid cursor!") from e
+
+
+class EventCursor(Cursor):
+    """Keyset cursor that points to the last seen `(date, time, id)` of an event."""
+
+    date: date
+    time: time
+    id: int
+
+
+class ChangeCursor(Cursor):
+    """Keyset cursor that points to the last seen `(txid, id)` of an event change."""
+
+    txid: int
+    id: int
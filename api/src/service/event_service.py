@@ -1,18 +1,86 @@
 """Event service module."""
 
-from datetime import date, time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from datetime import date, time, timedelta
+from hashlib import blake2b
+from typing import Annotated, Any, TypeVar
 
-from pydantic import InstanceOf, validate_call
+import orjson
+from pydantic import Field, InstanceOf, validate_call
+from sqlalchemy import (
+    Date,
+    Integer,
+    Select,
+    Subquery,
+    TableValuedAlias,
+    Text,
+    bindparam,
+    case,
+    cast,
+    func,
+    insert,
+    literal,
+    literal_column,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
 
+from src.cache import BaseCacheBackend
 from src.core import NotFoundException
-from src.models import Event
+from src.database.base_session import add_after_commit_hook
+from src.models import Event, EventChange
+from src.schemas import (
+    ChangeCursor,
+    CreateEventSchema,
+    EventChangeSchema,
+    EventCursor,
+    EventGroupBy,
+    RecurrenceFrequency,
+    RecurrenceRule,
+)
+
+QueryT = TypeVar("QueryT", Select, SelectOfScalar)
+
+EVENT_COLUMNS = (Event.id, Event.userId, Event.date, Event.time, Event.description)
+EVENT_FIELDS: tuple[str, ...] = tuple(column.key for column in EVENT_COLUMNS)
+
+RECURRENCE_HORIZON: timedelta = timedelta(days=366)
+
+# Changes of the transactions older than the oldest running one can be read, since
+# every change after them is written with a greater transaction id.
+CHANGES_HORIZON = literal_column(
+    "pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+)
+
+# WAL positions are compared as byte offsets. The replay position is only set on the
+# replicas, since the primary has every write.
+WRITTEN_POSITION = literal_column("(pg_current_wal_lsn() - '0/0'::pg_lsn)::bigint")
+REPLAYED_POSITION = literal_column("(pg_last_wal_replay_lsn() - '0/0'::pg_lsn)::bigint")
 
 
 class EventService:
     """Event service class for CRUD event operations."""
 
+    ALL_USERS_VERSION: str = "users:*"
+
+    def __init__(self, cache: BaseCacheBackend | None = None, replicated: bool = False):
+        """Initialize the service.
+
+        Arguments:
+            cache: The cache backend of the event listings. Listings are not cached
+                if it is not given.
+            replicated: Whether the listings are read from replicas. The WAL
+                position of every write is recorded, and the listings which are
+                read before the replica replays the latest write of their users are
+                neither cached nor tagged.
+        """
+        self.cache: BaseCacheBackend | None = cache
+        self.replicated: bool = replicated
+
     @validate_call
     async def create(
         self,
@@ -21,7 +89,8 @@ class EventService:
         time: time,
         description: str,
         session: InstanceOf[AsyncSession],
-    ) -> None:
+        rrule: RecurrenceRule | None = None,
+    ) -> int:
         """Create a new event to the database.
 
         Arguments:
@@ -30,15 +99,58 @@ class EventService:
             time: The time of the event.
             description: The description of the event.
             session: The database session.
+            rrule: The recurrence rule of the event. The date is its first
+                occurrence.
 
         Returns:
-            None.
+            The id of the created event.
         """
         event: Event = Event(
-            userId=userId, date=date, time=time, description=description
+            userId=userId,
+            date=date,
+            time=time,
+            description=description,
+            **self._recurrence_values(date, rrule),
         )
 
         session.add(event)
+        await session.flush()
+        self._invalidate_on_commit(session, {userId})
+
+        return event.id
+
+    @validate_call
+    async def bulk_create(
+        self,
+        events: list[CreateEventSchema],
+        session: InstanceOf[AsyncSession],
+    ) -> list[int]:
+        """Create the given events by using multi-row insert statements.
+
+        Arguments:
+            events: The events to insert.
+            session: The database session.
+
+        Returns:
+            The ids of the inserted events in the same order of the input.
+        """
+        if not events:
+            return []
+
+        query = insert(Event).returning(Event.id, sort_by_parameter_order=True)
+        result = await session.scalars(
+            query,
+            [
+                {
+                    **event.model_dump(exclude={"rrule"}),
+                    **self._recurrence_values(event.date, event.rrule),
+                }
+                for event in events
+            ],
+        )
+        self._invalidate_on_commit(session, {event.userId for event in events})
+
+        return list(result.all())
 
     @validate_call
     async def get_events(
@@ -50,6 +162,9 @@ class EventService:
     ) -> list[Event]:
         """Get events from the database.
 
+        Every occurrence of the recurring events in the date range is returned as
+        a separate event whose date is the date of the occurrence.
+
         Arguments:
             session: The database session to connect to db.
             userIds: The user ids array to filter the db.
@@ -62,17 +177,619 @@ class EventService:
         Raises:
             NotFoundException: If there is no event found.
         """
-        query = select(Event)
+        occurrences = self._occurrences(userIds, start_date, end_date)
+        rows = (await session.execute(select(*occurrences.c))).mappings()
+
+        result: list[Event] = [Event(**row) for row in rows]
+
+        if not result:
+            raise NotFoundException("Event not found!")
+
+        return result
+
+    @validate_call
+    async def get_events_etag(
+        self,
+        userIds: list[str] | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        group_by: EventGroupBy | None = None,
+        after_id: int | None = None,
+        session: InstanceOf[AsyncSession] | None = None,
+    ) -> str | None:
+        """Get the entity tag of an event listing without querying the events.
+
+        The tag is built from the normalized filters and the versions of the
+        requested users, so it changes as soon as an event of the users is
+        committed. It is also used as the cache key of the listing.
+
+        If the service is replicated and a write of the users is recorded, the
+        server of the session is asked whether it has replayed the write, since the
+        rows of a lagging replica must not be tagged with the new versions.
+
+        Arguments:
+            userIds: The user ids array of the listing.
+            start_date: Start date of the listing.
+            end_date: End date of the listing.
+            group_by: The grouping of the listing. Plain listing if it is not given.
+            after_id: The lower bound of the event ids of the listing.
+            session: The database session which reads the listing.
+
+        Returns:
+            The entity tag of the listing. `None` if there is no cache backend or
+            the replica has not replayed the latest write of the users.
+        """
+        if self.cache is None:
+            return None
+
+        users: list[str] | None = sorted(set(userIds)) if userIds else None
+        version_names: list[str] = (
+            [f"user:{user}" for user in users] if users else [self.ALL_USERS_VERSION]
+        )
+        versions: list[int] = await self.cache.get_versions(version_names)
+        if (
+            self.replicated
+            and session is not None
+            and not await self._is_replayed(self.cache, session, version_names)
+        ):
+            return None
+
+        return blake2b(
+            orjson.dumps([group_by, users, start_date, end_date, after_id, versions]),
+            digest_size=16,
+        ).hexdigest()
+
+    @validate_call
+    async def get_events_json(
+        self,
+        session: InstanceOf[AsyncSession],
+        userIds: list[str] | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        etag: str | None = None,
+    ) -> bytes:
+        """Get events as a JSON array by reading through the cache.
+
+        Arguments:
+            session: The database session to connect to db.
+            userIds: The user ids array to filter the db.
+            start_date: Start date to filter the db.
+            end_date: End date to filter the db.
+            etag: The entity tag of the listing if it is already computed.
+
+        Returns:
+            The JSON array of the events of the given params.
+
+        Raises:
+            NotFoundException: If there is no event found.
+        """
+        etag = etag or await self.get_events_etag(
+            userIds, start_date, end_date, session=session
+        )
+
+        async def fetch() -> bytes:
+            return await self._fetch_events_json(session, userIds, start_date, end_date)
+
+        return await self._read_through(etag, fetch)
+
+    async def _fetch_events_json(
+        self,
+        session: AsyncSession,
+        userIds: list[str] | None,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> bytes:
+        """Fetch the columns of the events and serialize them in a single pass.
+
+        Plain rows are selected instead of ORM instances, so nothing is tracked by
+        the identity map, and dates and times are serialized by orjson natively.
+        """
+        occurrences = self._occurrences(userIds, start_date, end_date)
+        query = select(*(occurrences.c[field] for field in EVENT_FIELDS))
+
+        return await self._dump_rows(session, query)
+
+    @validate_call
+    async def search_events_json(
+        self,
+        session: InstanceOf[AsyncSession],
+        userIds: Annotated[list[str], Field(min_length=1)],
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> bytes:
+        """Get events of a large set of users as a JSON array.
+
+        The user ids are sent as a single array parameter and joined with
+        `unnest`, so the query and its plan do not depend on the number of users
+        as an `IN` list does.
+
+        Arguments:
+            session: The database session to connect to db.
+            userIds: The user ids array to filter the db.
+            start_date: Start date to filter the db.
+            end_date: End date to filter the db.
+
+        Returns:
+            The JSON array of the events ordered by `(date, time, id)`.
+
+        Raises:
+            NotFoundException: If there is no event found.
+        """
+        users = (
+            func.unnest(bindparam("userIds", sorted(set(userIds)), type_=ARRAY(Text)))
+            .table_valued("userId")
+            .render_derived(name="users")
+        )
+
+        occurrences = self._occurrences(None, start_date, end_date, users=users)
+        query = select(*(occurrences.c[field] for field in EVENT_FIELDS)).order_by(
+            occurrences.c.date, occurrences.c.time, occurrences.c.id
+        )
+
+        return await self._dump_rows(session, query)
+
+    @validate_call
+    async def get_events_page(
+        self,
+        session: InstanceOf[AsyncSession],
+        limit: Annotated[int, Field(gt=0)],
+        userIds: list[str] | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after: EventCursor | None = None,
+    ) -> list[Event]:
+        """Get a single page of events ordered by `(date, time, id)`.
+
+        Arguments:
+            session: The database session to connect to db.
+            limit: Maximum number of events in the page.
+            userIds: The user ids array to filter the db.
+            start_date: Start date to filter the db.
+            end_date: End date to filter the db.
+            after: Cursor of the last event of the previous page.
+
+        Returns:
+            The events of the page. It is empty when there is no more event.
+        """
+        query = self._keyset_query(userIds, start_date, end_date, after).limit(limit)
+
+        return [Event(**row) for row in (await session.execute(query)).mappings()]
+
+    @validate_call
+    async def get_changes(
+        self,
+        session: InstanceOf[AsyncSession],
+        limit: Annotated[int, Field(gt=0)],
+        userIds: list[str] | None = None,
+        since: ChangeCursor | None = None,
+    ) -> list[EventChange]:
+        """Get a single page of the event changes after the cursor.
+
+        Changes are ordered by `(txid, id)`, and the changes of the transactions
+        which may be followed by an earlier commit are not returned yet.
+
+        Arguments:
+            session: The database session to connect to db.
+            limit: Maximum number of changes in the page.
+            userIds: The user ids array to filter the db.
+            since: Cursor of the last change of the previous page.
+
+        Returns:
+            The changes of the page. It is empty when there is no more change.
+        """
+        keyset = (EventChange.txid, EventChange.id)
+        query = select(EventChange).where(EventChange.txid < CHANGES_HORIZON)
 
         if userIds:
-            query = query.where(Event.userId.in_(userIds))
+            query = query.where(EventChange.userId.in_(userIds))
+        if since:
+            query = query.where(tuple_(*keyset) > tuple_(since.txid, since.id))
 
-        if start_date and end_date:
-            query = query.where(Event.date.between(start_date, end_date))
+        return list((await session.scalars(query.order_by(*keyset).limit(limit))).all())
 
-        result: list[Event] = list((await session.execute(query)).scalars().all())
+    @validate_call
+    async def stream_events(
+        self,
+        session: InstanceOf[AsyncSession],
+        userIds: list[str] | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after: EventCursor | None = None,
+        batch_size: Annotated[int, Field(gt=0)] = 500,
+    ) -> AsyncGenerator[Event, None]:
+        """Stream events ordered by `(date, time, id)` by using a db cursor.
 
-        if not result:
+        Rows are fetched from a server side cursor in batches, so memory usage does
+        not depend on the size of the result.
+
+        Arguments:
+            session: The database session to connect to db.
+            userIds: The user ids array to filter the db.
+            start_date: Start date to filter the db.
+            end_date: End date to filter the db.
+            after: Cursor of the last event which is already consumed.
+            batch_size: Number of rows to fetch from the cursor at once.
+
+        Yields:
+            The events of the given params.
+        """
+        query = self._keyset_query(userIds, start_date, end_date, after)
+
+        result = await session.stream(query.execution_options(yield_per=batch_size))
+        async for row in result.mappings():
+            yield Event(**row)
+
+    @validate_call
+    async def get_event_counts_json(
+        self,
+        session: InstanceOf[AsyncSession],
+        userIds: list[str] | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> bytes:
+        """Get the number of events of each date as a JSON array.
+
+        Only the counts are computed by the database, so the bodies of the events
+        are not transferred.
+
+        Arguments:
+            session: The database session to connect to db.
+            userIds: The user ids array to filter the db.
+            start_date: Start date to filter the db.
+            end_date: End date to filter the db.
+
+        Returns:
+            The JSON array of `{"date", "count"}` objects ordered by date. It is
+            empty if there is no event.
+        """
+        occurrences = self._occurrences(userIds, start_date, end_date)
+        query = (
+            select(occurrences.c.date, func.count().label("count"))
+            .group_by(occurrences.c.date)
+            .order_by(occurrences.c.date)
+        )
+        rows = (await session.execute(query)).tuples().all()
+
+        return orjson.dumps(
+            [{"date": event_date, "count": count} for event_date, count in rows]
+        )
+
+    @validate_call
+    async def get_grouped_events(
+        self,
+        session: InstanceOf[AsyncSession],
+        group_by: EventGroupBy,
+        userIds: list[str] | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        after_id: Annotated[int, Field(ge=0)] | None = None,
+        etag: str | None = None,
+    ) -> bytes:
+        """Get events which are grouped and ordered by the database.
+
+        The whole JSON document is built by a single query, so the events are not
+        loaded into python objects. The document is read through the cache.
+
+        Arguments:
+            session: The database session to connect to db.
+            group_by: The field to group events by.
+            userIds: The user ids array to filter the db.
+            start_date: Start date to filter the db.
+            end_date: End date to filter the db.
+            after_id: Only the events whose ids are greater than it are returned.
+                It lets the clients fetch the events created after a snapshot.
+            etag: The entity tag of the listing if it is already computed.
+
+        Returns:
+            JSON object of the groups. The keys are ordered and the events of each
+            group are ordered by `(date, time, id)`.
+        """
+        etag = etag or await self.get_events_etag(
+            userIds, start_date, end_date, group_by, after_id, session=session
+        )
+
+        async def fetch() -> bytes:
+            return await self._fetch_grouped_events_json(
+                session, group_by, userIds, start_date, end_date, after_id
+            )
+
+        return await self._read_through(etag, fetch)
+
+    async def _fetch_grouped_events_json(
+        self,
+        session: AsyncSession,
+        group_by: EventGroupBy,
+        userIds: list[str] | None,
+        start_date: date | None,
+        end_date: date | None,
+        after_id: int | None,
+    ) -> bytes:
+        """Build the grouped events document by the database."""
+        occurrences = self._occurrences(userIds, start_date, end_date, after_id)
+        key = (
+            occurrences.c.userId
+            if group_by == EventGroupBy.USER
+            else occurrences.c.date
+        )
+        event_json = func.json_build_object(
+            *(item for field in EVENT_FIELDS for item in (field, occurrences.c[field]))
+        )
+
+        groups = (
+            select(
+                key.label("key"),
+                func.json_agg(
+                    aggregate_order_by(
+                        event_json,
+                        occurrences.c.date,
+                        occurrences.c.time,
+                        occurrences.c.id,
+                    )
+                ).label("events"),
+            )
+            .group_by(key)
+            .subquery()
+        )
+
+        query = select(
+            func.coalesce(
+                cast(
+                    func.json_object_agg(
+                        groups.c.key, aggregate_order_by(groups.c.events, groups.c.key)
+                    ),
+                    Text,
+                ),
+                literal("{}"),
+            )
+        )
+
+        return (await session.execute(query)).scalar_one().encode()
+
+    @staticmethod
+    async def _dump_rows(session: AsyncSession, query: Select) -> bytes:
+        """Fetch the event columns of the query and serialize them in one pass.
+
+        Raises:
+            NotFoundException: If there is no row found.
+        """
+        rows = (await session.execute(query)).tuples().all()
+
+        if not rows:
             raise NotFoundException("Event not found!")
 
+        return orjson.dumps([dict(zip(EVENT_FIELDS, row, strict=True)) for row in rows])
+
+    async def _read_through(
+        self, key: str | None, fetch: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """Get the value of the key from the cache or fetch and store it."""
+        if self.cache is None or key is None:
+            return await fetch()
+
+        cached: bytes | None = await self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result: bytes = await fetch()
+        await self.cache.set(key, result)
+
         return result
+
+    async def handle_change(self, payload: str) -> None:
+        """Invalidate the cached listings of the user of a change notification.
+
+        It is the handler of the notifications which the database triggers send, so
+        the writes of the other workers and clients invalidate the local cache too.
+
+        Arguments:
+            payload: The JSON payload of an `EventChangeSchema`.
+        """
+        if self.cache is None:
+            return
+
+        change = EventChangeSchema.model_validate_json(payload)
+        await self.cache.bump_versions(self._version_names({change.userId}))
+
+    def _invalidate_on_commit(self, session: AsyncSession, userIds: set[str]) -> None:
+        """Invalidate the cached listings of the given users after the commit.
+
+        If the service is replicated, the WAL position of the commit is recorded
+        before the versions are bumped, so no reader sees the new versions without
+        the position.
+        """
+        if self.cache is None or not userIds:
+            return
+
+        cache: BaseCacheBackend = self.cache
+        version_names: list[str] = self._version_names(userIds)
+        replicated: bool = self.replicated
+
+        async def invalidate() -> None:
+            if replicated:
+                position: int = (
+                    await session.execute(select(WRITTEN_POSITION))
+                ).scalar_one()
+                await cache.advance_positions(version_names, position)
+            await cache.bump_versions(version_names)
+
+        add_after_commit_hook(session, invalidate)
+
+    @staticmethod
+    async def _is_replayed(
+        cache: BaseCacheBackend, session: AsyncSession, version_names: list[str]
+    ) -> bool:
+        """Check whether the server of the session has the latest writes of names."""
+        position: int = max(await cache.get_positions(version_names))
+        if not position:
+            return True
+
+        replayed: int | None = (
+            await session.execute(select(REPLAYED_POSITION))
+        ).scalar_one()
+        return replayed is None or replayed >= position
+
+    @classmethod
+    def _version_names(cls, userIds: set[str]) -> list[str]:
+        """Get the cache versions which the listings of the given users depend on."""
+        return [cls.ALL_USERS_VERSION, *(f"user:{user}" for user in sorted(userIds))]
+
+    @classmethod
+    def _keyset_query(
+        cls,
+        userIds: list[str] | None,
+        start_date: date | None,
+        end_date: date | None,
+        after: EventCursor | None,
+    ) -> Select:
+        """Build the filtered occurrences query that is ordered by the keyset."""
+        occurrences = cls._occurrences(userIds, start_date, end_date)
+        keyset = (occurrences.c.date, occurrences.c.time, occurrences.c.id)
+        query = select(*occurrences.c)
+
+        if after:
+            query = query.where(
+                tuple_(*keyset) > tuple_(after.date, after.time, after.id)
+            )
+
+        return query.order_by(*keyset)
+
+    @classmethod
+    def _occurrences(
+        cls,
+        userIds: list[str] | None,
+        start_date: date | None,
+        end_date: date | None,
+        after_id: int | None = None,
+        users: TableValuedAlias | None = None,
+    ) -> Subquery:
+        """Build the occurrences of the events in the date range.
+
+        Single events are filtered as they are. The recurring events whose series
+        overlap the range are found by `ix_event_recurrence`, and each of them is
+        expanded by `generate_series` only within the range, so the cost depends on
+        the number of the occurrences in the range. The series which do not end are
+        expanded up to `RECURRENCE_HORIZON` if the range is open-ended.
+
+        Arguments:
+            userIds: The user ids array to filter the db.
+            start_date: Start date of the range.
+            end_date: End date of the range.
+            after_id: Only the events whose ids are greater than it are returned.
+            users: The table of the user ids to join instead of `userIds`.
+
+        Returns:
+            The subquery of the occurrences with the columns of the event table.
+        """
+        columns = tuple(Event.__table__.c)
+        single = cls._filter_query(
+            select(*columns).where(Event.frequency.is_(None)),
+            userIds,
+            start_date,
+            end_date,
+            after_id,
+        )
+
+        upper: date = end_date or (start_date or date.today()) + RECURRENCE_HORIZON
+        first = func.greatest(Event.date, literal(start_date, Date))
+        last = func.least(Event.until, literal(upper, Date))
+
+        monthly = Event.frequency.in_(
+            (RecurrenceFrequency.MONTHLY.value, RecurrenceFrequency.YEARLY.value)
+        )
+        step = Event.interval * case(
+            (Event.frequency == RecurrenceFrequency.WEEKLY.value, 7),
+            (Event.frequency == RecurrenceFrequency.YEARLY.value, 12),
+            else_=1,
+        )
+
+        def offset(day):
+            """Number of days or months between the first occurrence and the day."""
+            return case(
+                (monthly, cls._month_index(day) - cls._month_index(Event.date)),
+                else_=cast(day - Event.date, Integer),
+            )
+
+        steps = (
+            func.generate_series(offset(first) // step, offset(last) // step)
+            .table_valued("n", joins_implicitly=True)
+            .render_derived(name="steps")
+        )
+        occurrence = case(
+            (
+                monthly,
+                cast(Event.date + func.make_interval(0, steps.c.n * step), Date),
+            ),
+            else_=Event.date + steps.c.n * step,
+        )
+
+        recurring = cls._filter_query(
+            select(
+                *(occurrence.label("date") if c.key == "date" else c for c in columns)
+            )
+            .select_from(Event)
+            .where(
+                Event.frequency.is_not(None),
+                cls._series_range(Event.date, Event.until).op("&&")(
+                    cls._series_range(literal(start_date, Date), literal(upper, Date))
+                ),
+                occurrence >= first,
+                occurrence <= last,
+            ),
+            userIds,
+            None,
+            None,
+            after_id,
+        )
+
+        if users is not None:
+            single = single.join(users, users.c.userId == Event.userId)
+            recurring = recurring.join(users, users.c.userId == Event.userId)
+
+        return union_all(single, recurring).subquery("occurrences")
+
+    @staticmethod
+    def _series_range(lower: Any, upper: Any) -> Any:
+        """Build the inclusive date range which matches `ix_event_recurrence`."""
+        return func.daterange(lower, upper, literal_column("'[]'"))
+
+    @staticmethod
+    def _month_index(day: Any) -> Any:
+        """Build the number of months since the year zero of the day."""
+        return cast(
+            func.extract("year", day) * 12 + func.extract("month", day), Integer
+        )
+
+    @staticmethod
+    def _recurrence_values(start: date, rrule: RecurrenceRule | None) -> dict[str, Any]:
+        """Get the recurrence columns of an event which starts at the given date."""
+        if rrule is None:
+            return {"frequency": None, "interval": None, "until": None}
+
+        return {
+            "frequency": rrule.frequency.value,
+            "interval": rrule.interval,
+            "until": rrule.last_date(start),
+        }
+
+    @staticmethod
+    def _filter_query(
+        query: QueryT,
+        userIds: list[str] | None,
+        start_date: date | None,
+        end_date: date | None,
+        after_id: int | None = None,
+    ) -> QueryT:
+        """Apply the common event filters to the given query."""
+        if userIds:
+            query = query.where(Event.userId.in_(userIds))
+
+        if after_id is not None:
+            query = query.where(Event.id > after_id)
+
+        if start_date:
+            query = query.where(Event.date >= start_date)
+
+        if end_date:
+            query = query.where(Event.date <= end_date)
+
+        return query
@@ -3,6 +3,8 @@
 from functools import lru_cache
 
 from service.event_service import EventService
+from src.cache import BaseCacheBackend, MemoryCacheBackend, RedisCacheBackend
+from src.core import configuration
 
 
 class ServiceFactory:
@@ -12,4 +14,20 @@ class ServiceFactory:
     @lru_cache
     def create_event_service() -> EventService:
         """Create event service(Singleton.)."""
-        return EventService()
+        return EventService(
+            cache=ServiceFactory.create_cache_backend(),
+            replicated=bool(configuration.DB.REPLICA_HOSTS),
+        )
+
+    @staticmethod
+    @lru_cache
+    def create_cache_backend() -> BaseCacheBackend:
+        """Create the configured cache backend(Singleton.)."""
+        if configuration.CACHE.BACKEND == "redis":
+            return RedisCacheBackend(
+                url=str(configuration.CACHE.REDIS_URL), ttl=configuration.CACHE.TTL
+            )
+
+        return MemoryCacheBackend(
+            max_size=configuration.CACHE.MAX_SIZE, ttl=configuration.CACHE.TTL
+        )
@@ -31,6 +31,14 @@ class TestDatabaseSessionManager(BaseSessionManager):
                 await session.rollback()
                 await session.close()
 
+    @asynccontextmanager
+    async def get_read_session(
+        self, transactional: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Provide a database session for read only queries."""
+        async with self.get_session() as session:
+            yield session
+
 
 session_manager: TestDatabaseSessionManager = TestDatabaseSessionManager(
     str(configuration.DB.psql_url)
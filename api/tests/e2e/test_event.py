@@ -1,6 +1,7 @@
 """E2E tests for events."""
 
 from json import loads
+from uuid import uuid4
 
 class TestE2EEvent:
     def test_should_create_and_fetch(self, client):
@@ -25,3 +26,344 @@ class TestE2EEvent:
         result = loads(response_get.text)
         assert len(result) >= 1
 
+
+    def test_should_fetch_events_page_by_page(self, client):
+        for hour in (10, 11, 12):
+            response_create = client.post(
+                "/event/",
+                json={
+                    "userId": "user-page-123",
+                    "date": "2025-04-15",
+                    "time": f"{hour}:00",
+                    "description": "Test Description"
+                }
+            )
+            assert response_create.status_code == 201
+
+        response_first = client.get(
+            "/event/", params={"userIds": "user-page-123", "limit": 2}
+        )
+
+        assert response_first.status_code == 200
+        assert len(loads(response_first.text)) == 2
+        assert "X-Next-Cursor" in response_first.headers
+
+        response_second = client.get(
+            "/event/",
+            params={
+                "userIds": "user-page-123",
+                "limit": 2,
+                "cursor": response_first.headers["X-Next-Cursor"],
+            },
+        )
+
+        assert response_second.status_code == 200
+        assert len(loads(response_second.text)) >= 1
+
+    def test_should_reject_malformed_cursor(self, client):
+        response = client.get("/event/", params={"limit": 2, "cursor": "invalid!"})
+
+        assert response.status_code == 400
+
+    def test_should_stream_events_as_ndjson(self, client):
+        response_create = client.post(
+            "/event/",
+            json={
+                "userId": "user-stream-123",
+                "date": "2025-04-16",
+                "time": "09:30",
+                "description": "Test Description"
+            }
+        )
+        assert response_create.status_code == 201
+
+        response = client.get(
+            "/event/stream", params={"userIds": "user-stream-123"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        rows = [loads(line) for line in response.text.splitlines()]
+        assert len(rows) >= 1
+        assert all(row["userId"] == "user-stream-123" for row in rows)
+
+    def test_should_create_in_bulk(self, client):
+        response = client.post(
+            "/event/bulk",
+            json={
+                "events": [
+                    {
+                        "userId": "user-bulk-e2e-123",
+                        "date": "2025-04-17",
+                        "time": "08:00",
+                        "description": "Test Description",
+                    },
+                    {"userId": "user-bulk-e2e-123", "date": "invalid"},
+                    {
+                        "userId": "user-bulk-e2e-123",
+                        "date": "2025-04-17",
+                        "time": "09:00",
+                        "description": "Test Description",
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 207
+
+        results = loads(response.text)["results"]
+        assert [result["status"] for result in results] == [201, 422, 201]
+        assert results[0]["id"] < results[2]["id"]
+        assert results[1]["id"] is None
+        assert results[1]["detail"]
+
+    def test_should_return_created_if_every_item_is_valid(self, client):
+        response = client.post(
+            "/event/bulk",
+            json={
+                "events": [
+                    {
+                        "userId": "user-bulk-e2e-124",
+                        "date": "2025-04-17",
+                        "time": "08:00",
+                        "description": "Test Description",
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 201
+
+    def test_should_fetch_grouped_events(self, client):
+        for user_id in ("user-grouped-2", "user-grouped-1"):
+            response_create = client.post(
+                "/event/",
+                json={
+                    "userId": user_id,
+                    "date": "2025-04-18",
+                    "time": "07:00",
+                    "description": "Test Description"
+                }
+            )
+            assert response_create.status_code == 201
+
+        response = client.get(
+            "/event/grouped",
+            params={
+                "by": "userId",
+                "userIds": ["user-grouped-1", "user-grouped-2"],
+                "start_date": "2025-04-18",
+                "end_date": "2025-04-18",
+            },
+        )
+
+        assert response.status_code == 200
+        result = loads(response.text)
+        assert list(result)[:2] == ["user-grouped-1", "user-grouped-2"]
+
+    def test_should_invalidate_cached_listing_after_create(self, client):
+        params = {"userIds": "user-cache-e2e-123"}
+        event = {
+            "userId": "user-cache-e2e-123",
+            "date": "2025-04-19",
+            "time": "07:00",
+            "description": "Test Description",
+        }
+
+        assert client.post("/event/", json=event).status_code == 201
+        first = client.get("/event/", params=params)
+        assert client.get("/event/", params=params).text == first.text
+
+        assert client.post("/event/", json=event).status_code == 201
+        second = client.get("/event/", params=params)
+
+        assert len(loads(second.text)) == len(loads(first.text)) + 1
+
+    def test_should_answer_not_modified_if_etag_matches(self, client):
+        params = {"userIds": "user-etag-e2e-123", "by": "date"}
+        event = {
+            "userId": "user-etag-e2e-123",
+            "date": "2025-04-20",
+            "time": "07:00",
+            "description": "Test Description",
+        }
+
+        assert client.post("/event/", json=event).status_code == 201
+        first = client.get("/event/grouped", params=params)
+        etag = first.headers["ETag"]
+
+        not_modified = client.get(
+            "/event/grouped", params=params, headers={"If-None-Match": etag}
+        )
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+        assert client.post("/event/", json=event).status_code == 201
+        modified = client.get(
+            "/event/grouped", params=params, headers={"If-None-Match": etag}
+        )
+        assert modified.status_code == 200
+        assert modified.headers["ETag"] != etag
+
+        listing = client.get("/event/", params={"userIds": "user-etag-e2e-123"})
+        assert client.get(
+            "/event/",
+            params={"userIds": "user-etag-e2e-123"},
+            headers={"If-None-Match": f'W/"other", {listing.headers["ETag"]}'},
+        ).status_code == 304
+
+
+    def test_should_search_events_of_many_users(self, client):
+        response_create = client.post(
+            "/event/",
+            json={
+                "userId": "user-search-123",
+                "date": "2025-06-01",
+                "time": "09:00",
+                "description": "Test Description"
+            }
+        )
+        assert response_create.status_code == 201
+
+        response_search = client.post(
+            "/event/search",
+            json={
+                "userIds": [f"user-search-{i}" for i in range(2000)],
+                "start_date": "2025-06-01",
+                "end_date": "2025-06-01",
+            },
+        )
+
+        assert response_search.status_code == 200
+        result = loads(response_search.text)
+        assert {event["userId"] for event in result} == {"user-search-123"}
+
+
+    def test_should_fetch_event_counts(self, client):
+        for hour in (10, 11):
+            response_create = client.post(
+                "/event/",
+                json={
+                    "userId": "user-summary-123",
+                    "date": "2025-07-01",
+                    "time": f"{hour}:00",
+                    "description": "Test Description"
+                }
+            )
+            assert response_create.status_code == 201
+
+        response_summary = client.get(
+            "/event/summary",
+            params={
+                "userIds": "user-summary-123",
+                "start_date": "2025-07-01",
+                "end_date": "2025-07-01",
+            },
+        )
+
+        assert response_summary.status_code == 200
+        result = loads(response_summary.text)
+        assert len(result) == 1
+        assert result[0]["date"] == "2025-07-01"
+        assert result[0]["count"] >= 2
+
+
+    def test_should_create_recurring_event(self, client):
+        response_create = client.post(
+            "/event/",
+            json={
+                "userId": "user-rrule-123",
+                "date": "2025-08-04",
+                "time": "09:00",
+                "description": "Weekly meeting",
+                "rrule": "FREQ=WEEKLY;COUNT=3",
+            }
+        )
+        assert response_create.status_code == 201
+
+        response_get = client.get(
+            "/event/",
+            params={
+                "userIds": "user-rrule-123",
+                "start_date": "2025-08-05",
+                "end_date": "2025-08-31",
+            },
+        )
+
+        assert response_get.status_code == 200
+        result = loads(response_get.text)
+        assert {event["date"] for event in result} == {"2025-08-11", "2025-08-18"}
+
+
+    def test_should_reject_unsupported_rrule(self, client):
+        response_create = client.post(
+            "/event/",
+            json={
+                "userId": "user-rrule-123",
+                "date": "2025-08-04",
+                "time": "09:00",
+                "description": "Weekly meeting",
+                "rrule": "FREQ=WEEKLY;BYDAY=MO",
+            }
+        )
+
+        assert response_create.status_code == 422
+
+
+    def test_should_reject_overflowing_rrule_per_item(self, client):
+        event = {
+            "userId": f"user-rrule-{uuid4()}",
+            "date": "2025-08-04",
+            "time": "09:00",
+            "description": "Overflowing series",
+        }
+
+        response_create = client.post(
+            "/event/", json={**event, "rrule": "FREQ=YEARLY;INTERVAL=1000;COUNT=10000"}
+        )
+        response_bulk = client.post(
+            "/event/bulk",
+            json={
+                "events": [
+                    {**event, "rrule": "FREQ=DAILY;INTERVAL=1000;COUNT=10000"},
+                    {**event, "rrule": "FREQ=DAILY;COUNT=2"},
+                ]
+            },
+        )
+
+        assert response_create.status_code == 422
+        assert response_bulk.status_code == 207
+        results = loads(response_bulk.text)["results"]
+        assert [result["status"] for result in results] == [422, 201]
+
+
+    def test_should_fetch_changes_after_cursor(self, client):
+        user_id = f"user-changes-{uuid4()}"
+        for description in ("first", "second"):
+            response_create = client.post(
+                "/event/",
+                json={
+                    "userId": user_id,
+                    "date": "2025-09-01",
+                    "time": "09:00",
+                    "description": description,
+                }
+            )
+            assert response_create.status_code == 201
+
+        response_first = client.get("/event/changes", params={"userIds": user_id, "limit": 1})
+        response_second = client.get(
+            "/event/changes",
+            params={"userIds": user_id, "since": response_first.headers["X-Next-Cursor"]},
+        )
+        response_empty = client.get(
+            "/event/changes",
+            params={"userIds": user_id, "since": response_second.headers["X-Next-Cursor"]},
+        )
+
+        assert response_first.status_code == 200
+        assert [change["data"]["description"] for change in loads(response_first.text)] == ["first"]
+        assert [change["data"]["description"] for change in loads(response_second.text)] == ["second"]
+        assert loads(response_empty.text) == []
+        assert response_empty.headers["X-Next-Cursor"] == response_second.headers["X-Next-Cursor"]
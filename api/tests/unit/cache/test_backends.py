@@ -0,0 +1,104 @@
+"""Unit tests for cache backends."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.cache import MemoryCacheBackend, RedisCacheBackend
+from src.core import configuration
+
+
+class TestMemoryCacheBackend:
+    async def test_should_get_the_value_which_is_set(self):
+        cache = MemoryCacheBackend(max_size=2, ttl=60)
+        await cache.set("key", b"value")
+
+        assert await cache.get("key") == b"value"
+        assert await cache.get("missing") is None
+
+    async def test_should_evict_the_least_recently_used_entry(self):
+        cache = MemoryCacheBackend(max_size=2, ttl=60)
+        await cache.set("key1", b"value1")
+        await cache.set("key2", b"value2")
+        await cache.get("key1")
+        await cache.set("key3", b"value3")
+
+        assert await cache.get("key1") == b"value1"
+        assert await cache.get("key2") is None
+        assert await cache.get("key3") == b"value3"
+
+    async def test_should_expire_entries(self):
+        cache = MemoryCacheBackend(max_size=2, ttl=0)
+        await cache.set("key", b"value")
+
+        assert await cache.get("key") is None
+
+    async def test_should_bump_versions(self):
+        cache = MemoryCacheBackend(max_size=2, ttl=60)
+        [base] = await cache.get_versions(["user:2"])
+        await cache.bump_versions(["user:1", "users:*"])
+        await cache.bump_versions(["user:1"])
+
+        assert await cache.get_versions(["user:1", "users:*", "user:2"]) == [
+            base + 2,
+            base + 1,
+            base,
+        ]
+
+    async def test_should_not_repeat_versions_after_restart(self):
+        names = ["user:1"]
+
+        versions = [
+            await MemoryCacheBackend(max_size=2, ttl=60).get_versions(names)
+            for _ in range(2)
+        ]
+
+        assert versions[0] != versions[1]
+
+    async def test_should_only_advance_positions(self):
+        cache = MemoryCacheBackend(max_size=2, ttl=60)
+        await cache.advance_positions(["user:1", "users:*"], 20)
+        await cache.advance_positions(["user:1"], 10)
+
+        assert await cache.get_positions(["user:1", "users:*", "user:2"]) == [20, 20, 0]
+
+
+class TestRedisCacheBackend:
+    @pytest.fixture
+    async def cache(self):
+        cache = RedisCacheBackend(
+            url=str(configuration.CACHE.REDIS_URL), ttl=60, prefix=f"test-{uuid4()}"
+        )
+        yield cache
+        await cache.redis.aclose()
+
+    async def test_should_get_the_value_which_is_set(self, cache):
+        await cache.set("key", b"value")
+
+        assert await cache.get("key") == b"value"
+        assert await cache.get("missing") is None
+
+    async def test_should_bump_versions(self, cache):
+        await cache.bump_versions(["user:1", "users:*"])
+        [user, users] = await cache.get_versions(["user:1", "users:*"])
+        await cache.bump_versions(["user:1"])
+
+        assert await cache.get_versions(["user:1", "users:*"]) == [user + 1, users]
+        assert await cache.get_versions(["user:2"]) == await cache.get_versions(
+            ["user:2"]
+        )
+
+    async def test_should_not_repeat_evicted_versions(self, cache):
+        [before] = await cache.get_versions(["user:1"])
+        await cache.bump_versions(["user:1"])
+        await cache.redis.delete(f"{cache.prefix}:version:user:1")
+
+        [after] = await cache.get_versions(["user:1"])
+
+        assert after not in (before, before + 1, 0)
+
+    async def test_should_only_advance_positions(self, cache):
+        await cache.advance_positions(["user:1", "users:*"], 20)
+        await cache.advance_positions(["user:1"], 10)
+
+        assert await cache.get_positions(["user:1", "users:*", "user:2"]) == [20, 20, 0]
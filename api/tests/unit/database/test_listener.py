@@ -0,0 +1,63 @@
+"""Unit tests for notification listener module."""
+
+import asyncio
+
+import asyncpg
+import pytest
+
+from src.core import configuration
+from src.database.listener import NotificationListener
+
+URL = str(configuration.DB.psql_url).replace("+asyncpg", "")
+CHANNEL = "test_channel"
+
+
+class TestNotificationListener:
+    @pytest.fixture
+    async def received(self):
+        payloads: asyncio.Queue[str] = asyncio.Queue()
+        listener = NotificationListener(
+            url=URL + "?application_name=listener",
+            channel=CHANNEL,
+            handler=payloads.put,
+            reconnect_delay=0,
+            keepalive=0.05,
+        )
+        listener.start()
+        await asyncio.wait_for(listener.listening.wait(), timeout=5)
+        yield listener, payloads
+        await listener.stop()
+
+    async def notify(self, payload: str) -> None:
+        connection = await asyncpg.connect(URL)
+        try:
+            await connection.execute("SELECT pg_notify($1, $2)", CHANNEL, payload)
+        finally:
+            await connection.close()
+
+    async def test_should_pass_payloads_to_handler(self, received):
+        _, payloads = received
+
+        await self.notify("first")
+        await self.notify("second")
+
+        assert await asyncio.wait_for(payloads.get(), timeout=5) == "first"
+        assert await asyncio.wait_for(payloads.get(), timeout=5) == "second"
+
+    async def test_should_reconnect_if_connection_is_lost(self, received):
+        listener, payloads = received
+
+        connection = await asyncpg.connect(URL)
+        try:
+            await connection.execute(
+                "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                "WHERE application_name = 'listener'"
+            )
+        finally:
+            await connection.close()
+        await asyncio.sleep(0.2)
+        await asyncio.wait_for(listener.listening.wait(), timeout=5)
+
+        await self.notify("after")
+
+        assert await asyncio.wait_for(payloads.get(), timeout=5) == "after"
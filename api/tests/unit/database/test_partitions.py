@@ -0,0 +1,212 @@
+"""Unit tests for partition maintenance module."""
+
+import gzip
+from argparse import Namespace
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from src.database import partitions
+from src.database.partitions import (
+    add_months,
+    create_ahead,
+    create_partition,
+    enable,
+    get_partitions,
+    is_partitioned,
+    partition_month,
+    partition_name,
+    retain,
+)
+
+from ...database import session_manager
+
+
+class TestPartitionHelpers:
+    @pytest.mark.parametrize(
+        "month, months, expected",
+        [
+            (date(2025, 1, 15), 1, date(2025, 2, 1)),
+            (date(2025, 12, 1), 1, date(2026, 1, 1)),
+            (date(2025, 1, 1), -1, date(2024, 12, 1)),
+            (date(2025, 3, 31), -14, date(2024, 1, 1)),
+        ],
+    )
+    def test_should_add_months(self, month, months, expected):
+        assert add_months(month, months) == expected
+
+    def test_should_convert_between_partition_name_and_month(self):
+        name = partition_name(date(2025, 4, 1))
+
+        assert name == "event_p202504"
+        assert partition_month(name) == date(2025, 4, 1)
+
+    @pytest.mark.parametrize("name", ["event_default", "event_p2025", "other_p202504"])
+    def test_should_ignore_other_tables(self, name):
+        assert partition_month(name) is None
+
+
+@pytest.fixture
+async def conn():
+    await session_manager.engine.dispose()
+    async with session_manager.engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await transaction.rollback()
+
+
+async def insert_event(
+    conn,
+    event_date: date,
+    description: str = "partition",
+    frequency: str | None = None,
+    until: date | None = None,
+) -> None:
+    await conn.execute(
+        text(
+            'INSERT INTO event ("userId", date, time, description, frequency, '
+            "interval, until) VALUES ('user-partition', :date, '09:00', :description, "
+            ":frequency, :interval, :until)"
+        ),
+        {
+            "date": event_date,
+            "description": description,
+            "frequency": frequency,
+            "interval": None if frequency is None else 1,
+            "until": until,
+        },
+    )
+
+
+async def partition_of(conn, description: str) -> str:
+    return (
+        await conn.execute(
+            text("SELECT tableoid::regclass::text FROM event WHERE description = :d"),
+            {"d": description},
+        )
+    ).scalar_one()
+
+
+class TestPartitionCommands:
+    async def test_should_partition_the_event_table(self, conn):
+        await insert_event(conn, date(2024, 1, 10), "january")
+        count = (await conn.execute(text("SELECT count(*) FROM event"))).scalar_one()
+
+        await enable(conn, months_ahead=1, today=date(2024, 2, 1))
+        await enable(conn, months_ahead=1, today=date(2024, 2, 1))
+
+        partitions = await get_partitions(conn)
+        assert await is_partitioned(conn)
+        assert {"event_default", "event_p202401", "event_p202402"} <= set(partitions)
+        assert (
+            await conn.execute(text("SELECT count(*) FROM event"))
+        ).scalar_one() == count
+        assert await partition_of(conn, "january") == "event_p202401"
+
+    async def test_should_move_rows_out_of_the_default_partition(self, conn):
+        await enable(conn, months_ahead=0, today=date(2024, 1, 1))
+        await insert_event(conn, date(2099, 5, 5), "future")
+        assert await partition_of(conn, "future") == "event_default"
+
+        assert await create_partition(conn, date(2099, 5, 1))
+        assert not await create_partition(conn, date(2099, 5, 1))
+        await create_ahead(conn, months=1, today=date(2099, 5, 20))
+
+        assert await partition_of(conn, "future") == "event_p209905"
+        assert "event_p209906" in await get_partitions(conn)
+
+    async def test_should_detach_old_partitions(self, conn):
+        await insert_event(conn, date(2024, 1, 10), "detached")
+        await enable(conn, months_ahead=0, today=date(2024, 1, 1))
+
+        await retain(conn, keep_months=1, today=date(2024, 3, 1), archive_dir=None)
+
+        assert "event_p202401" not in await get_partitions(conn)
+        assert (
+            await conn.execute(text("SELECT description FROM event_p202401"))
+        ).scalar_one() == "detached"
+
+    async def test_should_archive_and_drop_old_partitions(self, conn, tmp_path):
+        await insert_event(conn, date(2024, 1, 10), "archived")
+        await enable(conn, months_ahead=0, today=date(2024, 1, 1))
+
+        await retain(conn, keep_months=1, today=date(2024, 3, 1), archive_dir=tmp_path)
+
+        with gzip.open(tmp_path / "event_p202401.csv.gz", "rt") as archive:
+            assert "archived" in archive.read()
+        assert (
+            await conn.execute(text("SELECT to_regclass('event_p202401')"))
+        ).scalar_one() is None
+
+    async def test_should_keep_the_series_which_are_still_recurring(
+        self, conn, tmp_path
+    ):
+        await insert_event(conn, date(2024, 1, 10), "endless", "DAILY")
+        await insert_event(
+            conn, date(2024, 1, 10), "running", "WEEKLY", date(2024, 6, 1)
+        )
+        await insert_event(conn, date(2024, 1, 10), "ended", "DAILY", date(2024, 1, 20))
+        await enable(conn, months_ahead=0, today=date(2024, 1, 1))
+
+        await retain(conn, keep_months=1, today=date(2024, 3, 1), archive_dir=tmp_path)
+
+        assert await partition_of(conn, "endless") == "event_default"
+        assert await partition_of(conn, "running") == "event_default"
+        assert not (
+            await conn.execute(text("SELECT 1 FROM event WHERE description = 'ended'"))
+        ).all()
+        with gzip.open(tmp_path / "event_p202401.csv.gz", "rt") as archive:
+            content = archive.read()
+        assert "ended" in content
+        assert "endless" not in content and "running" not in content
+
+        assert await create_partition(conn, date(2024, 1, 1))
+        assert await partition_of(conn, "endless") == "event_p202401"
+
+
+class TestPartitionsMain:
+    def test_should_parse_the_commands(self):
+        parser = partitions.build_parser()
+
+        assert parser.parse_args(["enable"]).months == 3
+        assert parser.parse_args(["create-ahead", "--months", "6"]).months == 6
+        args = parser.parse_args(
+            ["retain", "--keep-months", "12", "--archive-dir", "/a"]
+        )
+        assert (args.keep_months, str(args.archive_dir)) == (12, "/a")
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        calls = []
+
+        async def record(name, *args):
+            calls.append(name)
+
+        monkeypatch.setattr(partitions, "enable", lambda *a: record("enable"))
+        monkeypatch.setattr(
+            partitions, "create_ahead", lambda *a: record("create-ahead")
+        )
+        monkeypatch.setattr(partitions, "retain", lambda *a: record("retain"))
+        return calls
+
+    @pytest.mark.parametrize("command", ["enable", "create-ahead", "retain"])
+    async def test_should_run_the_command(self, calls, monkeypatch, command):
+        async def partitioned(conn):
+            return True
+
+        monkeypatch.setattr(partitions, "is_partitioned", partitioned)
+
+        await partitions.main(
+            Namespace(command=command, months=1, keep_months=1, archive_dir=None)
+        )
+
+        assert calls == [command]
+
+    async def test_should_require_a_partitioned_table(self, calls):
+        with pytest.raises(SystemExit):
+            await partitions.main(Namespace(command="retain"))
+
+        assert calls == []
@@ -0,0 +1,92 @@
+"""Unit tests for read replica module."""
+
+import pytest
+from sqlalchemy import text
+
+from src.core import configuration
+from src.database.replica import ReplicaConnector
+from src.database.session import DatabaseSessionManager
+
+PRIMARY_URL = str(configuration.DB.psql_url).replace("+asyncpg", "")
+DEAD_URL = PRIMARY_URL.replace(f":{configuration.DB.PORT}/", ":1/")
+REPLICA_URL = PRIMARY_URL + "?application_name=replica"
+
+
+class TestReplicaConnector:
+    async def test_should_rotate_replicas(self):
+        connector = ReplicaConnector(
+            replica_urls=[REPLICA_URL, PRIMARY_URL], primary_url=PRIMARY_URL
+        )
+
+        assert connector._candidates() == [REPLICA_URL, PRIMARY_URL]
+        assert connector._candidates() == [PRIMARY_URL, REPLICA_URL]
+        assert connector._candidates() == [REPLICA_URL, PRIMARY_URL]
+
+    async def test_should_skip_unhealthy_replica(self):
+        connector = ReplicaConnector(
+            replica_urls=[DEAD_URL, REPLICA_URL], primary_url=PRIMARY_URL
+        )
+
+        connection = await connector()
+        try:
+            assert await connection.fetchval("SHOW application_name") == "replica"
+        finally:
+            await connection.close()
+
+        assert connector._candidates() == [REPLICA_URL]
+
+    async def test_should_fallback_to_primary(self):
+        connector = ReplicaConnector(
+            replica_urls=[DEAD_URL], primary_url=PRIMARY_URL, cooldown=0
+        )
+
+        connection = await connector()
+        try:
+            assert await connection.fetchval("SELECT 1") == 1
+        finally:
+            await connection.close()
+
+
+class TestDatabaseSessionManager:
+    async def test_should_bind_read_sessions_to_replicas(self):
+        manager = DatabaseSessionManager(
+            str(configuration.DB.psql_url), replica_urls=[REPLICA_URL]
+        )
+
+        assert manager.read_engine is not manager.engine
+        async with manager.get_read_session() as session:
+            result = await session.execute(text("SHOW application_name"))
+            assert result.scalar_one() == "replica"
+        await manager.read_engine.dispose()
+        await manager.engine.dispose()
+
+    async def test_should_use_primary_without_replicas(self):
+        manager = DatabaseSessionManager(str(configuration.DB.psql_url))
+
+        assert manager.read_engine is manager.engine
+
+    async def test_should_not_connect_if_read_session_is_not_used(self):
+        manager = DatabaseSessionManager(str(configuration.DB.psql_url))
+
+        async with manager.get_read_session():
+            pass
+
+        assert manager.read_engine.pool.checkedin() == 0
+        assert manager.read_engine.pool.checkedout() == 0
+
+    async def test_should_run_read_sessions_in_autocommit_mode(self):
+        manager = DatabaseSessionManager(str(configuration.DB.psql_url))
+
+        async with manager.get_read_session() as session:
+            await session.execute(text("SELECT 1"))
+            connection = await (await session.connection()).get_raw_connection()
+            assert connection.driver_connection.is_in_transaction() is False
+        await manager.engine.dispose()
+
+    async def test_should_run_transactional_read_sessions_in_read_only_mode(self):
+        manager = DatabaseSessionManager(str(configuration.DB.psql_url))
+
+        async with manager.get_read_session(transactional=True) as session:
+            result = await session.execute(text("SHOW transaction_read_only"))
+            assert result.scalar_one() == "on"
+        await manager.engine.dispose()
@@ -0,0 +1,284 @@
+"""Unit tests for middleware module."""
+
+import gzip
+from base64 import b64encode
+
+import msgpack
+import pytest
+import zstandard
+from fastapi import Body, FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.middleware import Middleware
+
+from src.core import NotFoundException
+from src.core.exceptions import HttpException
+from src.middleware import (
+    BasicAuthMiddleware,
+    ContentNegotiationMiddleware,
+    GenericErrorHandlerMiddleware,
+    http_exception_handler,
+)
+from src.app import app as main_app
+from src.middleware.content import preferred
+
+
+def _authorization(username: str, password: str) -> str:
+    token = b64encode(f"{username}:{password}".encode()).decode()
+    return f"Basic {token}"
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI(
+        middleware=[
+            Middleware(GenericErrorHandlerMiddleware),
+            Middleware(
+                BasicAuthMiddleware,
+                username="user",
+                password="pass",
+                public_paths=frozenset({"/openapi.json"}),
+            ),
+        ],
+        exception_handlers={HttpException: http_exception_handler},
+    )
+
+    @app.get("/ok")
+    async def ok():
+        return {"message": "ok"}
+
+    @app.get("/not-found")
+    async def not_found():
+        raise NotFoundException("Event not found!")
+
+    @app.get("/error")
+    async def error():
+        raise RuntimeError("Unexpected!")
+
+    @app.get("/stream")
+    async def stream():
+        async def generate():
+            yield b"first\n"
+            yield b"second\n"
+        return StreamingResponse(generate())
+
+    with TestClient(app) as client:
+        yield client
+
+
+class TestBasicAuthMiddleware:
+    def test_should_pass_valid_credentials(self, client):
+        response = client.get(
+            "/ok", headers={"Authorization": _authorization("user", "pass")}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"message": "ok"}
+
+    def test_should_accept_case_insensitive_scheme(self, client):
+        token = _authorization("user", "pass").split(" ")[1]
+        response = client.get("/ok", headers={"Authorization": f"basic {token}"})
+
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {},
+            {"Authorization": _authorization("user", "wrong")},
+            {"Authorization": _authorization("wrong", "pass")},
+            {"Authorization": "Bearer token"},
+        ],
+    )
+    def test_should_reject_invalid_credentials(self, client, headers):
+        response = client.get("/ok", headers=headers)
+
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Unauthorized"}
+        assert response.headers["WWW-Authenticate"] == "Basic"
+
+    def test_should_not_check_public_paths(self, client):
+        assert client.get("/openapi.json").status_code == 200
+
+
+class TestGenericErrorHandlerMiddleware:
+    def test_should_map_http_exceptions(self, client):
+        response = client.get(
+            "/not-found", headers={"Authorization": _authorization("user", "pass")}
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Event not found!"}
+
+    def test_should_map_unexpected_exceptions(self, client):
+        response = client.get(
+            "/error", headers={"Authorization": _authorization("user", "pass")}
+        )
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Unexpected!"}
+
+    def test_should_not_buffer_streaming_responses(self, client):
+        with client.stream(
+            "GET", "/stream", headers={"Authorization": _authorization("user", "pass")}
+        ) as response:
+            assert list(response.iter_lines()) == ["first", "second"]
+
+
+@pytest.fixture(scope="module")
+def content_client():
+    app = FastAPI(
+        middleware=[
+            Middleware(ContentNegotiationMiddleware, minimum_size=100, max_body_size=1024)
+        ]
+    )
+
+    @app.get("/small")
+    async def small():
+        return {"message": "ok"}
+
+    @app.get("/large")
+    async def large():
+        return Response(
+            content=b'[' + b",".join([b'{"id":1,"description":"event"}'] * 20) + b']',
+            media_type="application/json",
+            headers={"ETag": '"tag"'},
+        )
+
+    @app.post("/echo")
+    async def echo(body: dict = Body(...)):
+        return body
+
+    @app.get("/stream")
+    async def stream():
+        async def generate():
+            yield b'{"id":1}\n' * 50
+            yield b'{"id":2}\n'
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    with TestClient(app) as client:
+        yield client
+
+
+class TestPreferred:
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            (None, None),
+            ("application/json", "application/json"),
+            ("application/msgpack, application/json;q=0.9", "application/msgpack"),
+            ("application/msgpack;q=0.5, application/json", "application/json"),
+            ("application/msgpack;q=0, */*", None),
+        ],
+    )
+    def test_should_choose_highest_quality(self, header, expected):
+        assert preferred(header, ("application/msgpack", "application/json")) == expected
+
+
+class TestContentNegotiationMiddleware:
+    def test_should_not_change_plain_json(self, content_client):
+        response = content_client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert response.headers["content-type"] == "application/json"
+        assert "content-encoding" not in response.headers
+        assert response.headers["ETag"] == '"tag"'
+        assert len(response.json()) == 20
+
+    def test_should_convert_to_msgpack(self, content_client):
+        response = content_client.get(
+            "/small",
+            headers={"Accept": "application/msgpack, application/json;q=0.9", "Accept-Encoding": "identity"},
+        )
+
+        assert response.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content) == {"message": "ok"}
+
+    @pytest.mark.parametrize(
+        "encoding, decompress",
+        [
+            ("zstd", lambda body: zstandard.ZstdDecompressor().decompress(body)),
+            ("gzip", gzip.decompress),
+        ],
+    )
+    def test_should_compress_large_responses(self, content_client, encoding, decompress):
+        with content_client.stream(
+            "GET", "/large", headers={"Accept": "application/msgpack", "Accept-Encoding": f"{encoding}, gzip;q=0.5"}
+        ) as response:
+            body = decompress(b"".join(response.iter_raw()))
+
+        assert response.headers["content-encoding"] == encoding
+        assert response.headers["ETag"] == 'W/"tag"'
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert len(msgpack.unpackb(body)) == 20
+
+    def test_should_not_compress_small_responses(self, content_client):
+        response = content_client.get("/small", headers={"Accept-Encoding": "zstd"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"message": "ok"}
+
+    def test_should_not_buffer_streaming_responses(self, content_client):
+        response = content_client.get("/stream", headers={"Accept-Encoding": "zstd"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text.count("\n") == 51
+
+    def test_should_decode_msgpack_and_compressed_bodies(self, content_client):
+        body = zstandard.ZstdCompressor().compress(msgpack.packb({"userId": "user1"}))
+        response = content_client.post(
+            "/echo",
+            content=body,
+            headers={"Content-Type": "application/msgpack", "Content-Encoding": "zstd"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"userId": "user1"}
+
+    def test_should_reject_malformed_bodies(self, content_client):
+        response = content_client.post(
+            "/echo",
+            content=b"not-gzip",
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "encoding, compress",
+        [
+            ("zstd", lambda body: zstandard.ZstdCompressor().compress(body)),
+            ("gzip", gzip.compress),
+        ],
+    )
+    def test_should_reject_bodies_larger_after_decompression(self, content_client, encoding, compress):
+        body = compress(b'{"description":"' + b"a" * 10_000 + b'"}')
+        response = content_client.post(
+            "/echo",
+            content=body,
+            headers={"Content-Type": "application/json", "Content-Encoding": encoding},
+        )
+
+        assert len(body) < 1024
+        assert response.status_code == 413
+
+    def test_should_reject_large_raw_bodies(self, content_client):
+        response = content_client.post(
+            "/echo",
+            content=msgpack.packb({"description": "a" * 2048}),
+            headers={"Content-Type": "application/msgpack"},
+        )
+
+        assert response.status_code == 413
+
+
+class TestApplicationMiddleware:
+    def test_should_authenticate_before_decoding_the_body(self):
+        client = TestClient(main_app)
+
+        response = client.post(
+            "/event/bulk",
+            content=b"not-gzip",
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 401
@@ -0,0 +1,123 @@
+"""Unit tests for event schemas."""
+
+from datetime import date, time
+
+import pytest
+from pydantic import ValidationError
+
+from src.core import BadRequestException
+from src.schemas import (
+    CreateEventSchema,
+    ChangeCursor,
+    EventCursor,
+    RecurrenceFrequency,
+    RecurrenceRule,
+)
+
+
+class TestEventCursor:
+    def test_should_decode_the_encoded_cursor(self):
+        cursor = EventCursor(date=date(2025, 1, 2), time=time(3, 4), id=5)
+
+        assert EventCursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("raw", ["not-base64!", "bm90LWpzb24=", "WzEsMl0=", "é"])
+    def test_should_throw_bad_request_if_cursor_is_malformed(self, raw):
+        with pytest.raises(BadRequestException):
+            EventCursor.decode(raw)
+
+
+class TestChangeCursor:
+    def test_should_decode_the_encoded_cursor(self):
+        cursor = ChangeCursor(txid=10, id=5)
+
+        assert ChangeCursor.decode(cursor.encode()) == cursor
+
+    def test_should_throw_bad_request_if_cursor_has_other_fields(self):
+        cursor = EventCursor(date=date(2025, 1, 2), time=time(3, 4), id=5)
+
+        with pytest.raises(BadRequestException):
+            ChangeCursor.decode(cursor.encode())
+
+
+class TestRecurrenceRule:
+    def test_should_parse_rrule(self):
+        rule = RecurrenceRule.model_validate(
+            "RRULE:FREQ=WEEKLY;INTERVAL=2;UNTIL=20250301T000000Z"
+        )
+
+        assert rule == RecurrenceRule(
+            frequency=RecurrenceFrequency.WEEKLY, interval=2, until=date(2025, 3, 1)
+        )
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "FREQ=HOURLY",
+            "FREQ=DAILY;BYDAY=MO",
+            "FREQ=DAILY;INTERVAL=0",
+            "FREQ=DAILY;COUNT=2;UNTIL=20250101",
+            "FREQ=DAILY;UNTIL=2025",
+        ],
+    )
+    def test_should_reject_unsupported_rules(self, raw):
+        with pytest.raises(ValidationError):
+            RecurrenceRule.model_validate(raw)
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("FREQ=DAILY;INTERVAL=3;COUNT=3", date(2025, 1, 7)),
+            ("FREQ=WEEKLY;COUNT=2", date(2025, 2, 7)),
+            ("FREQ=MONTHLY;COUNT=2", date(2025, 2, 28)),
+            ("FREQ=YEARLY;INTERVAL=2;COUNT=2", date(2027, 1, 31)),
+            ("FREQ=DAILY;UNTIL=20250205", date(2025, 2, 5)),
+            ("FREQ=DAILY", None),
+        ],
+    )
+    def test_should_compute_the_last_date(self, raw, expected):
+        start = date(2025, 1, 31) if "COUNT=2" in raw else date(2025, 1, 1)
+
+        assert RecurrenceRule.model_validate(raw).last_date(start) == expected
+
+    def test_should_reject_until_before_the_event(self):
+        with pytest.raises(ValidationError):
+            CreateEventSchema(
+                userId="1",
+                date=date(2025, 2, 1),
+                time=time(1, 1),
+                description="event",
+                rrule="FREQ=DAILY;UNTIL=20250101",
+            )
+
+    def test_should_resolve_the_count_to_until(self):
+        event = CreateEventSchema(
+            userId="1",
+            date=date(2025, 1, 1),
+            time=time(1, 1),
+            description="event",
+            rrule="FREQ=DAILY;INTERVAL=3;COUNT=3",
+        )
+
+        assert event.rrule == RecurrenceRule(
+            frequency=RecurrenceFrequency.DAILY, interval=3, until=date(2025, 1, 7)
+        )
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "FREQ=DAILY;INTERVAL=1000;COUNT=10000",
+            "FREQ=WEEKLY;INTERVAL=1000;COUNT=10000",
+            "FREQ=MONTHLY;INTERVAL=1000;COUNT=10000",
+            "FREQ=YEARLY;INTERVAL=1000;COUNT=10000",
+        ],
+    )
+    def test_should_reject_series_after_the_supported_dates(self, raw):
+        with pytest.raises(ValidationError):
+            CreateEventSchema(
+                userId="1",
+                date=date(2025, 1, 1),
+                time=time(1, 1),
+                description="event",
+                rrule=raw,
+            )
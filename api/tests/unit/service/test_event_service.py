@@ -5,13 +5,20 @@ from pydantic import InstanceOf
 import pytest
 
 from datetime import date, time
+from json import loads
 
+from sqlalchemy import literal_column, text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from src.cache import MemoryCacheBackend
 from src.core  import NotFoundException
-from src.models import Event
-from src.service.event_service import EventService
+from src.database.base_session import BaseSessionManager
+from src.models import Event, EventChange
+from src.schemas import ChangeCursor, CreateEventSchema, EventCursor, EventGroupBy
+from src.service import event_service as event_service_module
+from src.service.event_service import RECURRENCE_HORIZON, EventService
 
 @pytest.fixture
 def event_service() -> EventService:
@@ -48,7 +55,7 @@ def events() -> dict[int, Event]:
 
 class TestCreateEvent:
     async def test_should_insert_correctly(self, event_service: EventService, db_session):
-        await event_service.create(
+        event_id = await event_service.create(
             userId="user-unique-id-123",
             date=date(2025,1,3),
             time=time(12,13),
@@ -60,6 +67,7 @@ class TestCreateEvent:
             Event.userId == "user-unique-id-123"
         ))).fetchone()
 
+        assert result.id == event_id
         assert result.userId == "user-unique-id-123"
         assert result.date == date(2025,1,3)
         assert result.time == time(12,13)
@@ -67,6 +75,36 @@ class TestCreateEvent:
 
 
 
+class TestBulkCreateEvent:
+    async def test_should_insert_all_and_return_ids_in_order(self, event_service: EventService, db_session):
+        ids = await event_service.bulk_create(
+            events=[
+                CreateEventSchema(
+                    userId="user-bulk-123",
+                    date=date(2025,1,4),
+                    time=time(hour,0),
+                    description=f"bulk {hour}",
+                )
+                for hour in range(5)
+            ],
+            session=db_session,
+        )
+
+        assert len(ids) == 5
+
+        result = (await db_session.execute(select(Event).where(
+            Event.userId == "user-bulk-123"
+        ))).scalars().all()
+
+        assert {event.id: event.description for event in result} == {
+            event_id: f"bulk {hour}" for hour, event_id in enumerate(ids)
+        }
+
+    async def test_should_skip_the_query_if_no_event(self, event_service: EventService, db_session):
+        assert await event_service.bulk_create(events=[], session=db_session) == []
+
+
+
 class TestGetEvent:
     async def test_should_throw_not_found_error_if_no_row(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
         with pytest.raises(NotFoundException):
@@ -134,3 +172,611 @@ class TestGetEvent:
         event_result_1 = result[0]
         assert events[3] == event_result_1
 
+
+
+class TestGetEventsPage:
+    async def test_should_return_pages_by_using_the_cursor(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add(events[3])
+        db_session.add(events[1])
+        db_session.add(events[2])
+
+        first_page = await event_service.get_events_page(
+            session=db_session,
+            limit=2,
+            userIds=["user1", "user2", "user3"],
+        )
+
+        assert first_page == [events[1], events[2]]
+
+        last = first_page[-1]
+        second_page = await event_service.get_events_page(
+            session=db_session,
+            limit=2,
+            userIds=["user1", "user2", "user3"],
+            after=EventCursor(date=last.date, time=last.time, id=last.id),
+        )
+
+        assert second_page == [events[3]]
+
+
+    async def test_should_return_empty_page_if_no_row(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        result = await event_service.get_events_page(
+            session=db_session,
+            limit=10,
+            userIds=["user-no-123"],
+        )
+
+        assert result == []
+
+
+class TestGetChanges:
+    @pytest.fixture
+    def changes(self) -> list[EventChange]:
+        return [
+            EventChange(txid=2, op="INSERT", eventId=1, userId="user-change-1", data={"id": 1}),
+            EventChange(txid=1, op="INSERT", eventId=2, userId="user-change-2", data={"id": 2}),
+            EventChange(txid=2, op="DELETE", eventId=1, userId="user-change-1"),
+        ]
+
+
+    async def test_should_return_changes_page_by_page(self, event_service:EventService, db_session:InstanceOf[AsyncSession], changes):
+        db_session.add_all(changes)
+        await db_session.flush()
+        userIds = ["user-change-1", "user-change-2"]
+
+        first = await event_service.get_changes(session=db_session, limit=2, userIds=userIds)
+        second = await event_service.get_changes(
+            session=db_session,
+            limit=2,
+            userIds=userIds,
+            since=ChangeCursor(txid=first[-1].txid, id=first[-1].id),
+        )
+
+        assert [(change.userId, change.op) for change in first + second] == [
+            ("user-change-2", "INSERT"),
+            ("user-change-1", "INSERT"),
+            ("user-change-1", "DELETE"),
+        ]
+        assert second[-1].data is None
+
+
+    async def test_should_filter_changes_by_users(self, event_service:EventService, db_session:InstanceOf[AsyncSession], changes):
+        db_session.add_all(changes)
+        await db_session.flush()
+
+        result = await event_service.get_changes(session=db_session, limit=10, userIds=["user-change-2"])
+
+        assert [change.eventId for change in result] == [2]
+
+
+    async def test_should_log_writes_but_hide_running_transactions(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        await event_service.create(
+            userId="user-change-3",
+            date=date(2025,1,5),
+            time=time(5,5),
+            description="event5",
+            session=db_session,
+        )
+        await db_session.flush()
+
+        logged = (await db_session.scalars(select(EventChange).where(EventChange.userId == "user-change-3"))).all()
+
+        assert [(change.op, change.data["description"]) for change in logged] == [("INSERT", "event5")]
+        assert await event_service.get_changes(session=db_session, limit=10, userIds=["user-change-3"]) == []
+
+
+class TestStreamEvents:
+    async def test_should_stream_events_in_keyset_order(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add(events[2])
+        db_session.add(events[3])
+        db_session.add(events[1])
+        await db_session.flush()
+
+        result = [
+            event async for event in event_service.stream_events(
+                session=db_session,
+                userIds=["user1", "user2", "user3"],
+                batch_size=1,
+            )
+        ]
+
+        assert result == [events[1], events[2], events[3]]
+
+
+    async def test_should_stream_events_after_the_cursor(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add(events[1])
+        db_session.add(events[2])
+        db_session.add(events[3])
+        await db_session.flush()
+
+        result = [
+            event async for event in event_service.stream_events(
+                session=db_session,
+                userIds=["user1", "user2", "user3"],
+                after=EventCursor(date=events[1].date, time=events[1].time, id=events[1].id),
+            )
+        ]
+
+        assert result == [events[2], events[3]]
+
+
+class TestGetGroupedEvents:
+    async def test_should_group_events_by_user(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        events[3].userId = "user1"
+        db_session.add(events[3])
+        db_session.add(events[1])
+        db_session.add(events[2])
+        await db_session.flush()
+
+        result = loads(await event_service.get_grouped_events(
+            session=db_session,
+            group_by=EventGroupBy.USER,
+            userIds=["user1", "user2"],
+        ))
+
+        assert list(result) == ["user1", "user2"]
+        assert [event["id"] for event in result["user1"]] == [events[1].id, events[3].id]
+        assert result["user2"] == [
+            {
+                "id": events[2].id,
+                "userId": "user2",
+                "date": "2025-01-02",
+                "time": "02:02:00",
+                "description": "event2",
+            }
+        ]
+
+
+    async def test_should_group_events_by_date(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        events[2].date = date(2025,1,1)
+        db_session.add(events[2])
+        db_session.add(events[1])
+        db_session.add(events[3])
+        await db_session.flush()
+
+        result = loads(await event_service.get_grouped_events(
+            session=db_session,
+            group_by=EventGroupBy.DATE,
+            userIds=["user1", "user2", "user3"],
+            start_date=date(2025,1,1),
+            end_date=date(2025,1,2),
+        ))
+
+        assert list(result) == ["2025-01-01"]
+        assert [event["id"] for event in result["2025-01-01"]] == [events[1].id, events[2].id]
+
+
+    async def test_should_return_empty_object_if_no_row(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        result = await event_service.get_grouped_events(
+            session=db_session,
+            group_by=EventGroupBy.USER,
+            userIds=["user-no-123"],
+        )
+
+        assert result == b"{}"
+
+
+    async def test_should_return_events_after_the_given_id(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add_all(events.values())
+        await db_session.flush()
+
+        result = loads(await event_service.get_grouped_events(
+            session=db_session,
+            group_by=EventGroupBy.USER,
+            userIds=["user1", "user2", "user3"],
+            after_id=events[1].id,
+        ))
+
+        assert list(result) == ["user2", "user3"]
+
+
+class TestGetEventsJson:
+    @pytest.fixture
+    def cached_event_service(self) -> EventService:
+        return EventService(cache=MemoryCacheBackend(max_size=10, ttl=60))
+
+
+    async def test_should_throw_not_found_error_if_no_row(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        with pytest.raises(NotFoundException):
+            await event_service.get_events_json(
+                userIds=["user-no-123"],
+                session=db_session
+            )
+
+
+    async def test_should_serialize_events_without_cache(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add(events[1])
+        await db_session.flush()
+
+        result = loads(await event_service.get_events_json(
+            session=db_session,
+            userIds=["user1"],
+        ))
+
+        assert result == [
+            {
+                "id": events[1].id,
+                "userId": "user1",
+                "date": "2025-01-01",
+                "time": "01:01:00",
+                "description": "event1",
+            }
+        ]
+
+
+    async def test_should_read_through_the_cache(self, cached_event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add(events[1])
+        db_session.add(events[2])
+        await db_session.flush()
+
+        first = await cached_event_service.get_events_json(
+            session=db_session,
+            userIds=["user2", "user1", "user1"],
+        )
+        await db_session.delete(events[1])
+        await db_session.flush()
+        second = await cached_event_service.get_events_json(
+            session=db_session,
+            userIds=["user1", "user2"],
+        )
+
+        assert first == second
+        assert len(loads(second)) == 2
+
+
+    async def test_should_invalidate_the_entries_of_the_user_after_commit(self, cached_event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add(events[1])
+        db_session.add(events[2])
+        await db_session.flush()
+
+        user_1 = await cached_event_service.get_events_json(session=db_session, userIds=["user1"])
+        user_2 = await cached_event_service.get_events_json(session=db_session, userIds=["user2"])
+
+        await cached_event_service.create(
+            userId="user1",
+            date=date(2025,1,5),
+            time=time(5,5),
+            description="event5",
+            session=db_session,
+        )
+        await db_session.flush()
+        await BaseSessionManager.run_after_commit_hooks(db_session)
+
+        assert len(loads(await cached_event_service.get_events_json(session=db_session, userIds=["user1"]))) == 2
+        assert user_1 != await cached_event_service.get_events_json(session=db_session, userIds=["user1"])
+        assert user_2 == await cached_event_service.get_events_json(session=db_session, userIds=["user2"])
+
+
+    async def test_should_invalidate_the_entries_of_every_user_after_bulk_commit(self, cached_event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        [base] = await cached_event_service.cache.get_versions(["user:user-bulk-cache"])
+        with pytest.raises(NotFoundException):
+            await cached_event_service.get_events_json(session=db_session, userIds=["user-bulk-cache"])
+
+        await cached_event_service.bulk_create(
+            events=[
+                CreateEventSchema(userId="user-bulk-cache", date=date(2025,1,5), time=time(5,5), description="event5"),
+            ],
+            session=db_session,
+        )
+        await BaseSessionManager.run_after_commit_hooks(db_session)
+
+        assert await cached_event_service.cache.get_versions(["users:*", "user:user-bulk-cache"]) == [base + 1, base + 1]
+        assert len(loads(await cached_event_service.get_events_json(session=db_session, userIds=["user-bulk-cache"]))) == 1
+
+
+    async def test_should_invalidate_the_entries_of_the_user_on_change_notification(self, cached_event_service:EventService):
+        [base] = await cached_event_service.cache.get_versions(["user:user1"])
+        await cached_event_service.handle_change(
+            '{"op": "INSERT", "userId": "user1", "first_date": "2025-01-01", "last_date": "2025-01-02"}'
+        )
+
+        assert await cached_event_service.cache.get_versions(["users:*", "user:user1", "user:user2"]) == [base + 1, base + 1, base]
+
+
+class TestSearchEventsJson:
+    async def test_should_throw_not_found_error_if_no_row(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        with pytest.raises(NotFoundException):
+            await event_service.search_events_json(
+                session=db_session,
+                userIds=["user-no-123"],
+            )
+
+
+    async def test_should_join_the_given_users(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add_all(events.values())
+        await db_session.flush()
+
+        result = loads(await event_service.search_events_json(
+            session=db_session,
+            userIds=["user3", "user1", "user1", *(f"user-none-{i}" for i in range(5000))],
+            end_date=date(2025,1,3),
+        ))
+
+        assert [event["id"] for event in result] == [events[1].id, events[3].id]
+
+
+    async def test_should_filter_by_date_range(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add_all(events.values())
+        await db_session.flush()
+
+        result = loads(await event_service.search_events_json(
+            session=db_session,
+            userIds=["user1", "user2", "user3"],
+            start_date=date(2025,1,2),
+            end_date=date(2025,1,2),
+        ))
+
+        assert [event["userId"] for event in result] == ["user2"]
+
+
+class TestGetEventCountsJson:
+    async def test_should_return_empty_array_if_no_row(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        result = await event_service.get_event_counts_json(
+            session=db_session,
+            userIds=["user-no-123"],
+        )
+
+        assert loads(result) == []
+
+
+    async def test_should_count_events_of_each_date(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add_all(events.values())
+        db_session.add(
+            Event(userId="user1", description="event4", date=date(2025,1,3), time=time(4,4))
+        )
+        await db_session.flush()
+
+        result = await event_service.get_event_counts_json(
+            session=db_session,
+            userIds=["user1", "user3"],
+            start_date=date(2025,1,1),
+            end_date=date(2025,1,3),
+        )
+
+        assert loads(result) == [
+            {"date": "2025-01-01", "count": 1},
+            {"date": "2025-01-03", "count": 2},
+        ]
+
+
+class TestGetEventsEtag:
+    async def test_should_return_none_without_cache(self, event_service:EventService):
+        assert await event_service.get_events_etag(userIds=["user1"]) is None
+
+
+    async def test_should_change_only_for_the_written_users(self):
+        cache = MemoryCacheBackend(max_size=10, ttl=60)
+        service = EventService(cache=cache)
+
+        user_1 = await service.get_events_etag(userIds=["user1"])
+        user_2 = await service.get_events_etag(userIds=["user2"])
+        everyone = await service.get_events_etag()
+
+        assert user_1 == await service.get_events_etag(userIds=["user1", "user1"])
+        assert user_1 != await service.get_events_etag(userIds=["user1"], group_by=EventGroupBy.DATE)
+
+        await cache.bump_versions(["users:*", "user:user1"])
+
+        assert user_1 != await service.get_events_etag(userIds=["user1"])
+        assert user_2 == await service.get_events_etag(userIds=["user2"])
+        assert everyone != await service.get_events_etag()
+
+    async def test_should_not_repeat_the_tags_of_a_restarted_cache(self):
+        before = await EventService(cache=MemoryCacheBackend(max_size=10, ttl=60)).get_events_etag(userIds=["user1"])
+        after = await EventService(cache=MemoryCacheBackend(max_size=10, ttl=60)).get_events_etag(userIds=["user1"])
+
+        assert before != after
+
+    async def test_should_record_the_position_of_writes_if_replicated(self, db_session:InstanceOf[AsyncSession]):
+        cache = MemoryCacheBackend(max_size=10, ttl=60)
+        service = EventService(cache=cache, replicated=True)
+
+        await service.create(
+            userId="user-replicated",
+            date=date(2025,1,5),
+            time=time(5,5),
+            description="event",
+            session=db_session,
+        )
+        await BaseSessionManager.run_after_commit_hooks(db_session)
+
+        [position] = await cache.get_positions(["user:user-replicated"])
+        assert position > 0
+        assert await service.get_events_etag(userIds=["user-replicated"], session=db_session) is not None
+
+    async def test_should_not_tag_or_cache_rows_of_lagging_replica(self, db_session:InstanceOf[AsyncSession], events, monkeypatch):
+        cache = MemoryCacheBackend(max_size=10, ttl=60)
+        service = EventService(cache=cache, replicated=True)
+        monkeypatch.setattr(event_service_module, "REPLAYED_POSITION", literal_column("0::bigint"))
+        db_session.add(events[1])
+        await db_session.flush()
+        await cache.advance_positions(["user:user1"], 1)
+
+        assert await service.get_events_etag(userIds=["user1"], session=db_session) is None
+
+        first = await service.get_events_json(session=db_session, userIds=["user1"])
+        db_session.add(Event(userId="user1", description="new", date=date(2025,1,4), time=time(4,4)))
+        await db_session.flush()
+        second = await service.get_events_json(session=db_session, userIds=["user1"])
+
+        assert len(loads(second)) == len(loads(first)) + 1
+
+
+
+class TestOpenEndedDateRange:
+    async def test_should_filter_by_start_date_only(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add(events[1])
+        db_session.add(events[2])
+        db_session.add(events[3])
+
+        result = await event_service.get_events(
+            session=db_session,
+            userIds=["user1", "user2", "user3"],
+            start_date=date(2025,1,2),
+        )
+
+        assert result == [events[2], events[3]]
+
+
+    async def test_should_filter_by_end_date_only(self, event_service:EventService, db_session:InstanceOf[AsyncSession], events):
+        db_session.add(events[1])
+        db_session.add(events[2])
+        db_session.add(events[3])
+
+        result = await event_service.get_events(
+            session=db_session,
+            userIds=["user1", "user2", "user3"],
+            end_date=date(2025,1,1),
+        )
+
+        assert result == [events[1]]
+
+
+class TestRecurringEvents:
+    async def _create(self, event_service, db_session, rrule, event_date=date(2025,1,6)):
+        await event_service.create(
+            userId="user-recurring",
+            date=event_date,
+            time=time(9,0),
+            description="standup",
+            rrule=rrule,
+            session=db_session,
+        )
+        await db_session.flush()
+
+
+    async def test_should_store_a_single_row_per_series(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        await self._create(event_service, db_session, "FREQ=WEEKLY;COUNT=10")
+
+        rows = (await db_session.execute(
+            select(Event).where(Event.userId == "user-recurring")
+        )).scalars().all()
+
+        assert len(rows) == 1
+        assert (rows[0].frequency, rows[0].interval, rows[0].until) == ("WEEKLY", 1, date(2025,3,10))
+
+
+    async def test_should_expand_occurrences_within_the_range(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        await self._create(event_service, db_session, "FREQ=WEEKLY;COUNT=10")
+
+        result = await event_service.get_events(
+            session=db_session,
+            userIds=["user-recurring"],
+            start_date=date(2025,1,20),
+            end_date=date(2025,2,3),
+        )
+
+        assert [event.date for event in result] == [date(2025,1,20), date(2025,1,27), date(2025,2,3)]
+        assert len({event.id for event in result}) == 1
+
+
+    async def test_should_stop_at_the_end_of_the_series(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        await self._create(event_service, db_session, "FREQ=DAILY;INTERVAL=2;UNTIL=20250112")
+
+        result = loads(await event_service.get_event_counts_json(
+            session=db_session,
+            userIds=["user-recurring"],
+        ))
+
+        assert [row["date"] for row in result] == ["2025-01-06", "2025-01-08", "2025-01-10", "2025-01-12"]
+
+
+    async def test_should_clamp_monthly_occurrences_to_the_end_of_month(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        await self._create(event_service, db_session, "FREQ=MONTHLY", date(2025,1,31))
+
+        result = loads(await event_service.get_grouped_events(
+            session=db_session,
+            group_by=EventGroupBy.DATE,
+            userIds=["user-recurring"],
+            start_date=date(2025,2,1),
+            end_date=date(2025,4,30),
+        ))
+
+        assert list(result) == ["2025-02-28", "2025-03-31", "2025-04-30"]
+
+
+    async def test_should_expand_open_ended_series_up_to_the_horizon(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        await self._create(event_service, db_session, "FREQ=DAILY")
+
+        result = loads(await event_service.get_event_counts_json(
+            session=db_session,
+            userIds=["user-recurring"],
+            start_date=date(2025,2,1),
+        ))
+
+        assert len(result) == RECURRENCE_HORIZON.days + 1
+
+
+    async def test_should_page_through_occurrences(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        await self._create(event_service, db_session, "FREQ=DAILY;COUNT=3")
+
+        first_page = await event_service.get_events_page(
+            session=db_session, limit=2, userIds=["user-recurring"]
+        )
+        last = first_page[-1]
+        second_page = await event_service.get_events_page(
+            session=db_session,
+            limit=2,
+            userIds=["user-recurring"],
+            after=EventCursor(date=last.date, time=last.time, id=last.id),
+        )
+
+        assert [event.date for event in first_page + second_page] == [
+            date(2025,1,6), date(2025,1,7), date(2025,1,8)
+        ]
+
+
+    async def test_should_create_recurring_events_in_bulk(self, event_service:EventService, db_session:InstanceOf[AsyncSession]):
+        await event_service.bulk_create(
+            events=[
+                CreateEventSchema(userId="user-recurring", date=date(2025,1,6), time=time(9,0), description="a", rrule="FREQ=DAILY;COUNT=2"),
+                CreateEventSchema(userId="user-recurring", date=date(2025,1,6), time=time(10,0), description="b"),
+            ],
+            session=db_session,
+        )
+
+        result = await event_service.get_events(session=db_session, userIds=["user-recurring"])
+
+        assert sorted((event.date, event.description) for event in result) == [
+            (date(2025,1,6), "a"), (date(2025,1,6), "b"), (date(2025,1,7), "a")
+        ]
+
+
+class TestEventQueryPlans:
+    async def _explain(self, db_session, query) -> str:
+        await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        compiled = query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+        plan = await db_session.execute(text(f"EXPLAIN {compiled}"))
+        return "\n".join(plan.scalars().all())
+
+
+    async def test_digest_query_should_use_date_index(self, db_session:InstanceOf[AsyncSession]):
+        occurrences = EventService._occurrences(None, date(2025,1,1), date(2025,1,1))
+
+        assert "ix_event_date_userId" in await self._explain(db_session, select(*occurrences.c))
+
+
+    async def test_user_query_should_use_user_index(self, db_session:InstanceOf[AsyncSession]):
+        query = EventService._keyset_query(["user1"], date(2025,1,1), None, None)
+
+        assert "ix_event_userId_date_time" in await self._explain(db_session, query)
+
+
+    async def test_keyset_page_should_push_the_cursor_into_the_index(self, db_session:InstanceOf[AsyncSession]):
+        query = EventService._keyset_query(
+            ["user1"], date(2025,1,1), date(2025,1,31), EventCursor(date=date(2025,1,5), time=time(9,0), id=1)
+        )
+
+        plan = await self._explain(db_session, query)
+
+        assert "Index Cond: ((date >= '2025-01-01'::date) AND (date <= '2025-01-31'::date) AND (date >= '2025-01-05'::date)" in plan
+        assert "ix_event_recurrence" in plan
+
+
+
+    async def test_recurring_query_should_use_recurrence_index(self, db_session:InstanceOf[AsyncSession]):
+        occurrences = EventService._occurrences(None, date(2025,1,1), date(2025,1,31))
+
+        assert "ix_event_recurrence" in await self._explain(db_session, select(*occurrences.c))
@@ -7,19 +7,24 @@ from datetime import date, datetime, time
 from typing import Final
 
 from aiogram import Bot, Dispatcher, types
-from aiogram.filters import Command
+from aiogram.filters import Command, CommandObject, ExceptionTypeFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import (
     CallbackQuery,
+    ErrorEvent,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     Message,
 )
 
-from src.core import configuration
+from src.core import CircuitOpenException, HttpException, configuration
 from src.model import EventModel
-from src.service import EventService, ServiceFactory
+from src.service import (
+    EventService,
+    ServiceFactory,
+    TimezoneService,
+)
 
 logging.basicConfig(level=logging.INFO)
 
@@ -28,6 +33,9 @@ dp: Dispatcher = Dispatcher()
 logger: logging.Logger = logging.getLogger()
 
 event_service: EventService = ServiceFactory.create_event_service()
+timezone_service: TimezoneService = ServiceFactory.create_timezone_service()
+
+UPCOMING_DAYS: Final[int] = 7
 
 
 class EventCreation(StatesGroup):
@@ -95,6 +103,7 @@ welcome_text: Final[str] = (
     "Use the menu below to get started:\n"
     "➕ <i>Create</i> – Schedule a new event (/create)\n"
     "📅 <i>Events</i> – List your upcoming events (/events)\n"
+    "🕕 <i>Timezone</i> – Set your timezone for the daily digest (/timezone)\n"
     "❓ <i>Help</i> – Show this menu again (/help)\n"
 )
 
@@ -225,33 +234,37 @@ async def event_time_handler(message: Message, state: FSMContext):
 
 
 @dp.message(Command("events"))
-async def handle_show_events(message: Message, state: FSMContext):
-    """Handle show list events command."""
+async def handle_show_events(message: Message):
+    """Handle show list events command.
+
+    The number of events of each date is shown, and the details of a date are
+    shown when its toggle button is pressed. Both are served from the cached
+    upcoming events of the user, so the repeated views do not call the api. The
+    last cached events are shown while the api is unavailable.
+    """
     if not message.from_user:
         logger.error(f"[show_events_handler]: {message}'s from_user is empty.")
         return
 
     telegram_id = message.from_user.id
-    events: dict[date, list[EventModel]] = await event_service.get_events_by_user(
-        telegram_id=telegram_id, day=7
+    counts: dict[date, int] = await event_service.get_event_counts_by_user(
+        telegram_id=telegram_id, day=UPCOMING_DAYS
     )
 
-    if not events:
+    if not counts:
         await message.answer("You have no events planned. Try adding one with /create!")
         return
 
-    await state.update_data(events=events)
-
     lines = ["<b>📆 Your Upcoming Events:</b>\n"]
+    if not event_service.api_available:
+        lines.append("<i>⚠️ The service is unavailable, these may be outdated.</i>\n")
 
     keyboard = InlineKeyboardMarkup(inline_keyboard=[])
 
-    for event_date in sorted(events.keys()):
-        events_list = events[event_date]
+    for event_date, count in counts.items():
         # Create a summary line for the date:
         lines.append(
-            f"<b>{event_date}</b> – {len(events_list)} "
-            f"event{'s' if len(events_list) != 1 else ''} 📅"
+            f"<b>{event_date}</b> – {count} event{'s' if count != 1 else ''} 📅"
         )
         lines.append("<i>(Click the button below to show details)</i>\n")
 
@@ -272,8 +285,12 @@ async def handle_show_events(message: Message, state: FSMContext):
 
 
 @dp.callback_query(lambda c: c.data and c.data.startswith("toggle_"))
-async def toggle_details_handler(callback_query: CallbackQuery, state: FSMContext):
-    """Handle date details."""
+async def toggle_details_handler(callback_query: CallbackQuery):
+    """Handle date details.
+
+    The events of the selected date are served from the cached upcoming events of
+    the user, or fetched from the api if the date is not in them.
+    """
     if not callback_query.data or not callback_query.message:
         logger.error(
             f"[toggle_details_handler]: {callback_query}'s data or message is empty."
@@ -281,11 +298,12 @@ async def toggle_details_handler(callback_query: CallbackQuery, state: FSMContex
         return
     event_date_str: str = callback_query.data.split("_", 1)[1]
 
-    data = await state.get_data()
-    events = data.get("events", {})
-
     event_date: date = date.fromisoformat(event_date_str)
-    events_list: list[EventModel] = events.get(event_date)
+    events_list: list[EventModel] = await event_service.get_events_of_user_date(
+        telegram_id=callback_query.from_user.id,
+        event_date=event_date,
+        day=UPCOMING_DAYS,
+    )
     if not events_list:
         await callback_query.answer("No events for this date", show_alert=True)
         return
@@ -315,6 +333,44 @@ async def toggle_details_handler(callback_query: CallbackQuery, state: FSMContex
     await callback_query.answer()
 
 
+@dp.message(Command("timezone"))
+async def handle_timezone(message: Message, command: CommandObject):
+    """Handle the `/timezone` command.
+
+    Sets the timezone of the user if it is given, e.g. `/timezone Europe/Istanbul`.
+    Otherwise, prints the current timezone of the user.
+    """
+    if not message.from_user:
+        logger.error(f"[handle_timezone]: {message}'s from_user is empty.")
+        return
+
+    telegram_id: int = message.from_user.id
+    if not command.args:
+        timezone: str = await timezone_service.get_timezone(telegram_id)
+        await message.answer(
+            f"Your timezone is <b>{timezone}</b>.\n"
+            "Use <code>/timezone Area/City</code> to change it.",
+            parse_mode="HTML",
+        )
+        return
+
+    try:
+        await timezone_service.set_timezone(telegram_id, command.args.strip())
+    except ValueError:
+        await message.answer(
+            "Please enter a valid timezone, "
+            "e.g. <code>/timezone Europe/Istanbul</code>.",
+            parse_mode="HTML",
+        )
+        return
+
+    await message.answer(
+        f"Your timezone is set to <b>{command.args.strip()}</b>. "
+        "Your daily digest will arrive at 06:00 in your timezone.",
+        parse_mode="HTML",
+    )
+
+
 @dp.message(Command("start"))
 async def handle_start(message: Message):
     """Handle the `/start` command.
@@ -333,10 +389,27 @@ async def handle_help(message: Message):
     await message.answer(welcome_text, parse_mode="HTML")
 
 
+@dp.error(ExceptionTypeFilter(HttpException))
+async def api_error_handler(event: ErrorEvent):
+    """Tell the user that the request could not be completed by the api."""
+    text: str = (
+        "The service is temporarily unavailable, please try again in a minute."
+        if isinstance(event.exception, CircuitOpenException)
+        else "Your request could not be completed, please try again later."
+    )
+    if event.update.message:
+        await event.update.message.answer(text)
+    elif event.update.callback_query:
+        await event.update.callback_query.answer(text, show_alert=True)
+
+
 async def main():
     """Run the telegram bot."""
     logger.info("Bot started")
-    await dp.start_polling(bot)
+    try:
+        await dp.start_polling(bot)
+    finally:
+        await event_service.close()
     logger.info("Bot started")
 
 
@@ -1,10 +1,11 @@
 """Share core module."""
 
 from .config import configuration
-from .exceptions import HttpException
+from .exceptions import CircuitOpenException, HttpException
 
 __all__ = [
     "configuration",
     # Exceptions
+    "CircuitOpenException",
     "HttpException",
 ]
@@ -13,11 +13,60 @@ class RedisConfiguration(BaseModel):
 
 
 class ApiConfigurations(BaseModel):
-    """Api configurations class."""
+    """Api configurations class.
+
+    Attributes:
+        USER: Basic auth user of the api.
+        PASS: Basic auth password of the api.
+        URL: Base url of the api.
+        MAX_CONNECTIONS: Maximum number of the pooled connections to the api.
+        TIMEOUT: Total timeout of a request in seconds.
+        RETRIES: Maximum number of the retries of an idempotent request.
+        FAILURE_THRESHOLD: Consecutive failures to stop calling the api.
+        RESET_TIMEOUT: Seconds to stop calling the api after the failures.
+    """
 
     USER: str
     PASS: str
     URL: HttpUrl
+    MAX_CONNECTIONS: int = 20
+    TIMEOUT: float = 10.0
+    RETRIES: int = 3
+    FAILURE_THRESHOLD: int = 5
+    RESET_TIMEOUT: float = 30.0
+
+
+class EventCacheConfigurations(BaseModel):
+    """Event cache configurations class.
+
+    Attributes:
+        SIZE: Maximum number of the users whose events are kept in the process.
+        TTL: Seconds to serve the cached events of a user.
+        STALE_TTL: Seconds to keep the cached events of a user which are served
+            while the api is unavailable.
+        REDIS: Whether the cached events are shared between the bots in redis.
+    """
+
+    SIZE: int = 1024
+    TTL: float = 60.0
+    STALE_TTL: float = 86400.0
+    REDIS: bool = False
+
+
+class SenderConfigurations(BaseModel):
+    """Message sender configurations class.
+
+    Attributes:
+        RATE: Maximum number of the messages which are sent per second.
+        CHAT_INTERVAL: Minimum seconds between the messages of a chat.
+        CONCURRENCY: Number of the concurrent senders.
+        RETRIES: Maximum number of the retries of a message.
+    """
+
+    RATE: float = 30.0
+    CHAT_INTERVAL: float = 1.0
+    CONCURRENCY: int = 50
+    RETRIES: int = 3
 
 
 class Configuration(BaseSettings):
@@ -27,7 +76,11 @@ class Configuration(BaseSettings):
 
     API: ApiConfigurations
     REDIS: RedisConfiguration
+    EVENT_CACHE: EventCacheConfigurations = EventCacheConfigurations()
+    SENDER: SenderConfigurations = SenderConfigurations()
     TELEGRAM_TOKEN: str
+    DEFAULT_TIMEZONE: str = "UTC"
+    REMINDER_MINUTES: int = 30
 
 
 configuration: Configuration = Configuration()
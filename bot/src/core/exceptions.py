@@ -7,3 +7,7 @@ class HttpException(ValueError):
     def __init__(self, message: str) -> None:
         """Initialize the class."""
         super().__init__(message)
+
+
+class CircuitOpenException(HttpException):
+    """Raised when the api calls are rejected since the api is unhealthy."""
@@ -1,5 +1,6 @@
 """Shared models module."""
 
 from .event import EventModel
+from .reminder import ReminderModel
 
-__all__ = ["EventModel"]
+__all__ = ["EventModel", "ReminderModel"]
@@ -0,0 +1,16 @@
+"""Reminder model."""
+
+from datetime import date, time
+
+from pydantic import BaseModel
+
+
+class ReminderModel(BaseModel):
+    """Reminder model class."""
+
+    id: str
+    telegram_id: int
+    date: date
+    time: time
+    description: str
+    attempts: int = 0
@@ -1,6 +1,35 @@
 """Service module."""
 
+from .breaker import CircuitBreaker, CircuitState
+from .cache import CountWindow, EventCache, EventWindow
+from .client import ApiClient
+from .digest import DigestService, render_digest
 from .event import EventService
 from .factory import ServiceFactory
+from .reminder import ReminderService, render_reminder
+from .sender import MessageSender, RedisTokenBucket, SendReport, TokenBucket
+from .singleflight import SingleFlight
+from .timezone import TimezoneService, get_due_timezones, is_valid_timezone
 
-__all__ = ["EventService", "ServiceFactory"]
+__all__ = [
+    "ApiClient",
+    "CircuitBreaker",
+    "CircuitState",
+    "CountWindow",
+    "DigestService",
+    "EventCache",
+    "EventService",
+    "EventWindow",
+    "MessageSender",
+    "RedisTokenBucket",
+    "ReminderService",
+    "SendReport",
+    "ServiceFactory",
+    "SingleFlight",
+    "TimezoneService",
+    "TokenBucket",
+    "get_due_timezones",
+    "is_valid_timezone",
+    "render_digest",
+    "render_reminder",
+]
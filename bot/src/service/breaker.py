@@ -0,0 +1,67 @@
+"""Circuit breaker module."""
+
+from enum import Enum
+from time import monotonic
+
+
+class CircuitState(str, Enum):
+    """Enum of the circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker of the calls to an unhealthy dependency.
+
+    The circuit opens after `failure_threshold` consecutive failures, and the
+    calls are rejected until `reset_timeout` passes. Then a single trial call is
+    allowed by restarting the timeout, and the circuit is closed if it succeeds or
+    opened again if it fails.
+
+    Methods:
+        allow: Check whether a call can be made.
+        record_success: Record a successful call.
+        record_failure: Record a failed call.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the breaker.
+
+        Arguments:
+            failure_threshold: Number of consecutive failures to open the circuit.
+            reset_timeout: Seconds to reject the calls after the circuit opens.
+        """
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self._failures: int = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state of the circuit."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if monotonic() - self._opened_at < self.reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def allow(self) -> bool:
+        """Check whether a call can be made."""
+        state: CircuitState = self.state
+        if state == CircuitState.HALF_OPEN:
+            self._opened_at = monotonic()
+            return True
+        return state == CircuitState.CLOSED
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed call and open the circuit if the threshold is reached."""
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = monotonic()
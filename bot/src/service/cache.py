@@ -0,0 +1,273 @@
+"""Event cache module."""
+
+import logging
+from collections import OrderedDict
+from datetime import date
+from time import monotonic
+from typing import TypeVar
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.model import EventModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+Window = TypeVar("Window", bound="DateWindow")
+
+
+class DateWindow(BaseModel):
+    """Base class of the cached data of a user in a date range."""
+
+    start_date: date
+    end_date: date
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        """Check whether the date range is in the window."""
+        return self.start_date <= start_date and end_date <= self.end_date
+
+
+class EventWindow(DateWindow):
+    """The events of a user in a date range which are grouped by date."""
+
+    events: dict[date, list[EventModel]]
+
+    def between(self, start_date: date, end_date: date) -> dict[date, list[EventModel]]:
+        """Get the events of the date range which is in the window."""
+        return {
+            event_date: list(events)
+            for event_date, events in self.events.items()
+            if start_date <= event_date <= end_date
+        }
+
+
+class CountWindow(DateWindow):
+    """The number of the events of a user in a date range for each date."""
+
+    counts: dict[date, int]
+
+    def between(self, start_date: date, end_date: date) -> dict[date, int]:
+        """Get the numbers of the date range which is in the window."""
+        return {
+            event_date: count
+            for event_date, count in self.counts.items()
+            if start_date <= event_date <= end_date
+        }
+
+
+class EventCache:
+    """Cache of the upcoming events of the users.
+
+    The events and the event counts of the users are cached in separate windows.
+    The windows are kept in the process with a time to live, and the least
+    recently used ones are dropped when the cache is full. If a redis client is
+    given, the windows are stored only in redis, so the replicas of the bot share
+    them and none of them keeps a stale copy after another one changes a window.
+    Redis errors are logged and treated as misses.
+
+    The expired windows are kept until the stale time to live, so they can be
+    served while the api is unavailable.
+
+    Methods:
+        get: Get the cached events window of a user.
+        set: Cache the events window of a user.
+        get_counts: Get the cached counts window of a user.
+        set_counts: Cache the counts window of a user.
+        add: Add a created event to the cached windows of its user.
+        invalidate: Drop the cached windows of a user.
+        close: Close the redis connections.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        stale_ttl: float = 86400.0,
+        redis: Redis | None = None,
+        key_prefix: str = "events",
+    ):
+        """Initialize the cache.
+
+        Arguments:
+            maxsize: Maximum number of the windows which are kept in the process
+                if redis is not given.
+            ttl: Seconds to serve a window.
+            stale_ttl: Seconds to keep a window for the stale reads. It is not
+                less than the time to live.
+            redis: The optional redis client which is created with
+                `decode_responses=True`.
+            key_prefix: The prefix of the redis keys.
+        """
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.stale_ttl: float = max(stale_ttl, ttl)
+        self.redis: Redis | None = redis
+        self.key_prefix: str = key_prefix
+        self._windows: OrderedDict[str, tuple[float, DateWindow]] = OrderedDict()
+
+    async def get(self, telegram_id: int, stale: bool = False) -> EventWindow | None:
+        """Get the cached events window of a user.
+
+        Arguments:
+            telegram_id: Telegram id of the user.
+            stale: Whether an expired window is returned until its stale time to
+                live.
+
+        Returns:
+            The window of the user. `None` if it is not cached or expired.
+        """
+        return await self._read(self._key(telegram_id), EventWindow, stale)
+
+    async def set(self, telegram_id: int, window: EventWindow) -> None:
+        """Cache the events window of a user.
+
+        Arguments:
+            telegram_id: Telegram id of the user.
+            window: The events of the user.
+        """
+        await self._write(self._key(telegram_id), window)
+
+    async def get_counts(
+        self, telegram_id: int, stale: bool = False
+    ) -> CountWindow | None:
+        """Get the cached counts window of a user.
+
+        Arguments:
+            telegram_id: Telegram id of the user.
+            stale: Whether an expired window is returned until its stale time to
+                live.
+
+        Returns:
+            The window of the user. `None` if it is not cached or expired.
+        """
+        return await self._read(self._counts_key(telegram_id), CountWindow, stale)
+
+    async def set_counts(self, telegram_id: int, window: CountWindow) -> None:
+        """Cache the counts window of a user.
+
+        Arguments:
+            telegram_id: Telegram id of the user.
+            window: The event counts of the user.
+        """
+        await self._write(self._counts_key(telegram_id), window)
+
+    async def add(self, event: EventModel) -> None:
+        """Add a created event to the cached windows of its user.
+
+        A window is left as it is if it is not cached or the event is not in it.
+        If the windows are in redis, they are dropped instead, so the concurrent
+        changes of the replicas are not lost.
+
+        Arguments:
+            event: The created event.
+        """
+        telegram_id: int = int(event.userId)
+        if self.redis is not None:
+            await self.invalidate(telegram_id)
+            return
+
+        window: EventWindow | None = await self.get(telegram_id)
+        if window is not None and window.covers(event.date, event.date):
+            events: dict[date, list[EventModel]] = dict(window.events)
+            events[event.date] = sorted(
+                [*events.get(event.date, []), event], key=lambda e: (e.time, e.id)
+            )
+            await self.set(
+                telegram_id,
+                EventWindow(
+                    start_date=window.start_date,
+                    end_date=window.end_date,
+                    events=dict(sorted(events.items())),
+                ),
+            )
+
+        counts: CountWindow | None = await self.get_counts(telegram_id)
+        if counts is not None and counts.covers(event.date, event.date):
+            numbers: dict[date, int] = dict(counts.counts)
+            numbers[event.date] = numbers.get(event.date, 0) + 1
+            await self.set_counts(
+                telegram_id,
+                CountWindow(
+                    start_date=counts.start_date,
+                    end_date=counts.end_date,
+                    counts=dict(sorted(numbers.items())),
+                ),
+            )
+
+    async def invalidate(self, telegram_id: int) -> None:
+        """Drop the cached windows of a user.
+
+        Arguments:
+            telegram_id: Telegram id of the user.
+        """
+        keys: tuple[str, str] = (self._key(telegram_id), self._counts_key(telegram_id))
+        if self.redis is None:
+            for key in keys:
+                self._windows.pop(key, None)
+            return
+
+        try:
+            await self.redis.delete(*keys)
+        except RedisError as e:
+            logger.warning(f"Cached events of {telegram_id} can not be dropped: {e!r}")
+
+    async def close(self) -> None:
+        """Close the redis connections."""
+        if self.redis is not None:
+            await self.redis.aclose()
+
+    async def _read(self, key: str, model: type[Window], stale: bool) -> Window | None:
+        """Read a window and check its age."""
+        if self.redis is None:
+            cached: tuple[float, DateWindow] | None = self._windows.get(key)
+            if cached is None:
+                return None
+            stored_at, window = cached
+            age: float = monotonic() - stored_at
+            if age >= self.stale_ttl:
+                del self._windows[key]
+                return None
+            if age >= self.ttl and not stale:
+                return None
+            self._windows.move_to_end(key)
+            return window
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.pttl(key)
+                raw, pttl = await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Cached window {key} can not be read: {e!r}")
+            return None
+
+        if raw is None or pttl <= 0:
+            return None
+        if self.stale_ttl - pttl / 1000 >= self.ttl and not stale:
+            return None
+        return model.model_validate_json(raw)
+
+    async def _write(self, key: str, window: DateWindow) -> None:
+        """Write a window with the stale time to live."""
+        if self.redis is None:
+            self._windows[key] = (monotonic(), window)
+            self._windows.move_to_end(key)
+            if len(self._windows) > self.maxsize:
+                self._windows.popitem(last=False)
+            return
+
+        try:
+            await self.redis.set(
+                key, window.model_dump_json(), px=int(self.stale_ttl * 1000)
+            )
+        except RedisError as e:
+            logger.warning(f"Window {key} can not be cached: {e!r}")
+
+    def _key(self, telegram_id: int) -> str:
+        """Get the key of the events window of a user."""
+        return f"{self.key_prefix}:{telegram_id}"
+
+    def _counts_key(self, telegram_id: int) -> str:
+        """Get the key of the counts window of a user."""
+        return f"{self.key_prefix}:counts:{telegram_id}"
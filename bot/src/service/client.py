@@ -0,0 +1,268 @@
+"""Api client module."""
+
+import asyncio
+import logging
+import random
+import urllib.parse
+from base64 import b64encode
+from collections import OrderedDict
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
+
+from src.core import CircuitOpenException, HttpException
+
+from .breaker import CircuitBreaker
+from .utils import MSGPACK, HTTPMethods, decode_body, encode_body
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+ETAG_CACHE_SIZE: int = 1024
+RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS: frozenset[HTTPMethods] = frozenset(
+    {HTTPMethods.GET, HTTPMethods.PUT, HTTPMethods.DELETE}
+)
+
+
+class ApiUnavailableError(Exception):
+    """Raised when a request fails since the api is unavailable or overloaded."""
+
+    def __init__(
+        self, message: str, retry_after: float | None = None, retryable: bool = True
+    ) -> None:
+        """Initialize the class."""
+        super().__init__(message)
+        self.retry_after: float | None = retry_after
+        self.retryable: bool = retryable
+
+
+class ApiClient:
+    """Long-lived http client of the api.
+
+    Connections are kept alive in a pool which is limited per host, DNS lookups
+    are cached and the static headers are computed once. The session is created
+    lazily in the running event loop, and it is recreated when the loop changes
+    since a session can not be shared between loops.
+
+    The `ETag` of the successful `GET` responses are remembered with their bodies
+    and resent as `If-None-Match`. The remembered body is returned when the api
+    answers with `304 Not Modified`.
+
+    Idempotent requests are retried with jittered exponential backoff when the api
+    is unreachable or answers with `429`, `500`, `502`, `503` or `504`. These
+    failures and the other server errors are recorded by the circuit breaker, and
+    the requests fail fast with `CircuitOpenException` while the circuit is open.
+    Client errors are answers of a healthy api, so they close the circuit.
+
+    Methods:
+        request: Send a request to the api.
+        close: Close the session and its connections.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        user: str,
+        password: str,
+        max_connections: int = 20,
+        timeout: float = 10.0,
+        connect_timeout: float = 3.0,
+        dns_ttl: int = 300,
+        etag_cache_size: int = ETAG_CACHE_SIZE,
+        retries: int = 3,
+        backoff: float = 0.2,
+        max_backoff: float = 5.0,
+        breaker: CircuitBreaker | None = None,
+    ):
+        """Initialize the client.
+
+        Arguments:
+            base_url: Base url of the api which ends with a slash.
+            user: Basic auth user of the api.
+            password: Basic auth password of the api.
+            max_connections: Maximum number of open connections to the api.
+            timeout: Total timeout of a request in seconds.
+            connect_timeout: Timeout of opening a connection in seconds.
+            dns_ttl: Seconds to cache the resolved addresses of the api.
+            etag_cache_size: Maximum number of the remembered `GET` responses.
+            retries: Maximum number of the retries of an idempotent request.
+            backoff: Base delay of the retries in seconds.
+            max_backoff: Maximum delay of a retry in seconds.
+            breaker: The circuit breaker of the api. A new one is created if it is
+                not given.
+        """
+        self.base_url: str = base_url
+        self.max_connections: int = max_connections
+        self.timeout: ClientTimeout = ClientTimeout(
+            total=timeout, sock_connect=connect_timeout
+        )
+        self.dns_ttl: int = dns_ttl
+        self.etag_cache_size: int = etag_cache_size
+        self.retries: int = retries
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.breaker: CircuitBreaker = breaker or CircuitBreaker()
+        token: bytes = b64encode(f"{user}:{password}".encode())
+        self.headers: dict[str, str] = {
+            "Accept": f"{MSGPACK}, application/json;q=0.9",
+            "Accept-Encoding": "zstd, gzip",
+            "Authorization": f"Basic {token.decode()}",
+        }
+        self._session: ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._etag_cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+
+    async def request(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        method: HTTPMethods = HTTPMethods.GET,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+        idempotent: bool | None = None,
+    ) -> Any:
+        """Send a request to the api.
+
+        Bodies are sent as msgpack, and msgpack responses with zstd or gzip
+        compression are preferred.
+
+        Arguments:
+            path: Path of the endpoint relative to the base url.
+            params: Query parameters of the request.
+            method: HTTP Method to send request.
+            body: Body parameters of the request.
+            headers: Extra headers of the request.
+            idempotent: Whether the request can be retried. It is decided by the
+                method if it is not given.
+
+        Returns:
+            The decoded response of the request.
+
+        Raises:
+            CircuitOpenException: If the circuit breaker rejects the request.
+            HttpException: If the api answers with an error.
+        """
+        url: str = self.base_url + path
+        request_url: str = f"{url}?{urllib.parse.urlencode(params)}" if params else url
+
+        request_headers: dict[str, str] = dict(headers) if headers else {}
+        data: bytes | None = None
+        if body:
+            data, body_headers = encode_body(body)
+            request_headers.update(body_headers)
+
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        attempts: int = self.retries + 1 if idempotent else 1
+        for attempt in range(attempts):
+            if not self.breaker.allow():
+                raise CircuitOpenException("Api is unavailable!")
+
+            try:
+                result: Any = await self._send(
+                    method, request_url, data, request_headers
+                )
+            except ApiUnavailableError as e:
+                self.breaker.record_failure()
+                if not e.retryable or attempt + 1 == attempts:
+                    raise HttpException("Request is failed!") from e
+
+                delay: float = self._backoff_delay(attempt, e.retry_after)
+                logger.warning(f"Retrying {request_url} in {delay:.2f}s: {e}")
+                await asyncio.sleep(delay)
+            except HttpException:
+                self.breaker.record_success()
+                raise
+            else:
+                self.breaker.record_success()
+                return result
+
+    async def _send(
+        self,
+        method: HTTPMethods,
+        request_url: str,
+        data: bytes | None,
+        headers: dict[str, str],
+    ) -> Any:
+        """Send a single request and handle its conditional response."""
+        logger.debug(f"Sending to {request_url}")
+        cached: tuple[str, Any] | None = (
+            self._etag_cache.get(request_url) if method == HTTPMethods.GET else None
+        )
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        try:
+            async with self._get_session().request(
+                method, request_url, data=data, headers=headers
+            ) as response:
+                if cached and response.status == 304:
+                    self._etag_cache.move_to_end(request_url)
+                    return cached[1]
+                if response.status in RETRY_STATUSES or response.status >= 500:
+                    raise ApiUnavailableError(
+                        f"Api answered with {response.status}",
+                        retry_after=self._retry_after(response.headers),
+                        retryable=response.status in RETRY_STATUSES,
+                    )
+                if not response.ok:
+                    logger.error(
+                        f"Request to {request_url} is failed: "
+                        f"{decode_body(await response.read(), response.headers)}"
+                    )
+                    raise HttpException("Request is failed!")
+
+                result: Any = decode_body(await response.read(), response.headers)
+                etag: str | None = response.headers.get("ETag")
+        except (ClientError, TimeoutError) as e:
+            raise ApiUnavailableError(f"Api is unreachable: {e!r}") from e
+
+        if method == HTTPMethods.GET and etag:
+            self._etag_cache[request_url] = (etag, result)
+            self._etag_cache.move_to_end(request_url)
+            if len(self._etag_cache) > self.etag_cache_size:
+                self._etag_cache.popitem(last=False)
+        return result
+
+    def _backoff_delay(self, attempt: int, retry_after: float | None) -> float:
+        """Get the delay before the next attempt.
+
+        The delay is the `Retry-After` of the api if it is given, otherwise a random
+        delay up to the exponential backoff of the attempt.
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    @staticmethod
+    def _retry_after(headers: Any) -> float | None:
+        """Get the seconds of the `Retry-After` header if it is given in seconds."""
+        try:
+            return float(headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
+
+    async def close(self) -> None:
+        """Close the session and its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def _get_session(self) -> ClientSession:
+        """Get the session of the running loop or create a new one."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections,
+                    ttl_dns_cache=self.dns_ttl,
+                ),
+                headers=self.headers,
+                timeout=self.timeout,
+                auto_decompress=False,
+            )
+            self._loop = loop
+
+        return self._session
@@ -0,0 +1,248 @@
+"""Digest service module."""
+
+import asyncio
+import logging
+from datetime import date
+
+from redis.asyncio import Redis
+
+from src.core import HttpException
+from src.model import EventModel
+
+from .event import EventService
+from .timezone import TimezoneService
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DIGEST_TTL: int = 3 * 24 * 60 * 60
+
+
+def render_digest(event_date: date, events: list[EventModel]) -> str:
+    """Render the daily digest message of a user.
+
+    Arguments:
+        event_date: The date of the events.
+        events: The events of the user.
+
+    Returns:
+        The HTML formatted message.
+    """
+    lines: list[str] = [
+        f"<b>Hey!!! Good morning!</b> I'm here to list your today's events!\n\n"
+        f"<b>{event_date}</b> – {len(events)} "
+        f"event{'s' if len(events) != 1 else ''} 📅\n"
+    ]
+
+    for event in events:
+        lines.append(f"  • {event.description}  ⏰ {event.time}")
+
+    return "\n".join(lines)
+
+
+class DigestService:
+    """Digest service class.
+
+    The digests of a date are rendered ahead of time and stored in redis with the
+    highest event id seen by the snapshot. At send time, only the users who have
+    events created after the snapshot are rendered again.
+
+    The digests of a date are sent in waves, and each wave only reads the digests
+    of the users whose timezones are in it. The timezones which a wave claims are
+    recorded for the date, so the later waves do not send them again.
+    """
+
+    def __init__(
+        self,
+        event_service: EventService,
+        timezone_service: TimezoneService,
+        redis: Redis,
+        key_prefix: str = "digest",
+        ttl: int = DIGEST_TTL,
+    ):
+        """Initialize the service.
+
+        Arguments:
+            event_service: The event service to fetch events.
+            timezone_service: The timezone service to find the users of a wave.
+            redis: The redis client which is created with `decode_responses=True`.
+            key_prefix: The prefix of the redis keys.
+            ttl: The lifetime of the stored digests in seconds.
+        """
+        self.event_service: EventService = event_service
+        self.timezone_service: TimezoneService = timezone_service
+        self.redis: Redis = redis
+        self.key_prefix: str = key_prefix
+        self.ttl: int = ttl
+
+    async def prepare(self, event_date: date) -> int:
+        """Render the digests of the given date and store them.
+
+        Arguments:
+            event_date: The date of the digests.
+
+        Returns:
+            Number of the stored digests.
+        """
+        events: dict[
+            str, list[EventModel]
+        ] = await self.event_service.get_all_events_of_date(event_date=event_date)
+        digests: dict[str, str] = {
+            telegram_id: render_digest(event_date, user_events)
+            for telegram_id, user_events in events.items()
+        }
+        watermark: int = max(
+            (event.id for user_events in events.values() for event in user_events),
+            default=0,
+        )
+
+        digests_key, watermark_key = self._keys(event_date)
+        async with self.redis.pipeline(transaction=True) as pipeline:
+            pipeline.delete(digests_key)
+            if digests:
+                pipeline.hset(digests_key, mapping=digests)
+                pipeline.expire(digests_key, self.ttl)
+            pipeline.set(watermark_key, watermark, ex=self.ttl)
+            await pipeline.execute()
+
+        return len(digests)
+
+    async def claim_timezones(self, event_date: date, timezones: set[str]) -> set[str]:
+        """Claim the timezones of a wave which are not claimed for the date yet.
+
+        Arguments:
+            event_date: The local date of the timezones.
+            timezones: The timezones of the wave.
+
+        Returns:
+            The timezones which are claimed by this call.
+        """
+        names: list[str] = sorted(timezones)
+        if not names:
+            return set()
+
+        sent_key: str = self._sent_key(event_date)
+        async with self.redis.pipeline(transaction=True) as pipeline:
+            for name in names:
+                pipeline.sadd(sent_key, name)
+            pipeline.expire(sent_key, self.ttl)
+            added: list[int] = await pipeline.execute()
+
+        return {name for name, count in zip(names, added[:-1], strict=True) if count}
+
+    async def get_wave_digests(
+        self, event_date: date, timezones: set[str]
+    ) -> dict[str, str]:
+        """Get the digests of the users whose timezones are in the wave.
+
+        The users of the default timezone can not be listed, so the wave of the
+        default timezone reads every digest of the date and filters them.
+
+        Arguments:
+            event_date: The local date of the timezones.
+            timezones: The timezones of the wave.
+
+        Returns:
+            The digest messages of the users by their telegram ids.
+        """
+        if self.timezone_service.default_timezone in timezones:
+            digests: dict[str, str] = await self.get_digests(event_date)
+            user_timezones: dict[str, str] = await self.timezone_service.get_timezones(
+                digests
+            )
+            return {
+                telegram_id: digest
+                for telegram_id, digest in digests.items()
+                if user_timezones[telegram_id] in timezones
+            }
+
+        users: set[str] = await self.timezone_service.get_users(timezones)
+        return await self.get_digests(event_date, users) if users else {}
+
+    async def get_digests(
+        self, event_date: date, telegram_ids: set[str] | None = None
+    ) -> dict[str, str]:
+        """Get the rendered digests of the given date.
+
+        The stored snapshot is corrected by the events created after it, and it is
+        returned as it is if the api is unavailable. If there is no snapshot, every
+        digest is rendered.
+
+        Arguments:
+            event_date: The date of the digests.
+            telegram_ids: The users to get the digests of. Every user if it is not
+                given.
+
+        Returns:
+            The digest messages of the users by their telegram ids.
+        """
+        digests_key, watermark_key = self._keys(event_date)
+        watermark: str | None = await self.redis.get(watermark_key)
+        if watermark is None:
+            events: dict[
+                str, list[EventModel]
+            ] = await self.event_service.get_all_events_of_date(event_date=event_date)
+            return {
+                telegram_id: render_digest(event_date, user_events)
+                for telegram_id, user_events in events.items()
+                if telegram_ids is None or telegram_id in telegram_ids
+            }
+
+        digests: dict[str, str]
+        if telegram_ids is None:
+            digests = await self.redis.hgetall(digests_key)
+        else:
+            users: list[str] = list(telegram_ids)
+            stored: list[str | None] = await self.redis.hmget(digests_key, users)
+            digests = {
+                user: digest
+                for user, digest in zip(users, stored, strict=True)
+                if digest is not None
+            }
+
+        try:
+            created: dict[
+                str, list[EventModel]
+            ] = await self.event_service.get_all_events_of_date(
+                event_date=event_date, after_id=int(watermark)
+            )
+            if telegram_ids is not None:
+                created = {
+                    telegram_id: user_events
+                    for telegram_id, user_events in created.items()
+                    if telegram_id in telegram_ids
+                }
+            corrected: list[dict[date, list[EventModel]]] = await asyncio.gather(
+                *(
+                    self.event_service.get_events_between(
+                        telegram_id=int(telegram_id),
+                        start_date=event_date,
+                        end_date=event_date,
+                    )
+                    for telegram_id in created
+                )
+            )
+        except HttpException:
+            logger.warning(f"Digests of {event_date} are sent without corrections.")
+            return digests
+
+        for telegram_id, user_events in zip(created, corrected, strict=True):
+            digests[telegram_id] = render_digest(
+                event_date, user_events.get(event_date, [])
+            )
+
+        return digests
+
+    async def close(self) -> None:
+        """Close the redis connections."""
+        await self.redis.aclose()
+
+    def _keys(self, event_date: date) -> tuple[str, str]:
+        """Get the redis keys of the digests and the watermark of the date."""
+        return (
+            f"{self.key_prefix}:{event_date}",
+            f"{self.key_prefix}:{event_date}:watermark",
+        )
+
+    def _sent_key(self, event_date: date) -> str:
+        """Get the redis key of the claimed timezones of the date."""
+        return f"{self.key_prefix}:{event_date}:sent"
@@ -1,18 +1,79 @@
 """Event service module."""
 
+import logging
 from datetime import date, time, timedelta
 from typing import Any
 
 from pydantic import validate_call
+from redis.exceptions import RedisError
 
-from src.core import configuration
+from src.core import CircuitOpenException, configuration
 from src.model import EventModel
 
-from .utils import HTTPMethods, send_http_request
+from .breaker import CircuitState
+from .cache import CountWindow, EventCache, EventWindow
+from .client import ApiClient
+from .reminder import ReminderService
+from .singleflight import SingleFlight
+from .timezone import TimezoneService
+from .utils import HTTPMethods
+
+logger: logging.Logger = logging.getLogger(__name__)
 
 
 class EventService:
-    """Event service class."""
+    """Event service class.
+
+    The concurrent fetches of the same events share a single request to the api,
+    and each caller gets its own models which are built from the shared response.
+
+    If a cache is given, the upcoming events of the users are served from it, and
+    the created events are written through to it. While the circuit of the api is
+    open, the upcoming events are served from the expired windows of the cache.
+
+    If a reminder service is given, the reminders of the created events are
+    scheduled in the timezones of their users.
+    """
+
+    def __init__(
+        self,
+        client: ApiClient,
+        cache: EventCache | None = None,
+        reminder_service: ReminderService | None = None,
+        timezone_service: TimezoneService | None = None,
+    ):
+        """Initialize the service.
+
+        Arguments:
+            client: The shared http client of the api.
+            cache: The optional cache of the upcoming events of the users.
+            reminder_service: The optional service to schedule the reminders of
+                the created events.
+            timezone_service: The service to find the timezones of the users for
+                the reminders. The default timezone is used if it is not given.
+        """
+        self.client: ApiClient = client
+        self.cache: EventCache | None = cache
+        self.reminder_service: ReminderService | None = reminder_service
+        self.timezone_service: TimezoneService | None = timezone_service
+        self._user_events: SingleFlight = SingleFlight()
+        self._date_events: SingleFlight = SingleFlight()
+
+    @property
+    def api_available(self) -> bool:
+        """Check whether the api calls are allowed by the circuit breaker.
+
+        The upcoming events may be stale if it is not.
+        """
+        return self.client.breaker.state != CircuitState.OPEN
+
+    async def close(self) -> None:
+        """Close the connections of the api client, the cache and the reminders."""
+        await self.client.close()
+        if self.cache is not None:
+            await self.cache.close()
+        if self.reminder_service is not None:
+            await self.reminder_service.close()
 
     @validate_call
     async def create_new_event(
@@ -20,6 +81,11 @@ class EventService:
     ) -> None:
         """Create a new event by sending an http request to the api.
 
+        The event is added to the cached events and event counts of the user. They
+        are dropped if the api does not return the id of the event. The reminder of
+        the event is scheduled, and its redis errors are logged since the event is
+        already created.
+
         Arguments:
             telegram_id: Telegram id of the users.
             date: The date of the event.
@@ -29,8 +95,8 @@ class EventService:
         Return:
             None.
         """
-        await send_http_request(
-            url=str(configuration.API.URL) + "event/",
+        response: dict[str, Any] = await self.client.request(
+            "event/",
             body={
                 "userId": str(telegram_id),
                 "date": str(date),
@@ -39,68 +105,290 @@ class EventService:
             },
             method=HTTPMethods.POST,
         )
+        await self._schedule_reminder(telegram_id, date, time, description)
+        if self.cache is None:
+            return
+
+        if "id" not in response:
+            await self.cache.invalidate(telegram_id)
+            return
+        await self.cache.add(
+            EventModel(
+                id=response["id"],
+                userId=str(telegram_id),
+                date=date,
+                time=time,
+                description=description,
+            )
+        )
 
     @validate_call
     async def get_events_by_user(
         self, telegram_id: int, day: int
     ) -> dict[date, list[EventModel]]:
-        """Get the events of the user after sorting by date and time.
+        """Get the events of the user which are grouped by date.
+
+        The events are served from the cache if it has them, otherwise they are
+        fetched and cached. The last cached events are served if the circuit of the
+        api is open.
 
         Arguments:
             telegram_id: Telegram id to filter events.
             day: The day filter.
 
         Returns:
-            The sorted events of the user.
+            The events of the user. Dates and the events of each date are sorted.
+
+        Raises:
+            CircuitOpenException: If the circuit is open and the events are not
+                cached.
         """
         start_date: date = date.today()
         end_date: date = start_date + timedelta(days=day)
-        response: list[dict[str, Any]] = await send_http_request(
-            url=str(configuration.API.URL) + "event/",
-            params={
-                "userIds": telegram_id,
-                "start_date": start_date,
-                "end_date": end_date,
-            },
+        if self.cache is not None:
+            window: EventWindow | None = await self.cache.get(telegram_id)
+            if window is not None and window.covers(start_date, end_date):
+                return window.between(start_date, end_date)
+
+        try:
+            events: dict[date, list[EventModel]] = await self.get_events_between(
+                telegram_id=telegram_id, start_date=start_date, end_date=end_date
+            )
+        except CircuitOpenException:
+            stale: dict[date, list[EventModel]] | None = await self._get_stale_events(
+                telegram_id=telegram_id, start_date=start_date, end_date=end_date
+            )
+            if stale is None:
+                raise
+            return stale
+        if self.cache is not None:
+            await self.cache.set(
+                telegram_id,
+                EventWindow(start_date=start_date, end_date=end_date, events=events),
+            )
+        return events
+
+    @validate_call
+    async def get_events_of_user_date(
+        self, telegram_id: int, event_date: date, day: int
+    ) -> list[EventModel]:
+        """Get the events of the user on the date.
+
+        The date is served from the upcoming events of the user if it is in them.
+
+        Arguments:
+            telegram_id: Telegram id to filter events.
+            event_date: The date of the events.
+            day: The day filter of the upcoming events.
+
+        Returns:
+            The events of the date which are sorted.
+        """
+        events: dict[date, list[EventModel]]
+        if self.cache is not None and 0 <= (event_date - date.today()).days <= day:
+            events = await self.get_events_by_user(telegram_id=telegram_id, day=day)
+        else:
+            events = await self.get_events_between(
+                telegram_id=telegram_id, start_date=event_date, end_date=event_date
+            )
+        return events.get(event_date, [])
+
+    @validate_call
+    async def get_events_between(
+        self, telegram_id: int, start_date: date, end_date: date
+    ) -> dict[date, list[EventModel]]:
+        """Get the events of the user in the date range which are grouped by date.
+
+        Arguments:
+            telegram_id: Telegram id to filter events.
+            start_date: Start date of the range.
+            end_date: End date of the range.
+
+        Returns:
+            The events of the user. Dates and the events of each date are sorted.
+        """
+        response: dict[str, list[dict[str, Any]]] = await self._user_events.do(
+            (telegram_id, start_date, end_date),
+            lambda: self.client.request(
+                "event/grouped",
+                params={
+                    "by": "date",
+                    "userIds": telegram_id,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                },
+            ),
         )
 
-        result: dict[date, list[EventModel]] = {}
-        for event_raw in response:
-            event: EventModel = EventModel(**event_raw)
-            if event.date not in result:
-                result[event.date] = []
-            result[event.date].append(event)
+        return {
+            date.fromisoformat(event_date): [
+                EventModel(**event_raw) for event_raw in events_raw
+            ]
+            for event_date, events_raw in response.items()
+        }
 
-        for d in result:
-            result[d].sort(key=lambda e: e.time)
+    @validate_call
+    async def get_event_counts_by_user(
+        self, telegram_id: int, day: int
+    ) -> dict[date, int]:
+        """Get the number of the events of the user for each date.
+
+        The numbers are counted from the cached upcoming events if they cover the
+        range, or served from the cached numbers. Otherwise they are fetched from
+        the summary of the api without fetching the events, and cached. The last
+        cached numbers are served if the circuit of the api is open.
+
+        Arguments:
+            telegram_id: Telegram id to filter events.
+            day: The day filter.
+
+        Returns:
+            The number of events of each date which has an event. Dates are sorted.
+
+        Raises:
+            CircuitOpenException: If the circuit is open and the events are not
+                cached.
+        """
+        start_date: date = date.today()
+        end_date: date = start_date + timedelta(days=day)
+        if self.cache is not None:
+            window: EventWindow | None = await self.cache.get(telegram_id)
+            if window is not None and window.covers(start_date, end_date):
+                return {
+                    event_date: len(items)
+                    for event_date, items in window.between(
+                        start_date, end_date
+                    ).items()
+                }
+            counts: CountWindow | None = await self.cache.get_counts(telegram_id)
+            if counts is not None and counts.covers(start_date, end_date):
+                return counts.between(start_date, end_date)
+
+        try:
+            response: list[dict[str, Any]] = await self.client.request(
+                "event/summary",
+                params={
+                    "userIds": telegram_id,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                },
+            )
+        except CircuitOpenException:
+            stale: dict[date, int] | None = await self._get_stale_counts(
+                telegram_id=telegram_id, start_date=start_date, end_date=end_date
+            )
+            if stale is None:
+                raise
+            return stale
+
+        numbers: dict[date, int] = {
+            date.fromisoformat(row["date"]): row["count"] for row in response
+        }
+        if self.cache is not None:
+            await self.cache.set_counts(
+                telegram_id,
+                CountWindow(start_date=start_date, end_date=end_date, counts=numbers),
+            )
+        return numbers
+
+    async def _schedule_reminder(
+        self, telegram_id: int, event_date: date, event_time: time, description: str
+    ) -> None:
+        """Schedule the reminder of a created event if reminders are enabled."""
+        if self.reminder_service is None:
+            return
+
+        try:
+            timezone: str = (
+                await self.timezone_service.get_timezone(telegram_id)
+                if self.timezone_service is not None
+                else configuration.DEFAULT_TIMEZONE
+            )
+            await self.reminder_service.schedule(
+                telegram_id=telegram_id,
+                event_date=event_date,
+                event_time=event_time,
+                description=description,
+                timezone=timezone,
+            )
+        except RedisError as e:
+            logger.warning(f"Reminder of {telegram_id} can not be scheduled: {e!r}")
 
-        return result
+    async def _get_stale_events(
+        self, telegram_id: int, start_date: date, end_date: date
+    ) -> dict[date, list[EventModel]] | None:
+        """Get the events of the user in the date range from an expired window.
+
+        Arguments:
+            telegram_id: Telegram id to filter events.
+            start_date: Start date of the range.
+            end_date: End date of the range.
+
+        Returns:
+            The events of the user. `None` if no cached window covers the range.
+        """
+        if self.cache is None:
+            return None
+        window: EventWindow | None = await self.cache.get(telegram_id, stale=True)
+        if window is None or not window.covers(start_date, end_date):
+            return None
+        return window.between(start_date, end_date)
+
+    async def _get_stale_counts(
+        self, telegram_id: int, start_date: date, end_date: date
+    ) -> dict[date, int] | None:
+        """Get the event counts of the user in the date range from an expired window.
+
+        Arguments:
+            telegram_id: Telegram id to filter events.
+            start_date: Start date of the range.
+            end_date: End date of the range.
+
+        Returns:
+            The number of events of each date. `None` if no cached window covers
+            the range.
+        """
+        events: dict[date, list[EventModel]] | None = await self._get_stale_events(
+            telegram_id=telegram_id, start_date=start_date, end_date=end_date
+        )
+        if events is not None:
+            return {event_date: len(items) for event_date, items in events.items()}
+        if self.cache is None:
+            return None
+        window: CountWindow | None = await self.cache.get_counts(
+            telegram_id, stale=True
+        )
+        if window is None or not window.covers(start_date, end_date):
+            return None
+        return window.between(start_date, end_date)
 
     @validate_call
     async def get_all_events_of_date(
-        self, event_date: date
+        self, event_date: date, after_id: int | None = None
     ) -> dict[str, list[EventModel]]:
         """Get all events of the given date.
 
         Arguments:
             event_date: Event date to fetch events.
+            after_id: Only the events whose ids are greater than it are fetched.
 
         Returns:
             The events which are grouped by users.
         """
-        response: list[dict[str, Any]] = await send_http_request(
-            url=str(configuration.API.URL) + "event/",
-            params={
-                "start_date": event_date,
-                "end_date": event_date,
-            },
-        )
+        params: dict[str, Any] = {
+            "by": "userId",
+            "start_date": event_date,
+            "end_date": event_date,
+        }
+        if after_id is not None:
+            params["after_id"] = after_id
 
-        result: dict[str, list[EventModel]] = {}
-        for event_raw in response:
-            event: EventModel = EventModel(**event_raw)
-            if event.userId not in result:
-                result[event.userId] = []
-            result[event.userId].append(event)
+        response: dict[str, list[dict[str, Any]]] = await self._date_events.do(
+            (event_date, after_id),
+            lambda: self.client.request("event/grouped", params=params),
+        )
 
-        return result
+        return {
+            user_id: [EventModel(**event_raw) for event_raw in events_raw]
+            for user_id, events_raw in response.items()
+        }
@@ -1,15 +1,126 @@
 """Service factory module."""
 
+from datetime import timedelta
 from functools import lru_cache
 
+from aiogram import Bot
+from redis.asyncio import Redis
+
+from src.core import configuration
+
+from .breaker import CircuitBreaker
+from .cache import EventCache
+from .client import ApiClient
+from .digest import DigestService
 from .event import EventService
+from .reminder import ReminderService
+from .sender import MessageSender, RedisTokenBucket
+from .timezone import TimezoneService
 
 
 class ServiceFactory:
     """Service factory class."""
 
+    @staticmethod
+    @lru_cache
+    def create_api_client() -> ApiClient:
+        """Create the pooled api client(Singleton.)."""
+        return ApiClient(
+            base_url=str(configuration.API.URL),
+            user=configuration.API.USER,
+            password=configuration.API.PASS,
+            max_connections=configuration.API.MAX_CONNECTIONS,
+            timeout=configuration.API.TIMEOUT,
+            retries=configuration.API.RETRIES,
+            breaker=CircuitBreaker(
+                failure_threshold=configuration.API.FAILURE_THRESHOLD,
+                reset_timeout=configuration.API.RESET_TIMEOUT,
+            ),
+        )
+
     @staticmethod
     @lru_cache
     def create_event_service() -> EventService:
-        """Create event service(Singleton.)."""
-        return EventService()
+        """Create event service(Singleton.).
+
+        The upcoming events of the users are cached in the process, and also in
+        redis if it is enabled. The reminders of the created events are scheduled.
+        """
+        return EventService(
+            client=ServiceFactory.create_api_client(),
+            cache=EventCache(
+                maxsize=configuration.EVENT_CACHE.SIZE,
+                ttl=configuration.EVENT_CACHE.TTL,
+                stale_ttl=configuration.EVENT_CACHE.STALE_TTL,
+                redis=(
+                    ServiceFactory.create_redis_client()
+                    if configuration.EVENT_CACHE.REDIS
+                    else None
+                ),
+            ),
+            reminder_service=ServiceFactory.create_reminder_service(),
+            timezone_service=ServiceFactory.create_timezone_service(),
+        )
+
+    @staticmethod
+    def create_redis_client() -> Redis:
+        """Create a redis client which decodes the responses."""
+        return Redis(
+            host=configuration.REDIS.HOST,
+            port=configuration.REDIS.PORT,
+            password=configuration.REDIS.PASS,
+            decode_responses=True,
+        )
+
+    @staticmethod
+    def create_timezone_service() -> TimezoneService:
+        """Create timezone service.
+
+        A new instance is created for each call since the redis client is bound to
+        the event loop which uses it.
+        """
+        return TimezoneService(redis=ServiceFactory.create_redis_client())
+
+    @staticmethod
+    def create_digest_service() -> DigestService:
+        """Create digest service.
+
+        A new instance is created for each call since the redis client is bound to
+        the event loop which uses it.
+        """
+        redis: Redis = ServiceFactory.create_redis_client()
+        return DigestService(
+            event_service=ServiceFactory.create_event_service(),
+            timezone_service=TimezoneService(redis=redis),
+            redis=redis,
+        )
+
+    @staticmethod
+    def create_message_sender(bot: Bot) -> MessageSender:
+        """Create a message sender of the bot which follows the rate limits.
+
+        The rate is shared through redis by every sender, so the concurrent tasks
+        and the worker processes do not exceed it together.
+        """
+        return MessageSender(
+            bot=bot,
+            chat_interval=configuration.SENDER.CHAT_INTERVAL,
+            concurrency=configuration.SENDER.CONCURRENCY,
+            retries=configuration.SENDER.RETRIES,
+            bucket=RedisTokenBucket(
+                redis=ServiceFactory.create_redis_client(),
+                rate=configuration.SENDER.RATE,
+            ),
+        )
+
+    @staticmethod
+    def create_reminder_service() -> ReminderService:
+        """Create reminder service.
+
+        A new instance is created for each call since the redis client is bound to
+        the event loop which uses it.
+        """
+        return ReminderService(
+            redis=ServiceFactory.create_redis_client(),
+            lead=timedelta(minutes=configuration.REMINDER_MINUTES),
+        )
@@ -0,0 +1,164 @@
+"""Reminder service module."""
+
+from datetime import date, datetime, time, timedelta
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+from redis.asyncio import Redis
+
+from src.model import ReminderModel
+
+POP_DUE_SCRIPT: str = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #items > 0 then
+    redis.call('ZREM', KEYS[1], unpack(items))
+end
+return items
+"""
+
+
+def render_reminder(reminder: ReminderModel) -> str:
+    """Render the reminder message of an event.
+
+    Arguments:
+        reminder: The reminder of the event.
+
+    Returns:
+        The HTML formatted message.
+    """
+    return (
+        f"⏰ <b>Reminder!</b> {reminder.description}\n"
+        f"<b>{reminder.date}</b> at {reminder.time}"
+    )
+
+
+class ReminderService:
+    """Reminder service class.
+
+    Reminders are stored in a redis sorted set which is scored by their due
+    timestamps, so every tick of the worker only reads the due reminders. The
+    reminders which could not be sent are rescheduled until their attempts run
+    out.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        lead: timedelta,
+        key: str = "reminder:due",
+        retry_delay: timedelta = timedelta(minutes=1),
+        max_attempts: int = 3,
+    ):
+        """Initialize the service.
+
+        Arguments:
+            redis: The redis client which is created with `decode_responses=True`.
+            lead: The duration between the reminder and the event.
+            key: The redis key of the sorted set.
+            retry_delay: The duration before a failed reminder is due again.
+            max_attempts: Maximum number of the attempts to send a reminder.
+        """
+        self.redis: Redis = redis
+        self.lead: timedelta = lead
+        self.key: str = key
+        self.retry_delay: timedelta = retry_delay
+        self.max_attempts: int = max_attempts
+        self._pop_due = self.redis.register_script(POP_DUE_SCRIPT)
+
+    async def schedule(
+        self,
+        telegram_id: int,
+        event_date: date,
+        event_time: time,
+        description: str,
+        timezone: str,
+        now: datetime | None = None,
+    ) -> bool:
+        """Schedule the reminder of an event.
+
+        The reminder is due `lead` before the event in the timezone of the user. It
+        is due immediately if the event is sooner than `lead`.
+
+        Arguments:
+            telegram_id: Telegram id of the user.
+            event_date: The date of the event.
+            event_time: The time of the event.
+            description: The description of the event.
+            timezone: The timezone of the user.
+            now: The current time. It is only given by tests.
+
+        Returns:
+            Whether the reminder is scheduled. Past events are not scheduled.
+        """
+        now = now or datetime.now(ZoneInfo(timezone))
+        starts_at: datetime = datetime.combine(
+            event_date, event_time, ZoneInfo(timezone)
+        )
+        if starts_at <= now:
+            return False
+
+        reminder: ReminderModel = ReminderModel(
+            id=uuid4().hex,
+            telegram_id=telegram_id,
+            date=event_date,
+            time=event_time,
+            description=description,
+        )
+        due: datetime = max(starts_at - self.lead, now)
+        await self.redis.zadd(self.key, {reminder.model_dump_json(): due.timestamp()})
+
+        return True
+
+    async def pop_due(
+        self, limit: int = 100, now: datetime | None = None
+    ) -> list[ReminderModel]:
+        """Remove and return a batch of the due reminders.
+
+        The batch is popped atomically, so concurrent workers do not send the same
+        reminder twice.
+
+        Arguments:
+            limit: Maximum number of the reminders in the batch.
+            now: The current time. It is only given by tests.
+
+        Returns:
+            The due reminders ordered by their due times.
+        """
+        timestamp: float = (now or datetime.now().astimezone()).timestamp()
+        items: list[str] = await self._pop_due(keys=[self.key], args=[timestamp, limit])
+
+        return [ReminderModel.model_validate_json(item) for item in items]
+
+    async def reschedule(
+        self, reminders: list[ReminderModel], now: datetime | None = None
+    ) -> int:
+        """Schedule the reminders which could not be sent again.
+
+        The reminders are due after the retry delay, and the ones which used all of
+        their attempts are dropped.
+
+        Arguments:
+            reminders: The reminders which could not be sent.
+            now: The current time. It is only given by tests.
+
+        Returns:
+            Number of the rescheduled reminders.
+        """
+        due: float = (
+            (now or datetime.now().astimezone()) + self.retry_delay
+        ).timestamp()
+        items: dict[str, float] = {
+            reminder.model_copy(
+                update={"attempts": reminder.attempts + 1}
+            ).model_dump_json(): due
+            for reminder in reminders
+            if reminder.attempts + 1 < self.max_attempts
+        }
+        if items:
+            await self.redis.zadd(self.key, items)
+
+        return len(items)
+
+    async def close(self) -> None:
+        """Close the redis connections."""
+        await self.redis.aclose()
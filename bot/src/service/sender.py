@@ -0,0 +1,337 @@
+"""Message fan-out module."""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from time import monotonic
+
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramForbiddenError,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+BUCKET_TTL_MS: int = 3_600_000
+
+TAKE_TOKEN_SCRIPT: str = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+local rate = tonumber(ARGV[1]) / 1000
+local capacity = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+if now < updated_at then
+    return math.ceil(updated_at - now)
+end
+
+tokens = math.min(capacity, tokens + (now - updated_at) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return wait
+"""
+
+PAUSE_SCRIPT: str = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+local updated_at = tonumber(redis.call('HGET', KEYS[1], 'updated_at')) or now
+local paused_until = math.max(updated_at, now + tonumber(ARGV[1]))
+redis.call('HSET', KEYS[1], 'tokens', 0, 'updated_at', paused_until)
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+"""
+
+
+class TokenBucket:
+    """Token bucket rate limiter.
+
+    Tokens are refilled continuously at the rate up to the capacity, and the
+    waiters take them in their arrival order. The bucket can be paused, e.g. when
+    Telegram asks to retry after a while.
+
+    Methods:
+        acquire: Wait for a token and take it.
+        pause: Stop giving tokens for a while.
+        close: Release the resources of the bucket.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize the bucket.
+
+        Arguments:
+            rate: Number of the tokens which are refilled per second.
+            capacity: Maximum number of the tokens. It is the rate if it is not
+                given.
+        """
+        self.rate: float = rate
+        self.capacity: float = capacity if capacity is not None else rate
+        self._tokens: float = self.capacity
+        self._updated_at: float = monotonic()
+        self._paused_until: float = 0.0
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for a token and take it."""
+        async with self._lock:
+            while True:
+                now: float = monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def pause(self, seconds: float) -> None:
+        """Stop giving tokens for a while and empty the bucket.
+
+        Arguments:
+            seconds: Seconds to stop giving tokens.
+        """
+        self._paused_until = max(self._paused_until, monotonic() + seconds)
+        self._updated_at = self._paused_until
+        self._tokens = 0.0
+
+    async def close(self) -> None:
+        """Release the resources of the bucket."""
+
+
+class RedisTokenBucket:
+    """Token bucket rate limiter which is shared through redis.
+
+    The state of the bucket is kept in a redis hash and updated atomically by
+    scripts with the clock of redis, so every process which uses the same key
+    shares the rate, e.g. the concurrent celery tasks.
+
+    Methods:
+        acquire: Wait for a token and take it.
+        pause: Stop giving tokens for a while.
+        close: Close the redis connections.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        rate: float,
+        capacity: float | None = None,
+        key: str = "sender:bucket",
+    ):
+        """Initialize the bucket.
+
+        Arguments:
+            redis: The redis client.
+            rate: Number of the tokens which are refilled per second.
+            capacity: Maximum number of the tokens. It is the rate if it is not
+                given.
+            key: The redis key of the bucket.
+        """
+        self.redis: Redis = redis
+        self.rate: float = rate
+        self.capacity: float = capacity if capacity is not None else rate
+        self.key: str = key
+        self._take = self.redis.register_script(TAKE_TOKEN_SCRIPT)
+        self._pause = self.redis.register_script(PAUSE_SCRIPT)
+
+    async def acquire(self) -> None:
+        """Wait for a token and take it."""
+        while wait := await self._take(
+            keys=[self.key], args=[self.rate, self.capacity, BUCKET_TTL_MS]
+        ):
+            await asyncio.sleep(wait / 1000)
+
+    async def pause(self, seconds: float) -> None:
+        """Stop giving tokens for a while and empty the bucket.
+
+        Arguments:
+            seconds: Seconds to stop giving tokens.
+        """
+        await self._pause(keys=[self.key], args=[int(seconds * 1000), BUCKET_TTL_MS])
+
+    async def close(self) -> None:
+        """Close the redis connections."""
+        await self.redis.aclose()
+
+
+class SendReport(BaseModel):
+    """Counters of a fan-out run.
+
+    Attributes:
+        sent: Number of the sent messages.
+        blocked: Number of the chats which blocked the bot or are deactivated.
+        failed: Number of the messages which could not be sent.
+        retried: Number of the retried attempts.
+        elapsed: Duration of the run in seconds.
+        unsent: Indexes of the failed messages which can be sent again later, e.g.
+            after network or server errors.
+    """
+
+    sent: int = 0
+    blocked: int = 0
+    failed: int = 0
+    retried: int = 0
+    elapsed: float = 0.0
+    unsent: list[int] = []
+
+    @property
+    def throughput(self) -> float:
+        """Get the number of the sent messages per second."""
+        return self.sent / self.elapsed if self.elapsed else 0.0
+
+
+class MessageSender:
+    """Concurrent and rate limited sender of many messages.
+
+    The messages are sent by concurrent workers. Every message takes a token from
+    the bucket of the sender which follows the broadcast limit of Telegram, and the
+    messages of the same chat are spaced by the chat interval. The bucket and the
+    chat times are kept across the calls, and the bucket can be shared through
+    redis by the processes. `TelegramRetryAfter` pauses the bucket before the
+    message is retried, and network or server errors are retried with backoff. The
+    chats which blocked the bot are counted and skipped without being retried.
+
+    Methods:
+        send_all: Send the messages and report the counters.
+        close: Release the resources of the bucket.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        rate: float = 30.0,
+        chat_interval: float = 1.0,
+        concurrency: int = 50,
+        retries: int = 3,
+        backoff: float = 1.0,
+        bucket: TokenBucket | RedisTokenBucket | None = None,
+    ):
+        """Initialize the sender.
+
+        Arguments:
+            bot: The bot which sends the messages.
+            rate: Maximum number of the messages per second.
+            chat_interval: Minimum seconds between the messages of a chat.
+            concurrency: Number of the concurrent workers.
+            retries: Maximum number of the retries of a message.
+            backoff: Base delay of the retries after network or server errors.
+            bucket: The rate limiter of the messages. A bucket of the rate is
+                created if it is not given.
+        """
+        self.bot: Bot = bot
+        self.chat_interval: float = chat_interval
+        self.concurrency: int = concurrency
+        self.retries: int = retries
+        self.backoff: float = backoff
+        self.bucket: TokenBucket | RedisTokenBucket = bucket or TokenBucket(rate)
+        self._chat_times: dict[int | str, float] = {}
+
+    async def send_all(
+        self, messages: Iterable[tuple[int | str, str]], parse_mode: str = "HTML"
+    ) -> SendReport:
+        """Send the messages and report the counters.
+
+        Arguments:
+            messages: The chat ids and the texts of the messages.
+            parse_mode: Parse mode of the texts.
+
+        Returns:
+            The counters of the run.
+        """
+        report: SendReport = SendReport()
+        queue: asyncio.Queue[tuple[int, int | str, str] | None] = asyncio.Queue(
+            maxsize=self.concurrency * 2
+        )
+
+        async def worker() -> None:
+            while (message := await queue.get()) is not None:
+                index, chat_id, text = message
+                if not await self._send(report, chat_id, text, parse_mode):
+                    report.unsent.append(index)
+
+        started_at: float = monotonic()
+        async with asyncio.TaskGroup() as group:
+            for _ in range(self.concurrency):
+                group.create_task(worker())
+            for index, (chat_id, text) in enumerate(messages):
+                await queue.put((index, chat_id, text))
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        report.elapsed = monotonic() - started_at
+        report.unsent.sort()
+        logger.info(
+            f"{report.sent} messages are sent in {report.elapsed:.1f}s "
+            f"({report.throughput:.1f}/s), {report.blocked} blocked, "
+            f"{report.failed} failed, {report.retried} retried."
+        )
+        return report
+
+    async def close(self) -> None:
+        """Release the resources of the bucket."""
+        await self.bucket.close()
+
+    async def _send(
+        self,
+        report: SendReport,
+        chat_id: int | str,
+        text: str,
+        parse_mode: str,
+    ) -> bool:
+        """Send a message with its retries and count the result.
+
+        Returns:
+            Whether the message is sent or can not be sent at all. `False` if it
+            failed with the transient errors of its every attempt.
+        """
+        for attempt in range(self.retries + 1):
+            now: float = monotonic()
+            send_at: float = max(now, self._chat_times.get(chat_id, now))
+            self._chat_times[chat_id] = send_at + self.chat_interval
+            if send_at > now:
+                await asyncio.sleep(send_at - now)
+            await self.bucket.acquire()
+
+            try:
+                await self.bot.send_message(
+                    chat_id=chat_id, text=text, parse_mode=parse_mode
+                )
+            except TelegramRetryAfter as e:
+                await self.bucket.pause(e.retry_after)
+                delay: float = 0.0
+            except (TelegramNetworkError, TelegramServerError) as e:
+                logger.warning(f"Message to {chat_id} is not sent: {e!r}")
+                delay = self.backoff * 2**attempt
+            except TelegramForbiddenError:
+                report.blocked += 1
+                return True
+            except TelegramAPIError:
+                logger.exception(f"Message to {chat_id} could not be sent.")
+                report.failed += 1
+                return True
+            else:
+                report.sent += 1
+                return True
+
+            if attempt < self.retries:
+                report.retried += 1
+                await asyncio.sleep(delay)
+
+        report.failed += 1
+        return False
@@ -0,0 +1,47 @@
+"""Request coalescing module."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """Coalescer of the concurrent calls with the same key.
+
+    The first caller of a key starts the call in a task, and the callers which
+    come while it is running wait for the same task instead of starting a new one.
+    The key is forgotten when the call finishes, so the later callers start a new
+    call. A cancelled caller does not cancel the call of the other callers.
+
+    Methods:
+        do: Run the call of the key or join the running one.
+    """
+
+    def __init__(self):
+        """Initialize the coalescer."""
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run the call of the key or join the running one.
+
+        Arguments:
+            key: The key of the call.
+            call: The coroutine function which makes the call.
+
+        Returns:
+            The result of the call.
+        """
+        task: asyncio.Task | None = self._calls.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget the finished call and retrieve its exception."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,141 @@
+"""Timezone service module."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime, time
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from redis.asyncio import Redis
+
+from src.core import configuration
+
+
+def is_valid_timezone(name: str) -> bool:
+    """Check whether the name is an IANA timezone name."""
+    try:
+        ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return False
+    return True
+
+
+def get_due_timezones(
+    now: datetime,
+    timezones: Iterable[str],
+    send_time: time,
+) -> dict[date, set[str]]:
+    """Get the timezones whose local time has passed the send time.
+
+    The timezones are not limited to a window after the send time, so a wave
+    which starts late still finds them. The sent ones are skipped by the caller.
+
+    Arguments:
+        now: The current time which is timezone aware.
+        timezones: The timezones to check.
+        send_time: The local time which the sending starts.
+
+    Returns:
+        The due timezones grouped by their local dates.
+    """
+    waves: defaultdict[date, set[str]] = defaultdict(set)
+    for name in timezones:
+        local: datetime = now.astimezone(ZoneInfo(name))
+        if local.time() >= send_time:
+            waves[local.date()].add(name)
+
+    return dict(waves)
+
+
+class TimezoneService:
+    """Timezone service class.
+
+    The timezones of the users are stored in a redis hash. The users of each
+    timezone are also stored in a set, so the users of a send wave can be found
+    without scanning every user. The users who have not set a timezone use the
+    default timezone.
+    """
+
+    def __init__(self, redis: Redis, key_prefix: str = "timezone"):
+        """Initialize the service.
+
+        Arguments:
+            redis: The redis client which is created with `decode_responses=True`.
+            key_prefix: The prefix of the redis keys.
+        """
+        self.redis: Redis = redis
+        self.key_prefix: str = key_prefix
+        self.default_timezone: str = configuration.DEFAULT_TIMEZONE
+
+    async def set_timezone(self, telegram_id: int, timezone: str) -> None:
+        """Set the timezone of the user.
+
+        Arguments:
+            telegram_id: Telegram id of the user.
+            timezone: IANA name of the timezone.
+
+        Raises:
+            ValueError: If the timezone is not valid.
+        """
+        if not is_valid_timezone(timezone):
+            raise ValueError(f"Invalid timezone: {timezone}")
+
+        user: str = str(telegram_id)
+        previous: str | None = await self.redis.hget(self._users_key(), user)
+        async with self.redis.pipeline(transaction=True) as pipeline:
+            if previous:
+                pipeline.srem(self._members_key(previous), user)
+            pipeline.hset(self._users_key(), user, timezone)
+            pipeline.sadd(self._members_key(timezone), user)
+            pipeline.sadd(self._timezones_key(), timezone)
+            await pipeline.execute()
+
+    async def get_timezone(self, telegram_id: int) -> str:
+        """Get the timezone of the user or the default timezone."""
+        timezone: str | None = await self.redis.hget(
+            self._users_key(), str(telegram_id)
+        )
+        return timezone or self.default_timezone
+
+    async def get_timezones(self, telegram_ids: Iterable[str]) -> dict[str, str]:
+        """Get the timezones of the users.
+
+        Arguments:
+            telegram_ids: Telegram ids of the users.
+
+        Returns:
+            The timezones of the users. The default timezone is used for the users
+            who have not set one.
+        """
+        users: list[str] = list(telegram_ids)
+        if not users:
+            return {}
+
+        timezones: list[str | None] = await self.redis.hmget(self._users_key(), users)
+        return {
+            user: timezone or self.default_timezone
+            for user, timezone in zip(users, timezones, strict=True)
+        }
+
+    async def get_used_timezones(self) -> set[str]:
+        """Get the timezones which are set by any user and the default timezone."""
+        return {
+            *await self.redis.smembers(self._timezones_key()),
+            self.default_timezone,
+        }
+
+    async def get_users(self, timezones: Iterable[str]) -> set[str]:
+        """Get the users who have set one of the given timezones."""
+        keys: list[str] = [self._members_key(timezone) for timezone in timezones]
+        return await self.redis.sunion(keys) if keys else set()
+
+    def _users_key(self) -> str:
+        """Get the redis key of the timezones of the users."""
+        return f"{self.key_prefix}:users"
+
+    def _members_key(self, timezone: str) -> str:
+        """Get the redis key of the users of the timezone."""
+        return f"{self.key_prefix}:members:{timezone}"
+
+    def _timezones_key(self) -> str:
+        """Get the redis key of the used timezones."""
+        return f"{self.key_prefix}:all"
@@ -1,15 +1,16 @@
 """Utils functions for service module."""
 
-import urllib.parse
-from base64 import b64encode
+import gzip
+from collections.abc import Mapping
 from enum import Enum
-from json import dumps
+from json import loads
 from typing import Any
 
-from aiohttp import ClientSession
-from pydantic import validate_call
+import msgpack
+import zstandard
 
-from src.core import HttpException, configuration
+COMPRESSION_MINIMUM_SIZE: int = 1024
+MSGPACK: str = "application/msgpack"
 
 
 class HTTPMethods(str, Enum):
@@ -22,54 +23,39 @@ class HTTPMethods(str, Enum):
     DELETE = "delete"
 
 
-@validate_call
-async def send_http_request(
-    url: str,
-    params: dict[str, Any] | None = None,
-    method: HTTPMethods = HTTPMethods.GET,
-    body: Any = None,
-    headers: dict[str, str] | None = None,
-) -> Any:
-    """Send request to the specified url.
+def encode_body(body: Any) -> tuple[bytes, dict[str, str]]:
+    """Encode the request body as msgpack and compress it if it is large.
 
     Arguments:
-        url: URL to send request.
-        params: Query parameters of the request.
-        method: HTTP Method to send request.
-        body: Body parameters of the request.
-        headers: Headers of the request.
+        body: The body of the request.
 
     Returns:
-        The json response of the request.
+        The encoded body and its headers.
     """
-    request_url: str = f"{url}?{urllib.parse.urlencode(params)}" if params else url
-    print("Sending to ", request_url)
+    raw: bytes = msgpack.packb(body)
+    headers: dict[str, str] = {"Content-Type": MSGPACK}
+    if len(raw) >= COMPRESSION_MINIMUM_SIZE:
+        raw = zstandard.ZstdCompressor(level=3).compress(raw)
+        headers["Content-Encoding"] = "zstd"
+    return raw, headers
 
-    token: str = f"{configuration.API.USER}:{configuration.API.PASS}"
-    raw_headers: dict[str, str] = {
-        "Content-Type": "application/json",
-        "accept": "application/json",
-        "Authorization": f"Basic {b64encode(token.encode('utf-8')).decode('utf-8')}",
-    }
-    headers = {**raw_headers, **headers} if headers else raw_headers
 
-    raw_request_func_params: dict[str, str] = {
-        "method": method,
-        "url": request_url,
-    }
+def decode_body(raw: bytes, headers: Mapping[str, str]) -> Any:
+    """Decode a msgpack or json response body which may be compressed.
 
-    request_func_params: dict[str, Any] = (
-        {**raw_request_func_params, "data": dumps(body)}
-        if body
-        else raw_request_func_params
-    )
+    Arguments:
+        raw: The raw body of the response.
+        headers: The headers of the response.
 
-    async with (
-        ClientSession(headers=headers) as session,
-        session.request(**request_func_params) as response,
-    ):
-        if not response.ok:
-            error_message: str = "Request is failed!"
-            print(await response.json())
-            raise HttpException(error_message)
-        return await response.json()
+    Returns:
+        The decoded body.
+    """
+    encoding: str = headers.get("Content-Encoding", "").lower()
+    if encoding == "zstd":
+        raw = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    elif encoding == "gzip":
+        raw = gzip.decompress(raw)
+
+    if headers.get("Content-Type", "").startswith(MSGPACK):
+        return msgpack.unpackb(raw)
+    return loads(raw)
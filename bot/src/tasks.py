@@ -2,18 +2,32 @@
 
 import asyncio
 import logging
-from datetime import date
+from datetime import UTC, date, datetime, time, timedelta
 
 from aiogram import Bot
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown
 
 from src.core import configuration
-from src.model import EventModel
-from src.service import EventService, ServiceFactory
+from src.service import (
+    DigestService,
+    MessageSender,
+    ReminderService,
+    SendReport,
+    ServiceFactory,
+    get_due_timezones,
+    render_reminder,
+)
 
 logging.basicConfig(level=logging.INFO)
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+DIGEST_TIME: time = time(6, 0)
+WAVE_LENGTH: timedelta = timedelta(minutes=15)
+REMINDER_BATCH_SIZE: int = 100
+
 celery: Celery = Celery(
     "celery-app",
     broker=f"redis://:{configuration.REDIS.PASS}@"
@@ -21,57 +35,130 @@ celery: Celery = Celery(
 )
 
 
-async def handle_user_events(
-    bot: Bot, event_date: date, telegram_id: str, events: list[EventModel]
-) -> None:
-    """Handle the user's event by notifying."""
-    lines: list[str] = [
-        f"<b>Hey!!! Good morning!</b> I'm here to list your today's events!\n\n"
-        f"<b>{event_date}</b> – {len(events)} "
-        f"event{'s' if len(events) != 1 else ''} 📅\n"
-    ]
+async def prepare_digests() -> None:
+    """Render the digests of the next day ahead of time."""
+    digest_service: DigestService = ServiceFactory.create_digest_service()
 
-    for event in events:
-        lines.append(f"  • {event.description}  ⏰ {event.time}")
+    tomorrow: date = date.today() + timedelta(days=1)
+    try:
+        count: int = await digest_service.prepare(event_date=tomorrow)
+    finally:
+        await digest_service.close()
 
-    await bot.send_message(
-        chat_id=telegram_id, text="\n".join(lines), parse_mode="HTML"
-    )
+    logger.info(f"{count} digests are prepared for {tomorrow}.")
 
 
 async def main():
-    """Run the main celery."""
-    event_service: EventService = ServiceFactory.create_event_service()
+    """Send the digests to the users whose local time has passed the digest time.
+
+    The timezones which are not sent for their local date yet are claimed, so a
+    wave which starts late sends the digests that the missed waves did not. The
+    digests are collected and sent concurrently within the rate limits of
+    Telegram.
+    """
+    digest_service: DigestService = ServiceFactory.create_digest_service()
     bot: Bot = Bot(token=configuration.TELEGRAM_TOKEN)
+    sender: MessageSender = ServiceFactory.create_message_sender(bot)
 
-    today = date.today()
-    result: dict[str, list[EventModel]] = await event_service.get_all_events_of_date(
-        event_date=today,
-    )
-
-    for telegram_id in result:
-        await handle_user_events(
-            bot=bot,
-            event_date=today,
-            telegram_id=telegram_id,
-            events=result[telegram_id],
+    try:
+        waves: dict[date, set[str]] = get_due_timezones(
+            now=datetime.now(UTC),
+            timezones=await digest_service.timezone_service.get_used_timezones(),
+            send_time=DIGEST_TIME,
         )
 
-    await bot.session.close()
+        digests: dict[str, str] = {}
+        for event_date, timezones in waves.items():
+            claimed: set[str] = await digest_service.claim_timezones(
+                event_date=event_date, timezones=timezones
+            )
+            if claimed:
+                digests.update(
+                    await digest_service.get_wave_digests(
+                        event_date=event_date, timezones=claimed
+                    )
+                )
+
+        await sender.send_all(digests.items())
+    finally:
+        await digest_service.close()
+        await sender.close()
+        await bot.session.close()
+
+
+async def send_reminders() -> None:
+    """Send the due reminders batch by batch.
+
+    Every batch is sent concurrently within the rate limits of Telegram, and the
+    reminders which failed with transient errors are rescheduled.
+    """
+    reminder_service: ReminderService = ServiceFactory.create_reminder_service()
+    bot: Bot = Bot(token=configuration.TELEGRAM_TOKEN)
+    sender: MessageSender = ServiceFactory.create_message_sender(bot)
+
+    try:
+        while reminders := await reminder_service.pop_due(limit=REMINDER_BATCH_SIZE):
+            report: SendReport = await sender.send_all(
+                (reminder.telegram_id, render_reminder(reminder))
+                for reminder in reminders
+            )
+            rescheduled: int = await reminder_service.reschedule(
+                [reminders[index] for index in report.unsent]
+            )
+            if report.unsent:
+                logger.warning(
+                    f"{len(report.unsent)} reminders could not be sent, "
+                    f"{rescheduled} of them are rescheduled."
+                )
+    finally:
+        await reminder_service.close()
+        await sender.close()
+        await bot.session.close()
+
+
+@celery.task
+def prepare_daily_digests():
+    """Task to prepare the digests of the next day."""
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(prepare_digests())
 
 
 @celery.task
-def send_daily_message():
-    """Task to send daily message."""
+def send_digest_wave():
+    """Task to send the digests of the current wave."""
     loop = asyncio.get_event_loop()
     loop.run_until_complete(main())
 
 
+@celery.task
+def send_due_reminders():
+    """Task to send the due reminders."""
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(send_reminders())
+
+
+@worker_process_shutdown.connect
+def close_api_client(**kwargs):
+    """Close the pooled api connections of the worker process."""
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(ServiceFactory.create_api_client().close())
+
+
 @celery.on_after_configure.connect
 def setup_periodic_tasks(sender, **kwargs):
     """Setup periodic tasks."""
     sender.add_periodic_task(
-        crontab(hour="6", minute="0"),
-        send_daily_message.s(),
-        name="Daily messages",
+        crontab(hour="3", minute="0"),
+        prepare_daily_digests.s(),
+        name="Daily digests",
+    )
+    sender.add_periodic_task(
+        crontab(minute=f"*/{int(WAVE_LENGTH.total_seconds() // 60)}"),
+        send_digest_wave.s(),
+        name="Digest waves",
+    )
+    sender.add_periodic_task(
+        crontab(minute="*"),
+        send_due_reminders.s(),
+        name="Reminders",
     )
@@ -0,0 +1,23 @@
+"""Test fixtures."""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from redis.asyncio import Redis
+
+from src.core import configuration
+
+
+@pytest.fixture
+async def redis() -> AsyncGenerator[Redis, None]:
+    client = Redis(
+        host=configuration.REDIS.HOST,
+        port=configuration.REDIS.PORT,
+        password=configuration.REDIS.PASS,
+        db=1,
+        decode_responses=True,
+    )
+    await client.flushdb()
+    yield client
+    await client.flushdb()
+    await client.aclose()
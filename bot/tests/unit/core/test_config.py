@@ -11,4 +11,6 @@ class TestConfiguration:
         assert configuration.REDIS.PASS == "redis"
         assert configuration.REDIS.PORT == 6379
         assert configuration.REDIS.HOST=="localhost"
+        assert configuration.DEFAULT_TIMEZONE == "UTC"
+        assert configuration.REMINDER_MINUTES == 30
 
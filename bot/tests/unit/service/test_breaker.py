@@ -0,0 +1,40 @@
+"""Unit tests for circuit breaker."""
+
+from src.service import CircuitBreaker, CircuitState
+
+
+class TestCircuitBreaker:
+    def test_should_open_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+
+    def test_should_allow_a_single_trial_after_timeout(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        breaker.reset_timeout = 60
+        breaker._opened_at -= 60
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_should_open_again_if_trial_fails(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        breaker._opened_at -= 60
+
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
@@ -0,0 +1,125 @@
+"""Unit tests for event cache."""
+
+from datetime import date, time, timedelta
+
+from src.model import EventModel
+from src.service import CountWindow, EventCache, EventWindow
+
+TODAY = date.today()
+
+
+def make_event(id: int, event_date: date = TODAY, hour: int = 9) -> EventModel:
+    return EventModel(
+        id=id, userId="1", date=event_date, time=time(hour), description=f"e{id}"
+    )
+
+
+def make_window(*events: EventModel) -> EventWindow:
+    grouped: dict[date, list[EventModel]] = {}
+    for event in events:
+        grouped.setdefault(event.date, []).append(event)
+    return EventWindow(
+        start_date=TODAY, end_date=TODAY + timedelta(days=7), events=grouped
+    )
+
+
+class TestEventCache:
+    async def test_should_expire_windows(self):
+        cache = EventCache(ttl=0)
+        await cache.set(1, make_window(make_event(1)))
+
+        assert await cache.get(1) is None
+
+    async def test_should_keep_expired_windows_for_stale_reads(self):
+        cache = EventCache(ttl=0)
+        await cache.set(1, make_window(make_event(1)))
+
+        assert await cache.get(1, stale=True) == make_window(make_event(1))
+
+    async def test_should_drop_windows_after_stale_ttl(self):
+        cache = EventCache(ttl=0, stale_ttl=0)
+        await cache.set(1, make_window(make_event(1)))
+
+        assert await cache.get(1, stale=True) is None
+
+    async def test_should_drop_least_recently_used_window(self):
+        cache = EventCache(maxsize=2)
+        for telegram_id in (1, 2):
+            await cache.set(telegram_id, make_window(make_event(telegram_id)))
+        await cache.get(1)
+        await cache.set(3, make_window(make_event(3)))
+
+        assert await cache.get(1) is not None
+        assert await cache.get(2) is None
+
+    async def test_should_add_event_in_window(self):
+        cache = EventCache()
+        await cache.set(1, make_window(make_event(1, hour=8), make_event(2, hour=10)))
+
+        await cache.add(make_event(3, hour=9))
+        await cache.add(make_event(4, event_date=TODAY + timedelta(days=30)))
+
+        window = await cache.get(1)
+        assert [event.id for event in window.events[TODAY]] == [1, 3, 2]
+        assert list(window.events) == [TODAY]
+
+    async def test_should_add_event_in_counts(self):
+        cache = EventCache()
+        await cache.set_counts(
+            1,
+            CountWindow(
+                start_date=TODAY, end_date=TODAY + timedelta(days=7), counts={TODAY: 2}
+            ),
+        )
+
+        await cache.add(make_event(1, event_date=TODAY + timedelta(days=1)))
+        await cache.add(make_event(2))
+        await cache.add(make_event(3, event_date=TODAY + timedelta(days=30)))
+
+        window = await cache.get_counts(1)
+        assert window.counts == {TODAY: 3, TODAY + timedelta(days=1): 1}
+        assert list(window.counts) == [TODAY, TODAY + timedelta(days=1)]
+
+    async def test_should_invalidate_counts(self):
+        cache = EventCache()
+        await cache.set(1, make_window(make_event(1)))
+        await cache.set_counts(
+            1, CountWindow(start_date=TODAY, end_date=TODAY, counts={TODAY: 1})
+        )
+
+        await cache.invalidate(1)
+
+        assert await cache.get(1) is None
+        assert await cache.get_counts(1) is None
+
+    async def test_should_share_windows_in_redis(self, redis):
+        await EventCache(redis=redis).set(1, make_window(make_event(1)))
+
+        window = await EventCache(redis=redis).get(1)
+
+        assert window == make_window(make_event(1))
+        assert 60_000 < await redis.pttl("events:1") <= 86_400_000
+
+    async def test_should_keep_expired_windows_in_redis(self, redis):
+        await EventCache(ttl=0, redis=redis).set(1, make_window(make_event(1)))
+
+        cache = EventCache(ttl=0, redis=redis)
+        assert await cache.get(1) is None
+        assert await cache.get(1, stale=True) == make_window(make_event(1))
+
+    async def test_should_not_keep_local_copies_with_redis(self, redis):
+        first, second = EventCache(redis=redis), EventCache(redis=redis)
+        await first.set(1, make_window(make_event(1)))
+        assert await second.get(1) == make_window(make_event(1))
+
+        await first.set(1, make_window(make_event(1), make_event(2)))
+        assert await second.get(1) == make_window(make_event(1), make_event(2))
+
+        await first.set_counts(
+            1, CountWindow(start_date=TODAY, end_date=TODAY, counts={TODAY: 2})
+        )
+        assert (await second.get_counts(1)).counts == {TODAY: 2}
+
+        await first.add(make_event(3))
+        assert await second.get(1) is None
+        assert await second.get_counts(1) is None
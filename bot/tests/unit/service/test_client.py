@@ -0,0 +1,157 @@
+"""Unit tests for api client."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.core import CircuitOpenException, HttpException
+from src.service import ApiClient, CircuitBreaker, CircuitState
+from src.service.utils import HTTPMethods
+
+
+async def echo(request: web.Request) -> web.Response:
+    return web.json_response(
+        {
+            "port": request.transport.get_extra_info("peername")[1],
+            "authorization": request.headers.get("Authorization"),
+        }
+    )
+
+
+async def cached(request: web.Request) -> web.Response:
+    if request.headers.get("If-None-Match") == '"tag"':
+        return web.Response(status=304)
+    return web.json_response({"calls": 1}, headers={"ETag": '"tag"'})
+
+
+async def created(request: web.Request) -> web.Response:
+    return web.json_response(await request.read() != b"", status=201)
+
+
+async def failed(request: web.Request) -> web.Response:
+    return web.json_response({"detail": "Bad request"}, status=400)
+
+
+def make_flaky():
+    calls = 0
+
+    async def flaky(request: web.Request) -> web.Response:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            return web.json_response({"detail": "Restarting"}, status=503)
+        return web.json_response({"calls": calls})
+
+    return flaky
+
+
+def make_erroring():
+    calls = 0
+
+    async def erroring(request: web.Request) -> web.Response:
+        nonlocal calls
+        calls += 1
+        if calls < 2:
+            return web.json_response({"detail": "Error"}, status=500)
+        return web.json_response({"calls": calls})
+
+    return erroring
+
+
+async def not_implemented(request: web.Request) -> web.Response:
+    return web.json_response({"detail": "Not implemented"}, status=501)
+
+
+async def down(request: web.Request) -> web.Response:
+    return web.json_response({"detail": "Down"}, status=503, headers={"Retry-After": "0"})
+
+
+@pytest.fixture
+async def client():
+    app = web.Application()
+    app.router.add_get("/echo", echo)
+    app.router.add_get("/cached", cached)
+    app.router.add_post("/created", created)
+    app.router.add_get("/failed", failed)
+    flaky = make_flaky()
+    app.router.add_get("/flaky", flaky)
+    app.router.add_post("/flaky", flaky)
+    app.router.add_get("/down", down)
+    app.router.add_get("/error", make_erroring())
+    app.router.add_get("/not-implemented", not_implemented)
+    server = TestServer(app)
+    await server.start_server()
+    api_client = ApiClient(
+        base_url=str(server.make_url("/")),
+        user="user",
+        password="pass",
+        backoff=0.001,
+        breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60),
+    )
+    yield api_client
+    await api_client.close()
+    await server.close()
+
+
+class TestApiClient:
+    async def test_should_reuse_connections(self, client):
+        first = await client.request("echo")
+        second = await client.request("echo")
+
+        assert first["port"] == second["port"]
+        assert first["authorization"] == "Basic dXNlcjpwYXNz"
+
+    async def test_should_reopen_session_after_close(self, client):
+        await client.request("echo")
+        await client.close()
+
+        assert (await client.request("echo"))["authorization"] is not None
+
+    async def test_should_return_remembered_body_if_not_modified(self, client):
+        assert await client.request("cached") == {"calls": 1}
+        assert await client.request("cached") == {"calls": 1}
+
+    async def test_should_send_body(self, client):
+        assert await client.request("created", method=HTTPMethods.POST, body={"a": 1})
+
+    async def test_should_throw_http_exception_if_request_fails(self, client):
+        with pytest.raises(HttpException):
+            await client.request("failed")
+
+    async def test_should_retry_idempotent_requests(self, client):
+        assert await client.request("flaky") == {"calls": 3}
+        assert client.breaker.state == CircuitState.CLOSED
+
+    async def test_should_not_retry_other_requests(self, client):
+        with pytest.raises(HttpException):
+            await client.request("flaky", method=HTTPMethods.POST, body={"a": 1})
+
+    async def test_should_fail_fast_while_circuit_is_open(self, client):
+        with pytest.raises(HttpException):
+            await client.request("down")
+        assert client.breaker.state == CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenException):
+            await client.request("echo")
+
+    async def test_should_retry_internal_server_errors(self, client):
+        assert await client.request("error") == {"calls": 2}
+        assert client.breaker.state == CircuitState.CLOSED
+
+    async def test_should_count_server_errors_as_failures(self, client):
+        for _ in range(3):
+            with pytest.raises(HttpException):
+                await client.request("not-implemented")
+
+        assert client.breaker.state == CircuitState.OPEN
+
+    async def test_should_close_circuit_on_client_errors(self, client):
+        for _ in range(2):
+            with pytest.raises(HttpException):
+                await client.request("not-implemented")
+        with pytest.raises(HttpException):
+            await client.request("failed")
+        with pytest.raises(HttpException):
+            await client.request("not-implemented")
+
+        assert client.breaker.state == CircuitState.CLOSED
@@ -0,0 +1,124 @@
+"""Unit tests for digest service."""
+
+from datetime import date, time
+
+from src.core import CircuitOpenException
+from src.model import EventModel
+from src.service import DigestService, EventService, TimezoneService, render_digest
+from src.service.digest import DIGEST_TTL
+
+EVENT_DATE = date(2025, 1, 1)
+
+
+def make_event(id: int, user_id: str) -> EventModel:
+    return EventModel(
+        id=id, userId=user_id, date=EVENT_DATE, time=time(9, id), description=f"e{id}"
+    )
+
+
+class FakeEventService(EventService):
+    """Event service which serves the events from memory."""
+
+    def __init__(self, events: list[EventModel]):
+        self.events = events
+
+    async def get_all_events_of_date(self, event_date, after_id=None):
+        result: dict[str, list[EventModel]] = {}
+        for event in self.events:
+            if after_id is None or event.id > after_id:
+                result.setdefault(event.userId, []).append(event)
+        return result
+
+    async def get_events_between(self, telegram_id, start_date, end_date):
+        return {
+            EVENT_DATE: [e for e in self.events if e.userId == str(telegram_id)]
+        }
+
+
+def make_service(event_service, redis) -> DigestService:
+    return DigestService(event_service, TimezoneService(redis), redis)
+
+
+class TestDigestService:
+    async def test_should_render_every_digest_without_snapshot(self, redis):
+        events = [make_event(1, "1"), make_event(2, "2")]
+        service = make_service(FakeEventService(events), redis)
+
+        digests = await service.get_digests(EVENT_DATE)
+
+        assert digests == {
+            "1": render_digest(EVENT_DATE, [events[0]]),
+            "2": render_digest(EVENT_DATE, [events[1]]),
+        }
+
+
+    async def test_should_correct_snapshot_with_created_events(self, redis):
+        events = [make_event(1, "1"), make_event(2, "2")]
+        event_service = FakeEventService(events)
+        service = make_service(event_service, redis)
+
+        assert await service.prepare(EVENT_DATE) == 2
+        event_service.events = [*events, make_event(3, "2"), make_event(4, "3")]
+        digests = await service.get_digests(EVENT_DATE)
+
+        assert digests == {
+            "1": render_digest(EVENT_DATE, [events[0]]),
+            "2": render_digest(EVENT_DATE, [events[1], event_service.events[2]]),
+            "3": render_digest(EVENT_DATE, [event_service.events[3]]),
+        }
+
+
+    async def test_should_serve_snapshot_without_rendering(self, redis):
+        service = make_service(FakeEventService([make_event(1, "1")]), redis)
+        await service.prepare(EVENT_DATE)
+        await redis.hset(f"digest:{EVENT_DATE}", "1", "stored")
+
+        assert await service.get_digests(EVENT_DATE) == {"1": "stored"}
+
+
+    async def test_should_serve_snapshot_if_api_is_unavailable(self, redis):
+        event_service = FakeEventService([make_event(1, "1")])
+        service = make_service(event_service, redis)
+        await service.prepare(EVENT_DATE)
+
+        async def unavailable(*args, **kwargs):
+            raise CircuitOpenException("Api is unavailable!")
+
+        event_service.get_all_events_of_date = unavailable
+
+        assert list(await service.get_digests(EVENT_DATE)) == ["1"]
+
+    async def test_should_get_digests_of_the_wave_timezones(self, redis):
+        events = [make_event(1, "1"), make_event(2, "2"), make_event(3, "3")]
+        service = make_service(FakeEventService(events), redis)
+        await service.timezone_service.set_timezone(1, "Europe/Istanbul")
+        await service.timezone_service.set_timezone(2, "Asia/Tokyo")
+        await service.prepare(EVENT_DATE)
+
+        istanbul = await service.get_wave_digests(EVENT_DATE, {"Europe/Istanbul"})
+        default = await service.get_wave_digests(EVENT_DATE, {"UTC"})
+
+        assert list(istanbul) == ["1"]
+        assert list(default) == ["3"]
+
+    async def test_should_claim_timezones_once_per_date(self, redis):
+        service = make_service(FakeEventService([]), redis)
+
+        first = await service.claim_timezones(EVENT_DATE, {"UTC", "Asia/Tokyo"})
+        second = await service.claim_timezones(
+            EVENT_DATE, {"UTC", "Asia/Tokyo", "Europe/Istanbul"}
+        )
+        next_day = await service.claim_timezones(date(2025, 1, 2), {"UTC"})
+
+        assert first == {"UTC", "Asia/Tokyo"}
+        assert second == {"Europe/Istanbul"}
+        assert next_day == {"UTC"}
+        assert 0 < await redis.ttl("digest:2025-01-01:sent") <= DIGEST_TTL
+
+
+class TestRenderDigest:
+    def test_should_render_events(self):
+        text = render_digest(EVENT_DATE, [make_event(1, "1")])
+
+        assert "<b>2025-01-01</b> – 1 event 📅" in text
+        assert "  • e1  ⏰ 09:01:00" in text
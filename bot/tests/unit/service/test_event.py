@@ -0,0 +1,265 @@
+"""Unit tests for event service."""
+
+import asyncio
+from datetime import UTC, date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.core import CircuitOpenException, HttpException
+from src.model import EventModel
+from src.service import (
+    ApiClient,
+    CircuitBreaker,
+    EventCache,
+    EventService,
+    ReminderService,
+    TimezoneService,
+)
+
+TODAY = date.today()
+
+
+def make_event(id: int, user_id: str = "1", hour: int = 9) -> EventModel:
+    return EventModel(
+        id=id, userId=user_id, date=TODAY, time=time(hour), description=f"e{id}"
+    )
+
+
+@pytest.fixture
+async def api():
+    calls: list[tuple[str, dict[str, str]]] = []
+    responses: dict[str, web.Response] = {}
+    failing: set[str] = set()
+
+    async def grouped(request: web.Request) -> web.Response:
+        calls.append((request.path, dict(request.query)))
+        await asyncio.sleep(0.01)
+        if request.path in failing:
+            return web.json_response({"message": "error"}, status=501)
+        if request.query["by"] == "userId":
+            return web.json_response(
+                {"1": [make_event(1).model_dump(mode="json")]}
+                if "after_id" not in request.query
+                else {"2": [make_event(2, user_id="2").model_dump(mode="json")]}
+            )
+        return web.json_response({str(TODAY): [make_event(1).model_dump(mode="json")]})
+
+    async def summary(request: web.Request) -> web.Response:
+        calls.append((request.path, dict(request.query)))
+        if request.path in failing:
+            return web.json_response({"message": "error"}, status=501)
+        return web.json_response([{"date": str(TODAY), "count": 3}])
+
+    async def create(request: web.Request) -> web.Response:
+        calls.append((request.path, {}))
+        return responses.get(
+            "create", web.json_response({"message": "ok", "id": 2}, status=201)
+        )
+
+    app = web.Application()
+    app.router.add_get("/event/grouped", grouped)
+    app.router.add_get("/event/summary", summary)
+    app.router.add_post("/event/", create)
+    server = TestServer(app)
+    await server.start_server()
+    server.calls = calls
+    server.responses = responses
+    server.failing = failing
+    yield server
+    await server.close()
+
+
+def make_service(api: TestServer, cache: EventCache | None = None) -> EventService:
+    return EventService(
+        client=ApiClient(
+            base_url=str(api.make_url("/")),
+            user="user",
+            password="pass",
+            breaker=CircuitBreaker(failure_threshold=1),
+        ),
+        cache=cache,
+    )
+
+
+@pytest.fixture
+async def event_service(api):
+    service = make_service(api, cache=EventCache())
+    yield service
+    await service.close()
+
+
+@pytest.fixture
+async def uncached_service(api):
+    service = make_service(api)
+    yield service
+    await service.close()
+
+
+def paths(api: TestServer) -> list[str]:
+    return [path for path, _ in api.calls]
+
+
+class TestEventServiceCache:
+    async def test_should_answer_repeated_views_from_cache(self, api, event_service):
+        events = await event_service.get_events_of_user_date(1, TODAY, 7)
+        assert await event_service.get_event_counts_by_user(1, 7) == {TODAY: 1}
+        assert await event_service.get_event_counts_by_user(1, 7) == {TODAY: 1}
+
+        assert [event.id for event in events] == [1]
+        assert paths(api) == ["/event/grouped"]
+
+    async def test_should_count_from_summary_if_events_are_not_cached(
+        self, api, event_service
+    ):
+        assert await event_service.get_event_counts_by_user(1, 7) == {TODAY: 3}
+        assert await event_service.get_event_counts_by_user(1, 7) == {TODAY: 3}
+        assert paths(api) == ["/event/summary"]
+
+    async def test_should_write_created_event_through_counts(self, api, event_service):
+        await event_service.get_event_counts_by_user(1, 7)
+        await event_service.create_new_event(1, TODAY, time(10), "e2")
+
+        assert await event_service.get_event_counts_by_user(1, 7) == {TODAY: 4}
+        assert paths(api) == ["/event/summary", "/event/"]
+
+    async def test_should_write_created_event_through(self, api, event_service):
+        await event_service.get_events_by_user(1, 7)
+        await event_service.create_new_event(1, TODAY, time(10), "e2")
+
+        events = await event_service.get_events_by_user(1, 7)
+
+        assert [event.id for event in events[TODAY]] == [1, 2]
+        assert paths(api) == ["/event/grouped", "/event/"]
+
+    async def test_should_invalidate_if_created_event_has_no_id(
+        self, api, event_service
+    ):
+        api.responses["create"] = web.json_response({"message": "ok"}, status=201)
+        await event_service.get_events_by_user(1, 7)
+        await event_service.create_new_event(1, TODAY, time(10), "e2")
+
+        await event_service.get_events_by_user(1, 7)
+
+        assert paths(api) == ["/event/grouped", "/event/", "/event/grouped"]
+
+    async def test_should_fetch_dates_out_of_window(self, api, event_service):
+        event_date = TODAY + timedelta(days=30)
+
+        assert await event_service.get_events_of_user_date(1, event_date, 7) == []
+        [(_, params)] = api.calls
+        assert params["start_date"] == params["end_date"] == str(event_date)
+
+
+class TestEventServiceStale:
+    @pytest.fixture
+    async def stale_service(self, api):
+        service = make_service(api, cache=EventCache(ttl=0))
+        await service.get_events_by_user(1, 7)
+        api.failing.update({"/event/grouped", "/event/summary"})
+        with pytest.raises(HttpException):
+            await service.get_events_by_user(1, 7)
+        yield service
+        await service.close()
+
+    async def test_should_serve_stale_events_while_circuit_is_open(
+        self, api, stale_service
+    ):
+        assert not stale_service.api_available
+
+        events = await stale_service.get_events_of_user_date(1, TODAY, 7)
+        counts = await stale_service.get_event_counts_by_user(1, 7)
+
+        assert [event.id for event in events] == [1]
+        assert counts == {TODAY: 1}
+        assert paths(api) == ["/event/grouped", "/event/grouped"]
+
+    async def test_should_serve_stale_counts_while_circuit_is_open(self, api):
+        service = make_service(api, cache=EventCache(ttl=0))
+        await service.get_event_counts_by_user(2, 7)
+        api.failing.add("/event/summary")
+        with pytest.raises(HttpException):
+            await service.get_event_counts_by_user(2, 7)
+
+        assert await service.get_event_counts_by_user(2, 7) == {TODAY: 3}
+        assert paths(api) == ["/event/summary", "/event/summary"]
+        await service.close()
+
+    async def test_should_raise_if_nothing_is_cached(self, api, stale_service):
+        with pytest.raises(CircuitOpenException):
+            await stale_service.get_events_by_user(2, 7)
+        with pytest.raises(CircuitOpenException):
+            await stale_service.get_event_counts_by_user(1, 30)
+
+    async def test_should_not_serve_stale_events_while_api_is_available(
+        self, api, event_service
+    ):
+        event_service.cache.ttl = 0
+        await event_service.get_events_by_user(1, 7)
+        await event_service.get_events_by_user(1, 7)
+
+        assert event_service.api_available
+        assert paths(api) == ["/event/grouped", "/event/grouped"]
+
+
+class TestEventService:
+    async def test_should_count_from_summary(self, api, uncached_service):
+        counts = await uncached_service.get_event_counts_by_user(1, 7)
+
+        assert counts == {TODAY: 3}
+        [(path, params)] = api.calls
+        assert path == "/event/summary"
+        assert params == {
+            "userIds": "1",
+            "start_date": str(TODAY),
+            "end_date": str(TODAY + timedelta(days=7)),
+        }
+
+    async def test_should_not_cache_events(self, api, uncached_service):
+        await uncached_service.get_events_by_user(1, 7)
+        await uncached_service.get_events_by_user(1, 7)
+
+        assert paths(api) == ["/event/grouped", "/event/grouped"]
+
+    async def test_should_create_event(self, api, uncached_service):
+        await uncached_service.create_new_event(1, TODAY, time(10), "e2")
+
+        assert paths(api) == ["/event/"]
+
+    async def test_should_schedule_reminder_of_created_event(self, api, redis):
+        reminders = ReminderService(redis, lead=timedelta(minutes=30))
+        timezones = TimezoneService(redis)
+        await timezones.set_timezone(1, "Asia/Tokyo")
+        service = make_service(api)
+        service.reminder_service, service.timezone_service = reminders, timezones
+        event_date = datetime.now(UTC).date() + timedelta(days=2)
+
+        await service.create_new_event(1, event_date, time(10), "e2")
+
+        [reminder] = await reminders.pop_due(
+            now=datetime.combine(event_date, time(9, 30), ZoneInfo("Asia/Tokyo"))
+        )
+        assert (reminder.telegram_id, reminder.description) == (1, "e2")
+        assert await reminders.pop_due(now=datetime.now(UTC)) == []
+        await service.client.close()
+
+    async def test_should_get_all_events_of_date_after_id(self, api, uncached_service):
+        first = await uncached_service.get_all_events_of_date(TODAY)
+        second = await uncached_service.get_all_events_of_date(TODAY, after_id=1)
+
+        assert [event.id for event in first["1"]] == [1]
+        assert [event.id for event in second["2"]] == [2]
+        assert "after_id" not in api.calls[0][1]
+        assert api.calls[1][1]["after_id"] == "1"
+
+    async def test_should_share_concurrent_fetches_of_date(self, api, uncached_service):
+        first, second = await asyncio.gather(
+            uncached_service.get_all_events_of_date(TODAY),
+            uncached_service.get_all_events_of_date(TODAY),
+        )
+
+        assert first == second
+        assert first["1"][0] is not second["1"][0]
+        assert len(api.calls) == 1
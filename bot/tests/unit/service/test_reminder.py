@@ -0,0 +1,79 @@
+"""Unit tests for reminder service."""
+
+from datetime import UTC, date, datetime, time, timedelta
+
+import pytest
+
+from src.service import ReminderService, render_reminder
+
+NOW = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def reminder_service(redis) -> ReminderService:
+    return ReminderService(redis, lead=timedelta(minutes=30))
+
+
+class TestReminderService:
+    async def test_should_schedule_before_the_event_in_user_timezone(self, reminder_service, redis):
+        scheduled = await reminder_service.schedule(
+            1, date(2025, 1, 1), time(15, 0), "meeting", "Europe/Istanbul", now=NOW
+        )
+
+        assert scheduled is True
+        [(_, score)] = await redis.zrange(reminder_service.key, 0, -1, withscores=True)
+        assert score == datetime(2025, 1, 1, 11, 30, tzinfo=UTC).timestamp()
+
+
+    async def test_should_not_schedule_past_events(self, reminder_service, redis):
+        scheduled = await reminder_service.schedule(
+            1, date(2025, 1, 1), time(8, 0), "meeting", "UTC", now=NOW
+        )
+
+        assert scheduled is False
+        assert await redis.zcard(reminder_service.key) == 0
+
+
+    async def test_should_pop_only_due_reminders_in_batches(self, reminder_service):
+        for event_time in (time(9, 40), time(9, 45), time(10, 30)):
+            await reminder_service.schedule(
+                1, date(2025, 1, 1), event_time, f"{event_time}", "UTC", now=NOW
+            )
+        tick = NOW + timedelta(minutes=15)
+
+        first = await reminder_service.pop_due(limit=1, now=tick)
+        second = await reminder_service.pop_due(limit=10, now=tick)
+        third = await reminder_service.pop_due(limit=10, now=tick)
+
+        assert [reminder.description for reminder in first] == ["09:40:00"]
+        assert [reminder.description for reminder in second] == ["09:45:00"]
+        assert third == []
+        assert len(await reminder_service.pop_due(now=NOW + timedelta(hours=1))) == 1
+
+
+    async def test_should_reschedule_until_attempts_run_out(self, reminder_service):
+        await reminder_service.schedule(
+            1, date(2025, 1, 1), time(9, 10), "meeting", "UTC", now=NOW
+        )
+        reminders = await reminder_service.pop_due(now=NOW)
+
+        for attempt in (1, 2):
+            assert await reminder_service.reschedule(reminders, now=NOW) == 1
+            assert await reminder_service.pop_due(now=NOW) == []
+            reminders = await reminder_service.pop_due(now=NOW + timedelta(minutes=1))
+            assert [reminder.attempts for reminder in reminders] == [attempt]
+
+        assert await reminder_service.reschedule(reminders, now=NOW) == 0
+        assert await reminder_service.pop_due(now=NOW + timedelta(hours=1)) == []
+
+
+class TestRenderReminder:
+    async def test_should_render_reminder(self, reminder_service):
+        await reminder_service.schedule(
+            1, date(2025, 1, 1), time(9, 10), "meeting", "UTC", now=NOW
+        )
+        [reminder] = await reminder_service.pop_due(now=NOW)
+
+        assert render_reminder(reminder) == (
+            "⏰ <b>Reminder!</b> meeting\n<b>2025-01-01</b> at 09:10:00"
+        )
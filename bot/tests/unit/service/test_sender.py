@@ -0,0 +1,134 @@
+"""Unit tests for message sender."""
+
+from time import monotonic
+
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+)
+from aiogram.methods import SendMessage
+
+from src.service import MessageSender, RedisTokenBucket, TokenBucket
+
+
+class FakeBot:
+    """Bot which records the sent messages and raises the planned errors."""
+
+    def __init__(self, errors: dict[str, list[type | None]] | None = None):
+        self.errors = errors or {}
+        self.sent: list[tuple[str, float]] = []
+
+    async def send_message(self, chat_id, text, parse_mode):
+        method = SendMessage(chat_id=chat_id, text=text)
+        planned = self.errors.get(chat_id, [])
+        error = planned.pop(0) if planned else None
+        if error is TelegramRetryAfter:
+            raise TelegramRetryAfter(method, "Flood control", retry_after=0)
+        if error is not None:
+            raise error(method, "Error")
+        self.sent.append((chat_id, monotonic()))
+
+
+class TestTokenBucket:
+    async def test_should_limit_rate(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+        started_at = monotonic()
+
+        for _ in range(6):
+            await bucket.acquire()
+
+        assert monotonic() - started_at >= 0.045
+
+    async def test_should_wait_while_paused(self):
+        bucket = TokenBucket(rate=1000)
+        await bucket.pause(0.05)
+        started_at = monotonic()
+
+        await bucket.acquire()
+
+        assert monotonic() - started_at >= 0.045
+
+
+class TestRedisTokenBucket:
+    async def test_should_share_rate_between_buckets(self, redis):
+        buckets = [RedisTokenBucket(redis, rate=100, capacity=1) for _ in range(2)]
+        started_at = monotonic()
+
+        for _ in range(3):
+            for bucket in buckets:
+                await bucket.acquire()
+
+        assert monotonic() - started_at >= 0.045
+
+    async def test_should_wait_while_paused(self, redis):
+        bucket = RedisTokenBucket(redis, rate=1000)
+        await RedisTokenBucket(redis, rate=1000).pause(0.05)
+        started_at = monotonic()
+
+        await bucket.acquire()
+
+        assert monotonic() - started_at >= 0.045
+
+
+class TestMessageSender:
+    async def test_should_send_all_and_count_failures(self):
+        bot = FakeBot(
+            errors={
+                "retried": [TelegramRetryAfter],
+                "blocked": [TelegramForbiddenError],
+                "invalid": [TelegramBadRequest],
+            }
+        )
+        sender = MessageSender(bot, rate=1000, chat_interval=0, concurrency=3)
+
+        report = await sender.send_all(
+            [
+                (chat_id, "text")
+                for chat_id in ("a", "b", "retried", "blocked", "invalid")
+            ]
+        )
+
+        assert sorted(chat_id for chat_id, _ in bot.sent) == ["a", "b", "retried"]
+        assert (report.sent, report.blocked, report.failed) == (3, 1, 1)
+        assert report.retried == 1
+        assert report.throughput > 0
+        assert report.unsent == []
+
+    async def test_should_fail_after_retries(self):
+        bot = FakeBot(errors={"a": [TelegramRetryAfter] * 3})
+        sender = MessageSender(bot, rate=1000, chat_interval=0, retries=2)
+
+        report = await sender.send_all([("a", "text")])
+
+        assert (report.sent, report.failed, report.retried) == (0, 1, 2)
+        assert report.unsent == [0]
+
+    async def test_should_report_unsent_messages_by_index(self):
+        bot = FakeBot(errors={"down": [TelegramNetworkError] * 2})
+        sender = MessageSender(bot, rate=1000, chat_interval=0, retries=1, backoff=0)
+
+        report = await sender.send_all([("a", "text"), ("down", "text"), ("b", "text")])
+
+        assert report.sent == 2
+        assert report.unsent == [1]
+
+    async def test_should_space_messages_of_same_chat(self):
+        bot = FakeBot()
+        sender = MessageSender(bot, rate=1000, chat_interval=0.05, concurrency=2)
+
+        await sender.send_all([("a", "first"), ("a", "second")])
+
+        [(_, first), (_, second)] = bot.sent
+        assert second - first >= 0.045
+
+    async def test_should_keep_rate_across_calls(self):
+        bot = FakeBot()
+        sender = MessageSender(bot, rate=20, chat_interval=0)
+        await sender.send_all([(chat_id, "text") for chat_id in range(20)])
+        started_at = monotonic()
+
+        await sender.send_all([(chat_id, "text") for chat_id in range(5)])
+
+        assert monotonic() - started_at >= 0.2
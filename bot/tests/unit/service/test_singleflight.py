@@ -0,0 +1,68 @@
+"""Unit tests for request coalescing."""
+
+import asyncio
+
+import pytest
+
+from src.service import SingleFlight
+
+
+class TestSingleFlight:
+    @pytest.fixture
+    def counter(self):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        return calls, call
+
+    async def test_should_share_concurrent_calls_of_same_key(self, counter):
+        calls, call = counter
+        single_flight = SingleFlight()
+
+        results = await asyncio.gather(
+            single_flight.do((1, "a"), call),
+            single_flight.do((1, "a"), call),
+            single_flight.do((2, "a"), call),
+        )
+
+        assert results[0] == results[1]
+        assert len(calls) == 2
+
+    async def test_should_call_again_after_call_finishes(self, counter):
+        calls, call = counter
+        single_flight = SingleFlight()
+
+        await single_flight.do("key", call)
+        await single_flight.do("key", call)
+
+        assert len(calls) == 2
+
+    async def test_should_not_cancel_call_of_other_callers(self, counter):
+        calls, call = counter
+        single_flight = SingleFlight()
+
+        first = asyncio.create_task(single_flight.do("key", call))
+        second = asyncio.create_task(single_flight.do("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 1
+        assert len(calls) == 1
+
+    async def test_should_raise_error_to_all_callers(self):
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        single_flight = SingleFlight()
+        results = await asyncio.gather(
+            single_flight.do("key", failing),
+            single_flight.do("key", failing),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
@@ -0,0 +1,62 @@
+"""Unit tests for timezone service."""
+
+from datetime import UTC, date, datetime, time
+
+import pytest
+
+from src.core import configuration
+from src.service import TimezoneService, get_due_timezones, is_valid_timezone
+
+
+class TestWaveTimezones:
+    def test_should_group_due_timezones_by_local_date(self):
+        now = datetime(2025, 1, 1, 16, 5, tzinfo=UTC)
+
+        waves = get_due_timezones(
+            now,
+            ["Pacific/Kiritimati", "Pacific/Honolulu", "UTC", "America/New_York"],
+            time(6, 0),
+        )
+
+        assert waves == {
+            date(2025, 1, 2): {"Pacific/Kiritimati"},
+            date(2025, 1, 1): {"Pacific/Honolulu", "UTC", "America/New_York"},
+        }
+
+    def test_should_not_include_timezones_before_send_time(self):
+        now = datetime(2025, 1, 1, 16, 5, tzinfo=UTC)
+
+        waves = get_due_timezones(now, ["America/Los_Angeles"], time(9, 0))
+
+        assert waves == {}
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [("Europe/Istanbul", True), ("UTC", True), ("Mars/Base", False), ("../x", False)],
+    )
+    def test_should_validate_timezone(self, name, expected):
+        assert is_valid_timezone(name) is expected
+
+
+class TestTimezoneService:
+    async def test_should_move_user_between_timezones(self, redis):
+        service = TimezoneService(redis)
+
+        await service.set_timezone(1, "Europe/Istanbul")
+        await service.set_timezone(1, "Asia/Tokyo")
+
+        assert await service.get_timezone(1) == "Asia/Tokyo"
+        assert await service.get_users(["Europe/Istanbul"]) == set()
+        assert await service.get_users(["Asia/Tokyo", "UTC"]) == {"1"}
+
+    async def test_should_use_default_timezone(self, redis):
+        service = TimezoneService(redis)
+        await service.set_timezone(1, "Asia/Tokyo")
+
+        assert await service.get_timezone(2) == configuration.DEFAULT_TIMEZONE
+        assert await service.get_timezones(["1", "2"]) == {"1": "Asia/Tokyo", "2": "UTC"}
+        assert await service.get_used_timezones() == {"Asia/Tokyo", "UTC"}
+
+    async def test_should_reject_invalid_timezone(self, redis):
+        with pytest.raises(ValueError):
+            await TimezoneService(redis).set_timezone(1, "Mars/Base")
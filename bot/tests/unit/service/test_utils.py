@@ -0,0 +1,40 @@
+"""Unit tests for service utils."""
+
+import gzip
+
+import msgpack
+import pytest
+
+from src.service.utils import COMPRESSION_MINIMUM_SIZE, decode_body, encode_body
+
+
+class TestEncodeBody:
+    def test_should_not_compress_small_bodies(self):
+        raw, headers = encode_body({"userId": "1"})
+
+        assert headers == {"Content-Type": "application/msgpack"}
+        assert msgpack.unpackb(raw) == {"userId": "1"}
+
+    def test_should_compress_large_bodies(self):
+        body = {"description": "x" * COMPRESSION_MINIMUM_SIZE}
+        raw, headers = encode_body(body)
+
+        assert headers["Content-Encoding"] == "zstd"
+        assert len(raw) < COMPRESSION_MINIMUM_SIZE
+        assert decode_body(raw, {**headers}) == body
+
+
+class TestDecodeBody:
+    @pytest.mark.parametrize(
+        "raw, headers",
+        [
+            (b'{"id": 1}', {"Content-Type": "application/json"}),
+            (msgpack.packb({"id": 1}), {"Content-Type": "application/msgpack"}),
+            (
+                gzip.compress(msgpack.packb({"id": 1})),
+                {"Content-Type": "application/msgpack", "Content-Encoding": "gzip"},
+            ),
+        ],
+    )
+    def test_should_decode_negotiated_bodies(self, raw, headers):
+        assert decode_body(raw, headers) == {"id": 1}